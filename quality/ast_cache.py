@@ -0,0 +1,81 @@
+"""
+Shared Source/AST Cache
+-----------------------
+Per-process cache of raw file bytes and parsed module ASTs keyed on
+(path, mtime_ns), so evaluators that each walk src/ reuse one read and
+one parse per file instead of re-reading and re-parsing the same
+sources. Entries invalidate themselves when the file's mtime changes;
+stale paths are simply overwritten.
+"""
+
+import ast
+from pathlib import Path
+from typing import Dict, Iterator, Optional, Tuple
+
+from quality.source_scan import walk_py_files
+
+_SOURCES: Dict[str, Tuple[int, bytes]] = {}
+_TREES: Dict[str, Tuple[int, ast.Module]] = {}
+
+
+def get_source(py_file: Path) -> Optional[bytes]:
+    """Return the raw bytes of py_file, or None if it cannot be read.
+
+    The returned bytes are shared between callers — treat them as
+    read-only.
+    """
+    key = str(py_file)
+    try:
+        mtime_ns = py_file.stat().st_mtime_ns
+    except OSError:
+        return None
+
+    hit = _SOURCES.get(key)
+    if hit is not None and hit[0] == mtime_ns:
+        return hit[1]
+
+    try:
+        raw = py_file.read_bytes()
+    except OSError:
+        return None
+
+    _SOURCES[key] = (mtime_ns, raw)
+    return raw
+
+
+def get_tree(py_file: Path) -> Optional[ast.Module]:
+    """Return the parsed AST for py_file, or None if it cannot be parsed.
+
+    The returned tree is shared between callers — treat it as read-only.
+    """
+    key = str(py_file)
+    try:
+        mtime_ns = py_file.stat().st_mtime_ns
+    except OSError:
+        return None
+
+    hit = _TREES.get(key)
+    if hit is not None and hit[0] == mtime_ns:
+        return hit[1]
+
+    raw = get_source(py_file)
+    if raw is None:
+        return None
+    try:
+        tree = compile(raw, key, 'exec', ast.PyCF_ONLY_AST)
+    except (SyntaxError, ValueError):
+        return None
+
+    _TREES[key] = (mtime_ns, tree)
+    return tree
+
+
+def iter_python_asts(project_dir: Path) -> Iterator[Tuple[Path, ast.Module]]:
+    """Yield (path, tree) for every parseable .py under the project's src/."""
+    src_dir = Path(project_dir) / "src"
+    if not src_dir.exists():
+        src_dir = Path(project_dir)
+    for py_file in walk_py_files(src_dir):
+        tree = get_tree(py_file)
+        if tree is not None:
+            yield py_file, tree
@@ -0,0 +1,122 @@
+"""
+Quality Evaluator Result Cache
+------------------------------
+Fingerprint-keyed cache so evaluators can skip re-running expensive tools
+(pytest, coverage, radon, flake8) when the source tree has not changed.
+
+The fingerprint covers every ``*.py`` under ``src/`` plus ``requirements.txt``
+using path, mtime, and size; evaluators whose result depends on the test
+suite request ``include_tests=True`` to also cover ``tests/`` and the pytest
+configuration files. Cached results live as JSON files under
+``.quality_cache/``; delete that directory to invalidate.
+"""
+
+import functools
+import hashlib
+import json
+import os
+import tempfile
+from pathlib import Path
+from typing import Any, Dict, Iterator, Optional
+
+CACHE_DIR_NAME = ".quality_cache"
+
+
+# Files that change how pytest collects and runs the suite
+_PYTEST_CONFIG_FILES = ("pytest.ini", "pyproject.toml", "setup.cfg", "tox.ini")
+
+
+def _iter_tracked_files(project_dir: Path, include_tests: bool = False) -> Iterator[Path]:
+    """Yield the files that participate in the project fingerprint."""
+    from quality import source_scan
+
+    src_dir = project_dir / "src"
+    if src_dir.exists():
+        # sorted so the fingerprint is stable across directory orderings
+        yield from sorted(source_scan.walk_py_files(src_dir))
+
+    if include_tests:
+        tests_dir = project_dir / "tests"
+        if tests_dir.exists():
+            yield from sorted(source_scan.walk_py_files(tests_dir))
+        for config_name in _PYTEST_CONFIG_FILES:
+            config_file = project_dir / config_name
+            if config_file.exists():
+                yield config_file
+
+    requirements_file = project_dir / "requirements.txt"
+    if requirements_file.exists():
+        yield requirements_file
+
+
+def fingerprint(project_dir: Path, include_tests: bool = False) -> str:
+    """Fingerprint of the source tree, memoized so one run stats the tree once.
+
+    Several evaluators call this for the same project within a single
+    orchestrator run; the full-tree stat walk is the dominant cost of a
+    cache check, so it is shared process-wide, keyed on the src/ (and,
+    with include_tests, tests/) directory mtimes as a cheap staleness
+    signal. Evaluators whose cached result depends on the test suite
+    itself must pass include_tests=True.
+    """
+    project_dir = Path(project_dir)
+    try:
+        root_mtime_ns = (project_dir / "src").stat().st_mtime_ns
+        tests_mtime_ns = 0
+        if include_tests:
+            tests_mtime_ns = (project_dir / "tests").stat().st_mtime_ns
+    except OSError:
+        return _compute_fingerprint(project_dir, include_tests)
+    return _fingerprint_memo(str(project_dir), root_mtime_ns, tests_mtime_ns, include_tests)
+
+
+@functools.lru_cache(maxsize=4)
+def _fingerprint_memo(
+    project_dir_str: str, root_mtime_ns: int, tests_mtime_ns: int, include_tests: bool
+) -> str:
+    return _compute_fingerprint(Path(project_dir_str), include_tests)
+
+
+def _compute_fingerprint(project_dir: Path, include_tests: bool = False) -> str:
+    """Compute a fingerprint of the source tree from (path, mtime_ns, size) tuples."""
+    digest = hashlib.blake2b(digest_size=16)
+    for path in _iter_tracked_files(project_dir, include_tests):
+        try:
+            stat = path.stat()
+        except OSError:
+            continue
+        rel_path = path.relative_to(project_dir).as_posix()
+        digest.update(f"{rel_path}:{stat.st_mtime_ns}:{stat.st_size}\n".encode("utf-8"))
+    return digest.hexdigest()
+
+
+def _cache_path(project_dir: Path, evaluator_name: str, fp: str) -> Path:
+    return project_dir / CACHE_DIR_NAME / f"{evaluator_name}-{fp}.json"
+
+
+def load(project_dir: Path, evaluator_name: str, fp: str) -> Optional[Dict[str, Any]]:
+    """Return the cached result payload for this fingerprint, or None on miss."""
+    cache_file = _cache_path(project_dir, evaluator_name, fp)
+    if not cache_file.exists():
+        return None
+    try:
+        return json.loads(cache_file.read_text(encoding="utf-8"))
+    except (OSError, json.JSONDecodeError):
+        return None
+
+
+def store(project_dir: Path, evaluator_name: str, fp: str, payload: Dict[str, Any]) -> None:
+    """Atomically write a result payload for this fingerprint."""
+    cache_file = _cache_path(project_dir, evaluator_name, fp)
+    try:
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=str(cache_file.parent), suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(payload, f, default=str)
+            os.replace(tmp_path, cache_file)
+        except OSError:
+            if os.path.exists(tmp_path):
+                os.unlink(tmp_path)
+    except OSError:
+        pass  # Caching is best-effort; never fail the evaluation
@@ -5,6 +5,7 @@ Defines pass/warning/fail thresholds for each quality characteristic.
 """
 
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Tuple
 
 
@@ -44,25 +45,30 @@ WEIGHTS = {
 }
 
 
+# Pre-flattened (warn, pass) pairs so classification is two comparisons
+# plus a tuple index, with no dataclass attribute lookups per call
+_STATUS_LABELS = ("FAIL", "WARNING", "PASS")
+_STATUS_TABLE = {
+    name: (t.warn_threshold, t.pass_threshold) for name, t in THRESHOLDS.items()
+}
+_OVERALL_PAIR = (OVERALL_THRESHOLDS.warn_threshold, OVERALL_THRESHOLDS.pass_threshold)
+
+
+@lru_cache(maxsize=256)
 def get_status(characteristic: str, score: float) -> str:
-    """Get status (PASS/WARNING/FAIL) for a characteristic score."""
-    threshold = THRESHOLDS.get(characteristic)
-    if not threshold:
+    """Get status (PASS/WARNING/FAIL) for a characteristic score.
+
+    Memoized: callers classify the same (characteristic, score) pairs
+    repeatedly when re-rendering reports.
+    """
+    pair = _STATUS_TABLE.get(characteristic)
+    if pair is None:
         return "UNKNOWN"
-    
-    if score >= threshold.pass_threshold:
-        return "PASS"
-    elif score >= threshold.warn_threshold:
-        return "WARNING"
-    else:
-        return "FAIL"
+    warn, pass_ = pair
+    return _STATUS_LABELS[(score >= warn) + (score >= pass_)]
 
 
 def get_overall_status(score: float) -> str:
     """Get status for overall quality score."""
-    if score >= OVERALL_THRESHOLDS.pass_threshold:
-        return "PASS"
-    elif score >= OVERALL_THRESHOLDS.warn_threshold:
-        return "WARNING"
-    else:
-        return "FAIL"
+    warn, pass_ = _OVERALL_PAIR
+    return _STATUS_LABELS[(score >= warn) + (score >= pass_)]
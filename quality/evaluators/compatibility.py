@@ -8,11 +8,31 @@ Checks: Python version, dependencies, Windows API compatibility
 import subprocess
 import sys
 import platform
+import re
 import importlib.metadata
+from importlib.util import find_spec
 from pathlib import Path
-from dataclasses import dataclass
+from dataclasses import dataclass, asdict
 from typing import Dict, Any, List
 
+try:
+    from quality import cache
+except ImportError:  # Executed as a standalone script from evaluators/
+    sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+    from quality import cache
+
+
+# Splits a requirement line at the first specifier/extras/marker character
+_SPEC_SPLIT_RE = re.compile(r'[<>=!~;\[]')
+
+# PEP 503: runs of -, _ and . are equivalent in distribution names
+_NAME_NORMALIZE_RE = re.compile(r"[-_.]+")
+
+
+def _normalize_name(name: str) -> str:
+    """Normalize a distribution name per PEP 503."""
+    return _NAME_NORMALIZE_RE.sub("-", name).lower()
+
 
 @dataclass
 class CompatibilityResult:
@@ -45,6 +65,16 @@ def check_python_version(project_dir: Path) -> Dict[str, Any]:
     return result
 
 
+def _iter_requirements(path: Path):
+    """Yield requirement lines one at a time, skipping blanks and comments."""
+    with open(path, "rb") as f:
+        for raw_line in f:
+            line = raw_line.strip()
+            if not line or line.startswith(b"#"):
+                continue
+            yield line.decode("utf-8", "replace")
+
+
 def check_dependencies(project_dir: Path) -> Dict[str, Any]:
     """Check if all dependencies are properly installed and compatible."""
     result = {
@@ -61,22 +91,26 @@ def check_dependencies(project_dir: Path) -> Dict[str, Any]:
             result["error"] = "requirements.txt not found"
             return result
         
-        # Parse requirements
-        with open(requirements_file, 'r') as f:
-            requirements = [line.strip() for line in f if line.strip() and not line.startswith('#')]
-        
-        for req in requirements:
-            # Parse package name (handle >=, ==, etc.)
-            pkg_name = req.split('>=')[0].split('==')[0].split('<')[0].split('>')[0].strip()
-            
-            try:
-                version = importlib.metadata.version(pkg_name)
+        # One scan over installed distributions instead of a sys.path walk per lookup
+        installed_map = {}
+        for dist in importlib.metadata.distributions():
+            name = _normalize_name(dist.metadata["Name"] or "")
+            if name:
+                installed_map[name] = dist.version
+
+        # Stream requirement lines straight into the lookup; no intermediate list
+        for req in _iter_requirements(requirements_file):
+            # Parse package name (handle >=, ==, extras, markers, etc.) in one pass
+            pkg_name = _SPEC_SPLIT_RE.split(req, 1)[0].strip()
+
+            version = installed_map.get(_normalize_name(pkg_name))
+            if version is not None:
                 result["installed"].append({
                     "name": pkg_name,
                     "version": version,
                     "required": req,
                 })
-            except importlib.metadata.PackageNotFoundError:
+            else:
                 result["missing"].append(pkg_name)
                 result["all_installed"] = False
         
@@ -111,10 +145,15 @@ def check_platform_compatibility(project_dir: Path) -> Dict[str, Any]:
         ]
         
         for mod in windows_modules:
+            # find_spec checks availability without running module init
+            # (no DLL loads), unlike an actual __import__
             try:
-                __import__(mod)
+                available = find_spec(mod) is not None
+            except (ImportError, ValueError):
+                available = False
+            if available:
                 result["windows_apis_available"].append(mod)
-            except ImportError:
+            else:
                 result["windows_apis_missing"].append(mod)
         
     except Exception as e:
@@ -132,6 +171,11 @@ def evaluate(project_dir: Path) -> CompatibilityResult:
     - All dependencies installed: 40 points
     - Platform compatibility: 30 points
     """
+    fp = cache.fingerprint(project_dir)
+    cached = cache.load(project_dir, "compatibility", fp)
+    if cached is not None:
+        return CompatibilityResult(**cached)
+
     # Run checks
     python_result = check_python_version(project_dir)
     deps_result = check_dependencies(project_dir)
@@ -158,7 +202,7 @@ def evaluate(project_dir: Path) -> CompatibilityResult:
     if deps_result.get("version_conflicts"):
         issues.extend(deps_result["version_conflicts"])
     
-    return CompatibilityResult(
+    result = CompatibilityResult(
         python_compatible=python_result.get("compatible", False),
         dependencies_resolved=deps_result.get("all_installed", False),
         platform_compatible=platform_result.get("compatible", False),
@@ -170,6 +214,8 @@ def evaluate(project_dir: Path) -> CompatibilityResult:
             "platform": platform_result,
         }
     )
+    cache.store(project_dir, "compatibility", fp, asdict(result))
+    return result
 
 
 if __name__ == "__main__":
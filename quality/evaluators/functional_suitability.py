@@ -9,17 +9,39 @@ import subprocess
 import json
 import sys
 import os
-import re
+import threading
 from pathlib import Path
-from dataclasses import dataclass
+from dataclasses import dataclass, asdict
 from typing import Dict, Any
 
+import coverage
+import pytest
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    from quality import cache
+except ImportError:  # Executed as a standalone script from evaluators/
+    sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+    from quality import cache
+
 
 FUNCTIONAL_TEST_PATHS_ENV = "CLEANBOX_FUNCTIONAL_TEST_PATHS"
 FUNCTIONAL_INCLUDE_E2E_ENV = "CLEANBOX_FUNCTIONAL_INCLUDE_E2E"
 TRUTHY_VALUES = {"1", "true", "yes", "on"}
 DEFAULT_FULL_TEST_TARGETS = ("tests",)
 DEFAULT_PARTIAL_TEST_TARGETS = ("tests/unit", "tests/ui", "tests/component", "tests/integration")
+PYTEST_TIMEOUT_SECONDS = 300
+
+
+def _loads_json(raw: bytes) -> Any:
+    """Parse JSON bytes, preferring orjson when installed."""
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
 
 
 @dataclass
@@ -89,8 +111,77 @@ def resolve_test_scope(project_dir: Path) -> Dict[str, Any]:
     }
 
 
+class _OutcomeCollector:
+    """Pytest plugin that records exact test outcomes in-process."""
+
+    def __init__(self):
+        self.passed = 0
+        self.failed = 0
+        self.skipped = 0
+
+    def pytest_runtest_logreport(self, report):
+        if report.when == "call":
+            if report.passed:
+                self.passed += 1
+            elif report.failed:
+                self.failed += 1
+            elif report.skipped:
+                self.skipped += 1
+        elif report.skipped:
+            # Skip markers are reported during setup, not call
+            self.skipped += 1
+        elif report.failed:
+            # Setup/teardown errors count as failures
+            self.failed += 1
+
+
+def _run_suite_inprocess(project_dir: Path, target_args, measure_coverage: bool = False) -> Dict[str, Any]:
+    """Run pytest once in-process, optionally under coverage measurement.
+
+    The worker never touches the process cwd: evaluators run
+    concurrently and other threads resolve relative paths against it.
+    Targets are already absolute, pytest gets an explicit --rootdir, and
+    coverage writes to an absolute data file. On timeout the daemon
+    thread keeps executing the suite in-process until it finishes on its
+    own; the orchestrator just stops waiting for its results.
+    """
+    project_dir = Path(project_dir).resolve()
+    collector = _OutcomeCollector()
+    holder: Dict[str, Any] = {"collector": collector}
+
+    def _invoke():
+        cov = None
+        if measure_coverage:
+            cov = coverage.Coverage(
+                source=[str(project_dir / "src")],
+                data_file=str(project_dir / ".coverage"),
+            )
+            holder["cov"] = cov
+            cov.start()
+        try:
+            holder["exit_code"] = pytest.main(
+                [
+                    *target_args,
+                    "--rootdir", str(project_dir),
+                    "-q",
+                    "--no-header",
+                    "-p", "no:cacheprovider",
+                ],
+                plugins=[collector],
+            )
+        finally:
+            if cov is not None:
+                cov.stop()
+
+    runner = threading.Thread(target=_invoke, daemon=True)
+    runner.start()
+    runner.join(PYTEST_TIMEOUT_SECONDS)
+    holder["timed_out"] = runner.is_alive()
+    return holder
+
+
 def run_pytest(project_dir: Path) -> Dict[str, Any]:
-    """Run pytest and collect results."""
+    """Run pytest in-process and collect exact results."""
     test_scope = resolve_test_scope(project_dir)
     result = {
         "passed": 0,
@@ -115,78 +206,37 @@ def run_pytest(project_dir: Path) -> Dict[str, Any]:
             )
             return result
 
-        cmd = [
-            sys.executable,
-            "-m",
-            "pytest",
-            *target_args,
-            "-v",
-            "--tb=short",
-            "--no-header",
-        ]
-
-        proc = subprocess.run(
-            cmd,
-            capture_output=True,
-            text=True,
-            cwd=str(project_dir),
-            timeout=300,  # 5 minute timeout
-        )
-
-        # Parse output for test counts
-        output = proc.stdout + proc.stderr
-
-        # Look for summary line: "X passed, Y failed, Z skipped"
-        summary_match = re.search(
-            r'(\d+)\s+passed(?:,\s*(\d+)\s+failed)?(?:,\s*(\d+)\s+(?:skipped|warning))?',
-            output
-        )
+        holder = _run_suite_inprocess(project_dir, target_args)
+        if holder["timed_out"]:
+            result["error"] = "Pytest timed out after 5 minutes"
+            return result
 
-        if summary_match:
-            result["passed"] = int(summary_match.group(1) or 0)
-            result["failed"] = int(summary_match.group(2) or 0)
-            result["skipped"] = int(summary_match.group(3) or 0)
-        else:
-            # Alternative pattern - look for summary line
-            passed_match = re.search(r'(\d+)\s+passed', output)
-            failed_match = re.search(r'(\d+)\s+failed', output)
-            skipped_match = re.search(r'(\d+)\s+skipped', output)
-            
-            if passed_match or failed_match:
-                result["passed"] = int(passed_match.group(1)) if passed_match else 0
-                result["failed"] = int(failed_match.group(1)) if failed_match else 0
-                result["skipped"] = int(skipped_match.group(1)) if skipped_match else 0
-            else:
-                # Fallback: count PASSED/FAILED occurrences in verbose output
-                # This handles cases where pytest crashes before printing summary
-                passed_count = len(re.findall(r'\bPASSED\b', output))
-                failed_count = len(re.findall(r'\bFAILED\b', output))
-                skipped_count = len(re.findall(r'\bSKIPPED\b', output))
-                
-                result["passed"] = passed_count
-                result["failed"] = failed_count
-                result["skipped"] = skipped_count
-
-        result["total"] = result["passed"] + result["failed"] + result["skipped"]
-
-        if result["total"] > 0:
-            # Only count passed vs passed+failed (exclude skipped)
-            executable = result["passed"] + result["failed"]
-            if executable > 0:
-                result["pass_rate"] = (result["passed"] / executable) * 100
-            else:
-                result["pass_rate"] = 100.0
-
-        result["output"] = output[:2000]  # Truncate output
+        _fill_pytest_counts(result, holder)
 
-    except subprocess.TimeoutExpired:
-        result["error"] = "Pytest timed out after 5 minutes"
     except Exception as e:
         result["error"] = str(e)
 
     return result
 
 
+def _fill_pytest_counts(result: Dict[str, Any], holder: Dict[str, Any]) -> None:
+    """Copy collector outcomes into a pytest result dict and derive the pass rate."""
+    collector = holder["collector"]
+    result["passed"] = collector.passed
+    result["failed"] = collector.failed
+    result["skipped"] = collector.skipped
+    result["total"] = collector.passed + collector.failed + collector.skipped
+    result["exit_code"] = holder.get("exit_code")
+
+    if result["total"] > 0:
+        # Only count passed vs passed+failed (exclude skipped)
+        executable = result["passed"] + result["failed"]
+        if executable > 0:
+            result["pass_rate"] = (result["passed"] / executable) * 100
+        else:
+            result["pass_rate"] = 100.0
+
+
 def run_coverage(project_dir: Path) -> Dict[str, Any]:
     """Run coverage analysis."""
     test_scope = resolve_test_scope(project_dir)
@@ -231,45 +281,14 @@ def run_coverage(project_dir: Path) -> Dict[str, Any]:
             timeout=300,
         )
 
-        # Get coverage report as JSON
-        report_cmd = [
-            sys.executable,
-            "-m",
-            "coverage",
-            "json",
-            "-o",
-            "-",  # Output to stdout
-        ]
-
-        report_proc = subprocess.run(
-            report_cmd,
-            capture_output=True,
-            text=True,
-            cwd=str(project_dir),
-            timeout=60,
-        )
-
-        if report_proc.returncode == 0 and report_proc.stdout:
-            coverage_data = json.loads(report_proc.stdout)
-            totals = coverage_data.get("totals", {})
-            result["coverage_percent"] = totals.get("percent_covered", 0.0)
-            result["covered_lines"] = totals.get("covered_lines", 0)
-            result["total_lines"] = totals.get("num_statements", 0)
-        else:
-            # Fallback: parse text report
-            text_cmd = [sys.executable, "-m", "coverage", "report"]
-            text_proc = subprocess.run(
-                text_cmd,
-                capture_output=True,
-                text=True,
-                cwd=str(project_dir),
-                timeout=60,
-            )
-            
-            # Parse TOTAL line
-            match = re.search(r'TOTAL\s+\d+\s+\d+\s+(\d+)%', text_proc.stdout)
-            if match:
-                result["coverage_percent"] = float(match.group(1))
+        # Read the recorded data via the coverage API; no report subprocess
+        cov = coverage.Coverage(data_file=str(project_dir / ".coverage"))
+        cov.load()
+        coverage_data = _coverage_totals(cov)
+        totals = coverage_data.get("totals", {})
+        result["coverage_percent"] = totals.get("percent_covered", 0.0)
+        result["covered_lines"] = totals.get("covered_lines", 0)
+        result["total_lines"] = totals.get("num_statements", 0)
 
     except subprocess.TimeoutExpired:
         result["error"] = "Coverage analysis timed out"
@@ -277,35 +296,122 @@ def run_coverage(project_dir: Path) -> Dict[str, Any]:
         result["error"] = str(e)
 
     # Fallback: Try to load from existing coverage.json file if no coverage collected
-    if result["coverage_percent"] == 0.0:
-        coverage_json_path = project_dir / "coverage.json"
-        if coverage_json_path.exists():
-            try:
-                with open(coverage_json_path, 'r', encoding='utf-8') as f:
-                    coverage_data = json.load(f)
-                totals = coverage_data.get("totals", {})
-                result["coverage_percent"] = totals.get("percent_covered", 0.0)
-                result["covered_lines"] = totals.get("covered_lines", 0)
-                result["total_lines"] = totals.get("num_statements", 0)
-                result["error"] = None  # Clear error if we got data from file
-            except Exception:
-                pass  # Keep original error
+    _apply_coverage_file_fallback(project_dir, result)
 
     return result
 
 
+def run_pytest_with_coverage(project_dir: Path) -> Dict[str, Dict[str, Any]]:
+    """Run the test suite once, deriving pass/fail counts and coverage from the same run."""
+    test_scope = resolve_test_scope(project_dir)
+    scope_fields = {
+        "partial_scope": test_scope["partial_scope"],
+        "scope_source": test_scope["scope_source"],
+        "configured_targets": test_scope["configured_targets"],
+        "resolved_targets": test_scope["resolved_targets"],
+        "missing_targets": test_scope["missing_targets"],
+    }
+    pytest_result = {
+        "passed": 0,
+        "failed": 0,
+        "skipped": 0,
+        "total": 0,
+        "pass_rate": 0.0,
+        **scope_fields,
+        "error": None,
+    }
+    coverage_result = {
+        "coverage_percent": 0.0,
+        "covered_lines": 0,
+        "total_lines": 0,
+        **scope_fields,
+        "error": None,
+    }
+
+    try:
+        target_args = test_scope["resolved_targets"]
+        if not target_args:
+            error = (
+                f"No pytest targets resolved for functional suitability evaluation "
+                f"from {test_scope['configured_targets']}"
+            )
+            pytest_result["error"] = error
+            coverage_result["error"] = error
+            return {"pytest": pytest_result, "coverage": coverage_result}
+
+        holder = _run_suite_inprocess(project_dir, target_args, measure_coverage=True)
+        if holder["timed_out"]:
+            pytest_result["error"] = "Pytest timed out after 5 minutes"
+            coverage_result["error"] = "Pytest timed out after 5 minutes"
+            return {"pytest": pytest_result, "coverage": coverage_result}
+
+        _fill_pytest_counts(pytest_result, holder)
+
+        cov = holder.get("cov")
+        if cov is not None:
+            coverage_data = _coverage_totals(cov)
+            totals = coverage_data.get("totals", {})
+            coverage_result["coverage_percent"] = totals.get("percent_covered", 0.0)
+            coverage_result["covered_lines"] = totals.get("covered_lines", 0)
+            coverage_result["total_lines"] = totals.get("num_statements", 0)
+
+    except Exception as e:
+        pytest_result["error"] = pytest_result["error"] or str(e)
+        coverage_result["error"] = coverage_result["error"] or str(e)
+
+    _apply_coverage_file_fallback(project_dir, coverage_result)
+    return {"pytest": pytest_result, "coverage": coverage_result}
+
+
+def _coverage_totals(cov: "coverage.Coverage") -> Dict[str, Any]:
+    """Render a stopped Coverage object into the coverage.json dict shape."""
+    import tempfile
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        report_path = os.path.join(tmp_dir, "coverage.json")
+        cov.json_report(outfile=report_path)
+        with open(report_path, 'rb') as f:
+            return _loads_json(f.read())
+
+
+def _apply_coverage_file_fallback(project_dir: Path, result: Dict[str, Any]) -> None:
+    """Fill coverage fields from an existing coverage.json if no coverage was collected."""
+    if result["coverage_percent"] != 0.0:
+        return
+    coverage_json_path = project_dir / "coverage.json"
+    if coverage_json_path.exists():
+        try:
+            with open(coverage_json_path, 'rb') as f:
+                coverage_data = _loads_json(f.read())
+            totals = coverage_data.get("totals", {})
+            result["coverage_percent"] = totals.get("percent_covered", 0.0)
+            result["covered_lines"] = totals.get("covered_lines", 0)
+            result["total_lines"] = totals.get("num_statements", 0)
+            result["error"] = None  # Clear error if we got data from file
+        except Exception:
+            pass  # Keep original error
+
+
 def evaluate(project_dir: Path) -> FunctionalResult:
     """
     Evaluate functional suitability.
-    
+
     Score calculation:
     - 60% weight: Test pass rate
     - 40% weight: Code coverage
     """
-    # Run evaluations
-    pytest_result = run_pytest(project_dir)
-    coverage_result = run_coverage(project_dir)
-    
+    # The cached result is a test pass rate, so the fingerprint must
+    # cover the tests tree and pytest config, not just src/
+    fp = cache.fingerprint(project_dir, include_tests=True)
+    cached = cache.load(project_dir, "functional_suitability", fp)
+    if cached is not None:
+        return FunctionalResult(**cached)
+
+    # One fused run: the suite executes once for both pass rate and coverage
+    fused = run_pytest_with_coverage(project_dir)
+    pytest_result = fused["pytest"]
+    coverage_result = fused["coverage"]
+
     # Calculate component scores
     test_pass_rate = pytest_result.get("pass_rate", 0.0)
     code_coverage = coverage_result.get("coverage_percent", 0.0)
@@ -313,7 +419,7 @@ def evaluate(project_dir: Path) -> FunctionalResult:
     # Weighted score
     score = (test_pass_rate * 0.6) + (code_coverage * 0.4)
     
-    return FunctionalResult(
+    result = FunctionalResult(
         test_pass_rate=test_pass_rate,
         code_coverage=code_coverage,
         tests_passed=pytest_result.get("passed", 0),
@@ -333,6 +439,8 @@ def evaluate(project_dir: Path) -> FunctionalResult:
             },
         }
     )
+    cache.store(project_dir, "functional_suitability", fp, asdict(result))
+    return result
 
 
 if __name__ == "__main__":
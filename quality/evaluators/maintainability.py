@@ -5,15 +5,20 @@ Measures: Modularity, Reusability, Analysability, Modifiability, Testability
 Tools: radon (complexity), pylint/flake8 (code quality)
 """
 
-import subprocess
 import sys
-import json
-import ast
-import re
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from dataclasses import dataclass
+from dataclasses import dataclass, asdict
 from typing import Dict, Any, List
 
+try:
+    from quality import ast_cache, cache
+    from quality.source_scan import walk_py_files as _walk_py_files
+except ImportError:  # Executed as a standalone script from evaluators/
+    sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+    from quality import ast_cache, cache
+    from quality.source_scan import walk_py_files as _walk_py_files
+
 
 @dataclass
 class MaintainabilityResult:
@@ -27,214 +32,191 @@ class MaintainabilityResult:
     details: Dict[str, Any]
 
 
-def run_radon_cc(project_dir: Path) -> Dict[str, Any]:
-    """Run radon cyclomatic complexity analysis."""
-    result = {
+def analyze_source_tree(project_dir: Path) -> Dict[str, Dict[str, Any]]:
+    """Single pass over src/: each file is read once for LOC, radon CC, and radon MI."""
+    cc_result = {
         "average_complexity": 0.0,
         "max_complexity": 0,
         "functions_analyzed": 0,
         "high_complexity_functions": [],
         "error": None,
     }
-    
-    try:
-        cmd = [
-            sys.executable, "-m", "radon", "cc",
-            str(project_dir / "src"),
-            "-a", "-j",  # Average and JSON output
-        ]
-        
-        proc = subprocess.run(
-            cmd,
-            capture_output=True,
-            text=True,
-            cwd=str(project_dir),
-            timeout=120,
-        )
-        
-        if proc.stdout:
-            try:
-                data = json.loads(proc.stdout)
-                
-                total_complexity = 0
-                count = 0
-                
-                for file_path, functions in data.items():
-                    if isinstance(functions, list):
-                        for func in functions:
-                            complexity = func.get("complexity", 0)
-                            total_complexity += complexity
-                            count += 1
-                            
-                            if complexity > result["max_complexity"]:
-                                result["max_complexity"] = complexity
-                            
-                            if complexity > 10:  # High complexity threshold
-                                result["high_complexity_functions"].append({
-                                    "name": func.get("name", ""),
-                                    "complexity": complexity,
-                                    "file": file_path,
-                                })
-                
-                result["functions_analyzed"] = count
-                if count > 0:
-                    result["average_complexity"] = total_complexity / count
-                
-            except json.JSONDecodeError:
-                # Parse text output for average
-                match = re.search(r'Average complexity: (\w) \(([\d.]+)\)', proc.stdout)
-                if match:
-                    result["average_complexity"] = float(match.group(2))
-        
-    except FileNotFoundError:
-        result["error"] = "radon not installed (pip install radon)"
-    except Exception as e:
-        result["error"] = str(e)
-    
-    return result
-
-
-def run_radon_mi(project_dir: Path) -> Dict[str, Any]:
-    """Run radon maintainability index analysis."""
-    result = {
+    mi_result = {
         "average_mi": 0.0,
         "files_analyzed": 0,
         "grades": {"A": 0, "B": 0, "C": 0, "F": 0},
         "error": None,
     }
-    
-    try:
-        cmd = [
-            sys.executable, "-m", "radon", "mi",
-            str(project_dir / "src"),
-            "-j",  # JSON output
-        ]
-        
-        proc = subprocess.run(
-            cmd,
-            capture_output=True,
-            text=True,
-            cwd=str(project_dir),
-            timeout=120,
-        )
-        
-        if proc.stdout:
-            try:
-                data = json.loads(proc.stdout)
-                
-                total_mi = 0
-                count = 0
-                
-                for file_path, mi_data in data.items():
-                    if isinstance(mi_data, dict):
-                        mi = mi_data.get("mi", 0)
-                        rank = mi_data.get("rank", "F")
-                        
-                        total_mi += mi
-                        count += 1
-                        
-                        if rank in result["grades"]:
-                            result["grades"][rank] += 1
-                
-                result["files_analyzed"] = count
-                if count > 0:
-                    result["average_mi"] = total_mi / count
-                
-            except json.JSONDecodeError:
-                result["error"] = "Failed to parse radon MI output"
-        
-    except FileNotFoundError:
-        result["error"] = "radon not installed"
-    except Exception as e:
-        result["error"] = str(e)
-    
-    return result
-
-
-def analyze_code_metrics(project_dir: Path) -> Dict[str, Any]:
-    """Analyze basic code metrics."""
-    result = {
+    metrics_result = {
         "total_loc": 0,
         "total_files": 0,
         "avg_file_size": 0,
         "large_files": [],  # Files > 500 lines
         "error": None,
     }
-    
+
+    try:
+        from radon.metrics import h_visit_ast, mi_compute, mi_rank
+        from radon.raw import analyze
+        from radon.visitors import ComplexityVisitor
+    except ImportError:
+        ComplexityVisitor = None
+        cc_result["error"] = "radon not installed (pip install radon)"
+        mi_result["error"] = "radon not installed"
+
     try:
         src_dir = project_dir / "src"
         if not src_dir.exists():
             src_dir = project_dir
-        
+
+        total_complexity = 0
+        function_count = 0
+        total_mi = 0.0
+        mi_file_count = 0
         total_lines = 0
         file_count = 0
-        
-        for py_file in src_dir.rglob("*.py"):
-            if "__pycache__" in str(py_file):
+
+        for py_file in _walk_py_files(src_dir):
+            # The shared source cache means this read (like the parse
+            # below) happens once per file across all evaluators
+            raw = ast_cache.get_source(py_file)
+            if raw is None:
                 continue
-            
             try:
-                lines = len(py_file.read_text(encoding='utf-8').splitlines())
-                total_lines += lines
-                file_count += 1
-                
-                if lines > 500:
-                    result["large_files"].append({
-                        "file": str(py_file.relative_to(project_dir)),
-                        "lines": lines,
-                    })
-                
-            except Exception:
+                source = raw.decode('utf-8')
+            except UnicodeDecodeError:
+                continue
+
+            rel_path = str(py_file.relative_to(project_dir))
+
+            # LOC without materializing a line list
+            lines = source.count('\n')
+            if source and not source.endswith('\n'):
+                lines += 1
+            total_lines += lines
+            file_count += 1
+            if lines > 500:
+                metrics_result["large_files"].append({
+                    "file": rel_path,
+                    "lines": lines,
+                })
+
+            if ComplexityVisitor is None:
                 continue
-        
-        result["total_loc"] = total_lines
-        result["total_files"] = file_count
+
+            # The shared AST (one parse per file across evaluators) feeds
+            # both the complexity visitor and the Halstead half of the
+            # maintainability index
+            tree = ast_cache.get_tree(py_file)
+            if tree is None:
+                continue
+            try:
+                visitor = ComplexityVisitor.from_ast(tree)
+                raw = analyze(source)
+                halstead_volume = h_visit_ast(tree).total.volume
+            except (SyntaxError, ValueError):
+                continue
+
+            comments_lines = raw.comments + raw.multi
+            comments_percent = (
+                comments_lines / float(raw.sloc) * 100 if raw.sloc != 0 else 0
+            )
+            mi = mi_compute(
+                halstead_volume, visitor.total_complexity, raw.lloc, comments_percent
+            )
+
+            for block in visitor.blocks:
+                complexity = block.complexity
+                total_complexity += complexity
+                function_count += 1
+
+                if complexity > cc_result["max_complexity"]:
+                    cc_result["max_complexity"] = complexity
+
+                if complexity > 10:  # High complexity threshold
+                    cc_result["high_complexity_functions"].append({
+                        "name": block.name,
+                        "complexity": complexity,
+                        "file": rel_path,
+                    })
+
+            total_mi += mi
+            mi_file_count += 1
+            rank = mi_rank(mi)
+            if rank in mi_result["grades"]:
+                mi_result["grades"][rank] += 1
+
+        cc_result["functions_analyzed"] = function_count
+        if function_count > 0:
+            cc_result["average_complexity"] = total_complexity / function_count
+
+        mi_result["files_analyzed"] = mi_file_count
+        if mi_file_count > 0:
+            mi_result["average_mi"] = total_mi / mi_file_count
+
+        metrics_result["total_loc"] = total_lines
+        metrics_result["total_files"] = file_count
         if file_count > 0:
-            result["avg_file_size"] = total_lines / file_count
-        
+            metrics_result["avg_file_size"] = total_lines / file_count
+
     except Exception as e:
-        result["error"] = str(e)
-    
-    return result
+        cc_result["error"] = str(e)
+        mi_result["error"] = str(e)
+        metrics_result["error"] = str(e)
+
+    return {"cc": cc_result, "mi": mi_result, "metrics": metrics_result}
+
+
+def run_radon_cc(project_dir: Path) -> Dict[str, Any]:
+    """Run radon cyclomatic complexity analysis."""
+    return analyze_source_tree(project_dir)["cc"]
+
+
+def run_radon_mi(project_dir: Path) -> Dict[str, Any]:
+    """Run radon maintainability index analysis."""
+    return analyze_source_tree(project_dir)["mi"]
+
+
+def analyze_code_metrics(project_dir: Path) -> Dict[str, Any]:
+    """Analyze basic code metrics."""
+    return analyze_source_tree(project_dir)["metrics"]
 
 
 def run_flake8(project_dir: Path) -> Dict[str, Any]:
-    """Run flake8 for code style checking."""
+    """Run style and lint checks in-process via pycodestyle and pyflakes."""
     result = {
         "issues": 0,
         "score": 100.0,
         "error": None,
     }
-    
+
     try:
-        cmd = [
-            sys.executable, "-m", "flake8",
-            str(project_dir / "src"),
-            "--count",
-            "--statistics",
-            "--max-line-length", "120",
-        ]
-        
-        proc = subprocess.run(
-            cmd,
-            capture_output=True,
-            text=True,
-            cwd=str(project_dir),
-            timeout=60,
-        )
-        
-        # Count issues from output lines
-        output_lines = proc.stdout.strip().split('\n')
-        result["issues"] = len([l for l in output_lines if l and ':' in l])
-        
+        import io
+
+        import pycodestyle
+        from pyflakes.api import checkPath
+        from pyflakes.reporter import Reporter
+
+        py_files = [str(p) for p in _walk_py_files(project_dir / "src")]
+
+        style_guide = pycodestyle.StyleGuide(max_line_length=120, quiet=True)
+        issues = style_guide.check_files(py_files).total_errors
+
+        # Discard pyflakes' textual output; only the counts matter here
+        null_reporter = Reporter(io.StringIO(), io.StringIO())
+        for py_file in py_files:
+            issues += checkPath(py_file, reporter=null_reporter)
+
+        result["issues"] = issues
+
         # Calculate score (deduct 1 point per issue, min 0)
         result["score"] = max(0, 100 - result["issues"])
-        
-    except FileNotFoundError:
+
+    except ImportError:
         result["error"] = "flake8 not installed (pip install flake8)"
     except Exception as e:
         result["error"] = str(e)
-    
+
     return result
 
 
@@ -247,11 +229,21 @@ def evaluate(project_dir: Path) -> MaintainabilityResult:
     - Maintainability index: 40 points (scaled from 0-100 MI)
     - Lint score: 30 points (scaled from flake8 results)
     """
-    # Run analyses
-    cc_result = run_radon_cc(project_dir)
-    mi_result = run_radon_mi(project_dir)
-    metrics_result = analyze_code_metrics(project_dir)
-    flake8_result = run_flake8(project_dir)
+    fp = cache.fingerprint(project_dir)
+    cached = cache.load(project_dir, "maintainability", fp)
+    if cached is not None:
+        return MaintainabilityResult(**cached)
+
+    # Run analyses concurrently; LOC, radon CC, and radon MI share one source pass
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        source_future = executor.submit(analyze_source_tree, project_dir)
+        flake8_future = executor.submit(run_flake8, project_dir)
+        source_analysis = source_future.result()
+        flake8_result = flake8_future.result()
+
+    cc_result = source_analysis["cc"]
+    mi_result = source_analysis["mi"]
+    metrics_result = source_analysis["metrics"]
     
     # Calculate complexity score
     avg_cc = cc_result.get("average_complexity", 10)
@@ -273,7 +265,7 @@ def evaluate(project_dir: Path) -> MaintainabilityResult:
     
     total_score = cc_score + mi_score + lint_score
     
-    return MaintainabilityResult(
+    result = MaintainabilityResult(
         avg_cyclomatic_complexity=avg_cc,
         maintainability_index=avg_mi,
         code_duplication_percent=0,  # Would need additional tool
@@ -292,6 +284,8 @@ def evaluate(project_dir: Path) -> MaintainabilityResult:
             }
         }
     )
+    cache.store(project_dir, "maintainability", fp, asdict(result))
+    return result
 
 
 if __name__ == "__main__":
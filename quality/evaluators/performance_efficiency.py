@@ -5,11 +5,12 @@ Measures: Time Behaviour, Resource Utilization, Capacity
 Tools: psutil, time module
 """
 
-import subprocess
+import bisect
+import functools
+import multiprocessing
 import sys
 import time
 import os
-import psutil
 from pathlib import Path
 from dataclasses import dataclass
 from typing import Dict, Any, List
@@ -26,58 +27,154 @@ class PerformanceResult:
     details: Dict[str, Any]
 
 
-def measure_import_time(project_dir: Path) -> Dict[str, Any]:
-    """Measure time to import the main application module."""
-    result = {
+@functools.lru_cache(maxsize=1)
+def _psutil():
+    """Import psutil on first use and prime its CPU-times baseline.
+
+    psutil drags in ctypes and platform C extensions, so importing this
+    evaluator stays cheap when it is never run; the priming call makes
+    later interval=None reads return the delta since first use instead
+    of a meaningless 0.0.
+    """
+    import psutil
+    try:
+        psutil.cpu_percent(interval=None)
+    except Exception:
+        pass
+    return psutil
+
+
+@functools.lru_cache(maxsize=1)
+def _process():
+    """Singleton psutil.Process handle for the evaluator's own process.
+
+    Not used in the probe child: a forked child would inherit a handle
+    constructed with the parent's pid.
+    """
+    return _psutil().Process()
+
+
+def _rss_reader():
+    """Return a zero-argument callable reading this process's RSS in bytes.
+
+    POSIX gets getrusage — no psutil import in the probe at all; Windows
+    has no resource module and falls back to psutil with oneshot() so
+    attributes at each measurement point share one batched syscall.
+    """
+    try:
+        import resource
+
+        # ru_maxrss is kilobytes on Linux, bytes on macOS
+        scale = 1 if sys.platform == "darwin" else 1024
+
+        def _rss():
+            return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * scale
+    except ImportError:
+        import psutil
+        process = psutil.Process()
+
+        def _rss():
+            with process.oneshot():
+                return process.memory_info().rss
+
+    return _rss
+
+
+def _probe_app(project_src: str, conn) -> None:
+    """Child-process probe: time `import app` and record RSS before/after."""
+    sys.path.insert(0, project_src)
+    rss = _rss_reader()
+    baseline = rss()
+    start = time.perf_counter()
+    try:
+        import app  # noqa: F401
+        import_time_ms = (time.perf_counter() - start) * 1000
+        peak = rss()
+        conn.send((
+            import_time_ms,
+            len(sys.modules),
+            baseline / (1024 * 1024),
+            peak / (1024 * 1024),
+            None,
+        ))
+    except Exception as e:
+        conn.send((0.0, 0, 0.0, 0.0, str(e)))
+    finally:
+        conn.close()
+
+
+def _tree_signature(project_dir: Path) -> int:
+    """Newest mtime_ns under src/, used to invalidate the probe memo."""
+    try:
+        from quality import source_scan
+    except ImportError:  # Executed as a standalone script from evaluators/
+        sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+        from quality import source_scan
+    try:
+        return max(
+            (p.stat().st_mtime_ns
+             for p in source_scan.walk_py_files(project_dir / "src")),
+            default=0,
+        )
+    except OSError:
+        return 0
+
+
+@functools.lru_cache(maxsize=32)
+def _run_probe(project_dir_str: str, tree_signature: int) -> Dict[str, Any]:
+    """Launch the fused import+memory probe once per (project, tree state)."""
+    probe = {
         "import_time_ms": 0.0,
         "modules_imported": 0,
+        "baseline_mb": 0.0,
+        "peak_mb": 0.0,
         "error": None,
     }
-    
+
     try:
-        # Create a test script to measure import time
-        test_script = f'''
-import sys
-import time
-sys.path.insert(0, r"{project_dir / 'src'}")
-
-start = time.perf_counter()
-try:
-    import app
-    import_time = (time.perf_counter() - start) * 1000
-    print(f"IMPORT_TIME={{import_time:.2f}}")
-    print(f"MODULES={{len(sys.modules)}}")
-except Exception as e:
-    print(f"ERROR={{str(e)}}")
-'''
-        
-        proc = subprocess.run(
-            [sys.executable, "-c", test_script],
-            capture_output=True,
-            text=True,
-            cwd=str(project_dir),
-            timeout=60,
+        # fork skips the interpreter bootstrap and stdlib re-import that a
+        # full subprocess pays; the pipe returns the numbers without any
+        # stdout parsing. Windows has no fork, so fall back to spawn there.
+        ctx = multiprocessing.get_context("fork" if os.name != "nt" else "spawn")
+        recv_conn, send_conn = ctx.Pipe(duplex=False)
+        proc = ctx.Process(
+            target=_probe_app,
+            args=(str(Path(project_dir_str) / "src"), send_conn),
         )
-        
-        output = proc.stdout
-        if "IMPORT_TIME=" in output:
-            import_time_line = [l for l in output.split('\n') if 'IMPORT_TIME=' in l][0]
-            result["import_time_ms"] = float(import_time_line.split('=')[1])
-        
-        if "MODULES=" in output:
-            modules_line = [l for l in output.split('\n') if 'MODULES=' in l][0]
-            result["modules_imported"] = int(modules_line.split('=')[1])
-        
-        if "ERROR=" in output:
-            error_line = [l for l in output.split('\n') if 'ERROR=' in l][0]
-            result["error"] = error_line.split('=', 1)[1]
-        
-    except subprocess.TimeoutExpired:
-        result["error"] = "Import time measurement timed out"
+        proc.start()
+        send_conn.close()
+
+        if recv_conn.poll(60):
+            (
+                probe["import_time_ms"],
+                probe["modules_imported"],
+                probe["baseline_mb"],
+                probe["peak_mb"],
+                probe["error"],
+            ) = recv_conn.recv()
+        else:
+            probe["error"] = "Import time measurement timed out"
+
+        proc.join(5)
+        if proc.is_alive():
+            proc.terminate()
+            proc.join()
+        recv_conn.close()
+
     except Exception as e:
-        result["error"] = str(e)
-    
-    return result
+        probe["error"] = str(e)
+
+    return probe
+
+
+def measure_import_time(project_dir: Path) -> Dict[str, Any]:
+    """Measure time to import the main application module."""
+    probe = _run_probe(str(project_dir), _tree_signature(project_dir))
+    return {
+        "import_time_ms": probe["import_time_ms"],
+        "modules_imported": probe["modules_imported"],
+        "error": probe["error"],
+    }
 
 
 def measure_memory_usage(project_dir: Path) -> Dict[str, Any]:
@@ -88,71 +185,49 @@ def measure_memory_usage(project_dir: Path) -> Dict[str, Any]:
         "python_overhead_mb": 0.0,
         "error": None,
     }
-    
+
     try:
         # Measure Python baseline memory
-        process = psutil.Process()
+        process = _process()
         result["python_overhead_mb"] = process.memory_info().rss / (1024 * 1024)
-        
-        # Create test script to measure memory
-        test_script = f'''
-import sys
-import psutil
-sys.path.insert(0, r"{project_dir / 'src'}")
-
-process = psutil.Process()
-baseline = process.memory_info().rss
-
-try:
-    import app
-    peak = process.memory_info().rss
-    
-    print(f"BASELINE={{baseline / (1024*1024):.2f}}")
-    print(f"PEAK={{peak / (1024*1024):.2f}}")
-except Exception as e:
-    print(f"ERROR={{str(e)}}")
-'''
-        
-        proc = subprocess.run(
-            [sys.executable, "-c", test_script],
-            capture_output=True,
-            text=True,
-            cwd=str(project_dir),
-            timeout=60,
-        )
-        
-        output = proc.stdout
-        if "BASELINE=" in output:
-            line = [l for l in output.split('\n') if 'BASELINE=' in l][0]
-            result["baseline_mb"] = float(line.split('=')[1])
-        
-        if "PEAK=" in output:
-            line = [l for l in output.split('\n') if 'PEAK=' in l][0]
-            result["peak_mb"] = float(line.split('=')[1])
-        
     except Exception as e:
         result["error"] = str(e)
-    
+        return result
+
+    probe = _run_probe(str(project_dir), _tree_signature(project_dir))
+    result["baseline_mb"] = probe["baseline_mb"]
+    result["peak_mb"] = probe["peak_mb"]
+    result["error"] = probe["error"]
+
     return result
 
 
 def measure_cpu_utilization() -> Dict[str, Any]:
-    """Measure current CPU utilization."""
+    """Measure CPU utilization since the last sample, without blocking."""
+    psutil = _psutil()
     result = {
         "cpu_percent": 0.0,
         "cpu_count": psutil.cpu_count(),
         "error": None,
     }
-    
+
     try:
-        # Get CPU usage over a 1 second interval
-        result["cpu_percent"] = psutil.cpu_percent(interval=1)
+        # Non-blocking delta since the first-use priming call; by the
+        # time evaluate() gets here this covers the probe's own work
+        # instead of sleeping a fixed second sampling background noise
+        result["cpu_percent"] = psutil.cpu_percent(interval=None)
     except Exception as e:
         result["error"] = str(e)
-    
+
     return result
 
 
+# Sorted score thresholds: bisect finds the band, the scores tuple maps it
+_IMPORT_THRESHOLDS = (500, 1000, 2000)
+_MEMORY_THRESHOLDS = (100, 200, 500)
+_BAND_SCORES = (100, 80, 60, 40)
+
+
 def evaluate(project_dir: Path) -> PerformanceResult:
     """
     Evaluate performance efficiency.
@@ -162,6 +237,14 @@ def evaluate(project_dir: Path) -> PerformanceResult:
     - Memory usage: <100MB = 100, <200MB = 80, <500MB = 60, >500MB = 40
     - Final score is average
     """
+    project_dir = Path(project_dir)
+    return _evaluate_cached(str(project_dir), _tree_signature(project_dir))
+
+
+@functools.lru_cache(maxsize=16)
+def _evaluate_cached(project_dir_str: str, tree_signature: int) -> PerformanceResult:
+    """evaluate() body, memoized on the tree signature; treat results as read-only."""
+    project_dir = Path(project_dir_str)
     # Run evaluations
     import_result = measure_import_time(project_dir)
     memory_result = measure_memory_usage(project_dir)
@@ -169,25 +252,12 @@ def evaluate(project_dir: Path) -> PerformanceResult:
     
     # Calculate import time score
     import_time = import_result.get("import_time_ms", 5000)
-    if import_time < 500:
-        import_score = 100
-    elif import_time < 1000:
-        import_score = 80
-    elif import_time < 2000:
-        import_score = 60
-    else:
-        import_score = 40
-    
+    # bisect_right keeps the original strict-< banding at exact thresholds
+    import_score = _BAND_SCORES[bisect.bisect_right(_IMPORT_THRESHOLDS, import_time)]
+
     # Calculate memory score
     peak_memory = memory_result.get("peak_mb", 1000)
-    if peak_memory < 100:
-        memory_score = 100
-    elif peak_memory < 200:
-        memory_score = 80
-    elif peak_memory < 500:
-        memory_score = 60
-    else:
-        memory_score = 40
+    memory_score = _BAND_SCORES[bisect.bisect_right(_MEMORY_THRESHOLDS, peak_memory)]
     
     # Final score (equal weight)
     score = (import_score + memory_score) / 2
@@ -5,13 +5,18 @@ Measures: Adaptability, Installability, Replaceability
 Checks: Hardcoded paths, platform-specific code, dependency portability
 """
 
-import ast
-import re
-import platform
+import sys
+from functools import lru_cache
 from pathlib import Path
 from dataclasses import dataclass
 from typing import Dict, Any, List
 
+try:
+    from quality import source_scan
+except ImportError:  # Executed as a standalone script from evaluators/
+    sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+    from quality import source_scan
+
 
 @dataclass
 class PortabilityResult:
@@ -26,112 +31,27 @@ class PortabilityResult:
 
 def check_hardcoded_paths(project_dir: Path) -> Dict[str, Any]:
     """Check for hardcoded paths in code."""
-    result = {
-        "hardcoded_paths": 0,
-        "examples": [],
-        "error": None,
+    scan = source_scan.scan_source_tree(project_dir)
+    return {
+        "hardcoded_paths": scan["hardcoded_paths"],
+        "examples": scan["path_examples"],
+        # False means the count is a lower bound: the scan stopped
+        # counting once the path score was already pinned to zero
+        "scan_complete": scan["scan_complete"],
+        "error": scan["error"],
     }
-    
-    # Patterns for hardcoded paths
-    path_patterns = [
-        (r'["\'][A-Za-z]:\\[^"\']+["\']', 'Windows absolute path'),
-        (r'["\']/home/[^"\']+["\']', 'Unix home path'),
-        (r'["\']/usr/[^"\']+["\']', 'Unix system path'),
-        (r'["\']C:\\Users\\[^"\']+["\']', 'Windows user path'),
-    ]
-    
-    try:
-        src_dir = project_dir / "src"
-        if not src_dir.exists():
-            src_dir = project_dir
-        
-        for py_file in src_dir.rglob("*.py"):
-            if "__pycache__" in str(py_file):
-                continue
-            
-            try:
-                content = py_file.read_text(encoding='utf-8')
-                
-                for pattern, description in path_patterns:
-                    matches = re.findall(pattern, content)
-                    for match in matches:
-                        # Ignore common acceptable patterns
-                        if not any(ok in match.lower() for ok in ['appdata', 'temp', 'programdata']):
-                            result["hardcoded_paths"] += 1
-                            if len(result["examples"]) < 5:
-                                result["examples"].append({
-                                    "file": str(py_file.relative_to(project_dir)),
-                                    "path": match[:50],
-                                    "type": description,
-                                })
-                
-            except Exception:
-                continue
-        
-    except Exception as e:
-        result["error"] = str(e)
-    
-    return result
 
 
 def check_platform_specific_code(project_dir: Path) -> Dict[str, Any]:
     """Check for platform-specific imports and code."""
-    result = {
-        "windows_specific": 0,
-        "unix_specific": 0,
-        "platform_checks": 0,  # Proper platform checks (good)
-        "modules": [],
-        "error": None,
+    scan = source_scan.scan_source_tree(project_dir)
+    return {
+        "windows_specific": scan["windows_specific"],
+        "unix_specific": scan["unix_specific"],
+        "platform_checks": scan["platform_checks"],  # Proper platform checks (good)
+        "modules": list(scan["platform_modules"]),
+        "error": scan["error"],
     }
-    
-    windows_modules = ['win32api', 'win32con', 'win32gui', 'winreg', 'msvcrt', 'winshell']
-    unix_modules = ['posix', 'pwd', 'grp', 'fcntl']
-    
-    try:
-        src_dir = project_dir / "src"
-        if not src_dir.exists():
-            src_dir = project_dir
-        
-        for py_file in src_dir.rglob("*.py"):
-            if "__pycache__" in str(py_file):
-                continue
-            
-            try:
-                with open(py_file, 'r', encoding='utf-8') as f:
-                    tree = ast.parse(f.read())
-                
-                for node in ast.walk(tree):
-                    if isinstance(node, ast.Import):
-                        for alias in node.names:
-                            if alias.name in windows_modules:
-                                result["windows_specific"] += 1
-                                result["modules"].append(alias.name)
-                            elif alias.name in unix_modules:
-                                result["unix_specific"] += 1
-                                result["modules"].append(alias.name)
-                    
-                    elif isinstance(node, ast.ImportFrom):
-                        if node.module in windows_modules:
-                            result["windows_specific"] += 1
-                            result["modules"].append(node.module)
-                        elif node.module in unix_modules:
-                            result["unix_specific"] += 1
-                            result["modules"].append(node.module)
-                
-                # Check for proper platform checks
-                content = py_file.read_text(encoding='utf-8')
-                result["platform_checks"] += len(re.findall(
-                    r'platform\.system\(\)|sys\.platform|os\.name',
-                    content
-                ))
-                
-            except (SyntaxError, Exception):
-                continue
-        
-    except Exception as e:
-        result["error"] = str(e)
-    
-    return result
 
 
 def check_installation_support(project_dir: Path) -> Dict[str, Any]:
@@ -163,12 +83,20 @@ def check_installation_support(project_dir: Path) -> Dict[str, Any]:
 def evaluate(project_dir: Path) -> PortabilityResult:
     """
     Evaluate portability.
-    
+
     Score calculation:
     - No hardcoded paths: 30 points (deduct 5 per hardcoded path, min 0)
     - Platform handling: 30 points
     - Installation support: 40 points
     """
+    project_dir = Path(project_dir)
+    return _evaluate_cached(str(project_dir), source_scan.tree_signature(project_dir))
+
+
+@lru_cache(maxsize=16)
+def _evaluate_cached(project_dir_str: str, tree_signature: int) -> PortabilityResult:
+    """evaluate() body, memoized on the tree signature; treat results as read-only."""
+    project_dir = Path(project_dir_str)
     # Run checks
     paths_result = check_hardcoded_paths(project_dir)
     platform_result = check_platform_specific_code(project_dir)
@@ -5,12 +5,18 @@ Measures: Maturity, Availability, Fault Tolerance, Recoverability
 Checks: Exception handling, error patterns, resource cleanup
 """
 
-import ast
-import re
+import sys
+from functools import lru_cache
 from pathlib import Path
 from dataclasses import dataclass
 from typing import Dict, Any, List
 
+try:
+    from quality import source_scan
+except ImportError:  # Executed as a standalone script from evaluators/
+    sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+    from quality import source_scan
+
 
 @dataclass
 class ReliabilityResult:
@@ -23,61 +29,9 @@ class ReliabilityResult:
     details: Dict[str, Any]
 
 
-class ReliabilityAnalyzer(ast.NodeVisitor):
-    """AST visitor to analyze reliability patterns."""
-    
-    def __init__(self):
-        self.functions_total = 0
-        self.functions_with_try = 0
-        self.functions_with_finally = 0
-        self.context_managers_used = 0
-        self.bare_excepts = 0
-        self.logging_calls = 0
-        self.resource_opens = 0
-        self.resource_closes = 0
-    
-    def visit_FunctionDef(self, node):
-        self.functions_total += 1
-        
-        for child in ast.walk(node):
-            if isinstance(child, ast.Try):
-                self.functions_with_try += 1
-                if child.finalbody:
-                    self.functions_with_finally += 1
-                
-                # Check for bare excepts
-                for handler in child.handlers:
-                    if handler.type is None:
-                        self.bare_excepts += 1
-                break
-        
-        self.generic_visit(node)
-    
-    def visit_AsyncFunctionDef(self, node):
-        self.visit_FunctionDef(node)
-    
-    def visit_With(self, node):
-        self.context_managers_used += 1
-        self.generic_visit(node)
-    
-    def visit_AsyncWith(self, node):
-        self.context_managers_used += 1
-        self.generic_visit(node)
-    
-    def visit_Call(self, node):
-        # Check for logging calls
-        if isinstance(node.func, ast.Attribute):
-            if node.func.attr in ('debug', 'info', 'warning', 'error', 'critical', 'exception'):
-                self.logging_calls += 1
-            elif node.func.attr == 'open':
-                self.resource_opens += 1
-            elif node.func.attr == 'close':
-                self.resource_closes += 1
-        elif isinstance(node.func, ast.Name):
-            if node.func.id == 'open':
-                self.resource_opens += 1
-        
-        self.generic_visit(node)
+# The AST visitor lives in source_scan so the reliability counters come out
+# of the same per-file parse as the portability import counts
+ReliabilityAnalyzer = source_scan.ReliabilityAnalyzer
 
 
 def analyze_reliability_patterns(project_dir: Path) -> Dict[str, Any]:
@@ -92,94 +46,49 @@ def analyze_reliability_patterns(project_dir: Path) -> Dict[str, Any]:
         "patterns_found": [],
         "error": None,
     }
-    
+
     try:
-        src_dir = project_dir / "src"
-        if not src_dir.exists():
-            src_dir = project_dir
-        
-        analyzer = ReliabilityAnalyzer()
-        
-        for py_file in src_dir.rglob("*.py"):
-            if "__pycache__" in str(py_file):
-                continue
-            
-            try:
-                with open(py_file, 'r', encoding='utf-8') as f:
-                    tree = ast.parse(f.read())
-                analyzer.visit(tree)
-            except SyntaxError:
-                continue
-        
-        result["functions_total"] = analyzer.functions_total
-        result["functions_with_try"] = analyzer.functions_with_try
-        result["functions_with_finally"] = analyzer.functions_with_finally
-        result["context_managers_used"] = analyzer.context_managers_used
-        result["bare_excepts"] = analyzer.bare_excepts
-        result["logging_calls"] = analyzer.logging_calls
-        
-        if analyzer.functions_total > 0:
+        scan = source_scan.scan_source_tree(project_dir)
+
+        result["functions_total"] = scan["functions_total"]
+        result["functions_with_try"] = scan["functions_with_try"]
+        result["functions_with_finally"] = scan["functions_with_finally"]
+        result["context_managers_used"] = scan["context_managers_used"]
+        result["bare_excepts"] = scan["bare_excepts"]
+        result["logging_calls"] = scan["logging_calls"]
+
+        if scan["functions_total"] > 0:
             result["exception_handling_ratio"] = (
-                analyzer.functions_with_try / analyzer.functions_total * 100
+                scan["functions_with_try"] / scan["functions_total"] * 100
             )
             result["resource_cleanup_ratio"] = (
-                (analyzer.functions_with_finally + analyzer.context_managers_used) 
-                / analyzer.functions_total * 100
+                (scan["functions_with_finally"] + scan["context_managers_used"])
+                / scan["functions_total"] * 100
             )
-        
+
         # Identify good patterns
-        if analyzer.context_managers_used > 0:
+        if scan["context_managers_used"] > 0:
             result["patterns_found"].append("Context managers used for resource management")
-        if analyzer.logging_calls > 0:
+        if scan["logging_calls"] > 0:
             result["patterns_found"].append("Logging is implemented")
-        if analyzer.bare_excepts == 0:
+        if scan["bare_excepts"] == 0:
             result["patterns_found"].append("No bare except clauses (good practice)")
-        
+
     except Exception as e:
         result["error"] = str(e)
-    
+
     return result
 
 
 def check_recovery_mechanisms(project_dir: Path) -> Dict[str, Any]:
     """Check for recovery and fallback mechanisms."""
-    result = {
-        "config_backup": False,
-        "graceful_shutdown": False,
-        "retry_patterns": 0,
-        "error": None,
+    scan = source_scan.scan_source_tree(project_dir)
+    return {
+        "config_backup": scan["config_backup"],
+        "graceful_shutdown": scan["graceful_shutdown"],
+        "retry_patterns": scan["retry_patterns"],
+        "error": scan["error"],
     }
-    
-    try:
-        src_dir = project_dir / "src"
-        if not src_dir.exists():
-            src_dir = project_dir
-        
-        for py_file in src_dir.rglob("*.py"):
-            if "__pycache__" in str(py_file):
-                continue
-            
-            try:
-                content = py_file.read_text(encoding='utf-8')
-                
-                # Check for backup/recovery patterns
-                if re.search(r'backup|recover|restore', content, re.IGNORECASE):
-                    result["config_backup"] = True
-                
-                # Check for graceful shutdown
-                if re.search(r'signal|atexit|cleanup|shutdown', content, re.IGNORECASE):
-                    result["graceful_shutdown"] = True
-                
-                # Check for retry patterns
-                result["retry_patterns"] += len(re.findall(r'retry|attempt|max_retries', content, re.IGNORECASE))
-                
-            except Exception:
-                continue
-        
-    except Exception as e:
-        result["error"] = str(e)
-    
-    return result
 
 
 def evaluate(project_dir: Path) -> ReliabilityResult:
@@ -193,6 +102,14 @@ def evaluate(project_dir: Path) -> ReliabilityResult:
     - Logging present: 15 points
     - Recovery mechanisms: 15 points
     """
+    project_dir = Path(project_dir)
+    return _evaluate_cached(str(project_dir), source_scan.tree_signature(project_dir))
+
+
+@lru_cache(maxsize=16)
+def _evaluate_cached(project_dir_str: str, tree_signature: int) -> ReliabilityResult:
+    """evaluate() body, memoized on the tree signature; treat results as read-only."""
+    project_dir = Path(project_dir_str)
     # Run analyses
     patterns_result = analyze_reliability_patterns(project_dir)
     recovery_result = check_recovery_mechanisms(project_dir)
@@ -5,14 +5,58 @@ Measures: Confidentiality, Integrity, Non-repudiation, Accountability, Authentic
 Tools: bandit (static analysis), pip-audit (dependency vulnerabilities)
 """
 
+import hashlib
+import mmap
+import os
 import subprocess
 import sys
 import json
 import re
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from pathlib import Path
 from dataclasses import dataclass
 from typing import Dict, Any, List
 
+try:
+    import orjson  # Optional: much faster on large tool reports
+except ImportError:
+    orjson = None
+
+
+def _loads(data):
+    """Parse JSON bytes/str with orjson when available."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+try:
+    from quality import ast_cache, cache, source_scan
+except ImportError:  # Executed as a standalone script from evaluators/
+    sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+    from quality import ast_cache, cache, source_scan
+
+# Files whose contents drive the pip-audit cache key
+_DEPENDENCY_MANIFESTS = (
+    "requirements.txt", "requirements-dev.txt", "pyproject.toml", "poetry.lock",
+)
+
+
+def _manifest_fingerprint(project_dir: Path) -> str | None:
+    """Fingerprint of the dependency manifests, or None if none exist."""
+    digest = hashlib.blake2b(digest_size=16)
+    found = False
+    for name in _DEPENDENCY_MANIFESTS:
+        try:
+            data = (project_dir / name).read_bytes()
+        except OSError:
+            continue
+        found = True
+        digest.update(name.encode("utf-8"))
+        digest.update(b"\0")
+        digest.update(data)
+    return digest.hexdigest() if found else None
+
 
 @dataclass
 class SecurityResult:
@@ -29,8 +73,45 @@ class SecurityResult:
     details: Dict[str, Any]
 
 
+# Bandit severity labels -> result keys; includes CRITICAL, which the
+# old if/elif chain silently dropped
+_SEVERITY_KEYS = {
+    "CRITICAL": "critical",
+    "HIGH": "high",
+    "MEDIUM": "medium",
+    "LOW": "low",
+}
+
+
+def _run_tool(cmd: List[str], project_dir: Path, timeout: int = 120):
+    """Run a scanner subprocess; returns (returncode, stdout, stderr) as bytes.
+
+    Explicit Popen/communicate keeps the output as bytes for the JSON
+    parser and guarantees the child is killed and reaped on timeout
+    before TimeoutExpired propagates to the caller.
+    """
+    proc = subprocess.Popen(
+        cmd,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        cwd=str(project_dir),
+    )
+    try:
+        out, err = proc.communicate(timeout=timeout)
+    except subprocess.TimeoutExpired:
+        proc.kill()
+        proc.communicate()
+        raise
+    return proc.returncode, out, err
+
+
 def run_bandit(project_dir: Path) -> Dict[str, Any]:
     """Run bandit security scanner."""
+    fp = cache.fingerprint(project_dir)
+    cached = cache.load(project_dir, "security-bandit", fp)
+    if cached is not None:
+        return cached
+
     result = {
         "critical": 0,
         "high": 0,
@@ -40,7 +121,7 @@ def run_bandit(project_dir: Path) -> Dict[str, Any]:
         "issues": [],
         "error": None,
     }
-    
+
     try:
         cmd = [
             sys.executable, "-m", "bandit",
@@ -49,38 +130,32 @@ def run_bandit(project_dir: Path) -> Dict[str, Any]:
             "-q",
         ]
         
-        proc = subprocess.run(
-            cmd,
-            capture_output=True,
-            text=True,
-            cwd=str(project_dir),
-            timeout=120,
-        )
-        
-        if proc.stdout:
+        _returncode, out, _err = _run_tool(cmd, project_dir)
+
+        if out:
             try:
-                data = json.loads(proc.stdout)
+                data = _loads(out)
                 results = data.get("results", [])
-                
-                for issue in results:
-                    severity = issue.get("issue_severity", "").upper()
-                    if severity == "HIGH":
-                        result["high"] += 1
-                    elif severity == "MEDIUM":
-                        result["medium"] += 1
-                    elif severity == "LOW":
-                        result["low"] += 1
-                    
-                    result["issues"].append({
-                        "severity": severity,
+
+                result["issues"] = [
+                    {
+                        "severity": issue.get("issue_severity", "").upper(),
                         "text": issue.get("issue_text", ""),
                         "file": issue.get("filename", ""),
                         "line": issue.get("line_number", 0),
-                    })
-                
+                    }
+                    for issue in results
+                ]
+
+                severity_counts = Counter(
+                    issue["severity"] for issue in result["issues"]
+                )
+                for severity, key in _SEVERITY_KEYS.items():
+                    result[key] = severity_counts[severity]
+
                 result["total_issues"] = len(results)
-                
-            except json.JSONDecodeError:
+
+            except ValueError:
                 result["error"] = "Failed to parse bandit output"
         
     except FileNotFoundError:
@@ -89,12 +164,25 @@ def run_bandit(project_dir: Path) -> Dict[str, Any]:
         result["error"] = "Bandit scan timed out"
     except Exception as e:
         result["error"] = str(e)
-    
+
+    if result["error"] is None:
+        cache.store(project_dir, "security-bandit", fp, result)
     return result
 
 
 def run_pip_audit(project_dir: Path) -> Dict[str, Any]:
-    """Run pip-audit for dependency vulnerabilities."""
+    """Run pip-audit for dependency vulnerabilities.
+
+    Results are cached on the dependency manifests' contents, so a new
+    advisory against unchanged pins is only picked up after the cache is
+    cleared — acceptable for the per-commit loops this feeds.
+    """
+    fp = _manifest_fingerprint(project_dir)
+    if fp is not None:
+        cached = cache.load(project_dir, "security-pip-audit", fp)
+        if cached is not None:
+            return cached
+
     result = {
         "vulnerabilities": None,
         "packages_scanned": 0,
@@ -103,27 +191,21 @@ def run_pip_audit(project_dir: Path) -> Dict[str, Any]:
         "status": "unknown",
         "error": None,
     }
-    
+
     try:
         cmd = [
             sys.executable, "-m", "pip_audit",
             "--format", "json",
         ]
         
-        proc = subprocess.run(
-            cmd,
-            capture_output=True,
-            text=True,
-            cwd=str(project_dir),
-            timeout=120,
-        )
-        
-        output = (proc.stdout or "").strip()
-        error_output = (proc.stderr or "").strip()
+        returncode, out, err = _run_tool(cmd, project_dir)
+
+        output = (out or b"").strip()
+        error_output = (err or b"").strip()
         combined_output = output or error_output
         normalized_output = combined_output.lower()
 
-        if "no module named pip_audit" in normalized_output:
+        if b"no module named pip_audit" in normalized_output:
             result["available"] = False
             result["status"] = "unavailable"
             result["error"] = "pip-audit not installed (pip install pip-audit)"
@@ -131,7 +213,7 @@ def run_pip_audit(project_dir: Path) -> Dict[str, Any]:
 
         if combined_output:
             try:
-                data = json.loads(combined_output)
+                data = _loads(combined_output)
                 if isinstance(data, list):
                     result["vulnerabilities"] = len(data)
                     for vuln in data[:10]:  # Limit to first 10
@@ -157,17 +239,20 @@ def run_pip_audit(project_dir: Path) -> Dict[str, Any]:
                 else:
                     result["vulnerabilities"] = 0
                     result["status"] = "scanned"
-            except json.JSONDecodeError:
-                if "No known vulnerabilities found" in combined_output:
+            except ValueError:
+                if b"No known vulnerabilities found" in combined_output:
                     result["vulnerabilities"] = 0
                     result["status"] = "scanned"
                 else:
                     result["error"] = "Failed to parse pip-audit output"
-        elif proc.returncode == 0:
+        elif returncode == 0:
             result["vulnerabilities"] = 0
             result["status"] = "scanned"
         else:
-            result["error"] = error_output or "pip-audit failed without output"
+            result["error"] = (
+                error_output.decode("utf-8", "replace")
+                or "pip-audit failed without output"
+            )
     
     except FileNotFoundError:
         result["available"] = False
@@ -177,10 +262,91 @@ def run_pip_audit(project_dir: Path) -> Dict[str, Any]:
         result["error"] = "pip-audit timed out"
     except Exception as e:
         result["error"] = str(e)
-    
+
+    if fp is not None and result["status"] == "scanned":
+        cache.store(project_dir, "security-pip-audit", fp, result)
     return result
 
 
+# Patterns that might indicate secrets, fused into one alternation so
+# each file's content is scanned once instead of once per pattern;
+# lastgroup maps the hit back to its description. Compiled as a bytes
+# pattern (the patterns are pure ASCII) so it runs straight over the
+# memory-mapped file — no per-file UTF-8 decode; only the matched
+# snippets are decoded for the false-positive filter.
+# Keyword-anchored patterns as (anchor word, tail validator): the file
+# is scanned for each anchor with bytes.find (a memchr-backed multi-
+# string search — with only four fixed anchors an Aho-Corasick automaton
+# would buy nothing over this) and the regex runs only at hit positions
+# instead of over the whole file.
+_ANY_TAIL_RE = re.compile(rb'\s*=\s*["\'][^"\']+["\']')
+_KW_TAILS = {
+    b'password': (_ANY_TAIL_RE, 'Hardcoded password'),
+    b'api_key': (_ANY_TAIL_RE, 'Hardcoded API key'),
+    b'secret': (_ANY_TAIL_RE, 'Hardcoded secret'),
+    b'token': (re.compile(rb'\s*=\s*["\'][^"\']{10,}["\']'), 'Hardcoded token'),
+}
+_BASE64_RE = re.compile(rb'["\'][A-Za-z0-9+/]{40,}["\']')
+_BASE64_DESCRIPTION = 'Potential base64 secret'
+
+# The base64 pattern needs at least a 40-char run plus quotes
+_BASE64_MIN_SIZE = 42
+
+# Substrings that mark a match as a common false positive
+_FALSE_POSITIVE_TOKENS = frozenset({'example', 'placeholder', 'your_', 'xxx', 'test'})
+
+
+def _scan_file_for_secrets(py_file_str: str):
+    """Scan one file; returns (secrets_found, descriptions in hit order).
+
+    Module-level and str-argument so it pickles cleanly for the
+    process-pool path; the merge into the result dict stays in the driver.
+    """
+    try:
+        with open(py_file_str, 'rb') as f:
+            # Empty files cannot be mapped
+            try:
+                mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            except ValueError:
+                return 0, []
+            with mm:
+                raw = mm[:]
+    except Exception:
+        return 0, []
+    return _scan_bytes_for_secrets(raw)
+
+
+def _scan_bytes_for_secrets(raw: bytes):
+    """Scan one file's raw bytes; returns (secrets_found, descriptions)."""
+    # One lowercased copy serves the keyword screen and both regexes
+    # (which then need no IGNORECASE work)
+    data = raw.lower()
+
+    candidates = []
+    for keyword, (tail_re, description) in _KW_TAILS.items():
+        pos = data.find(keyword)
+        while pos != -1:
+            tail = tail_re.match(data, pos + len(keyword))
+            if tail is not None:
+                candidates.append((data[pos:tail.end()], description))
+            pos = data.find(keyword, pos + 1)
+    if len(data) >= _BASE64_MIN_SIZE:
+        candidates.extend(
+            (m.group(), _BASE64_DESCRIPTION)
+            for m in _BASE64_RE.finditer(data)
+        )
+
+    # Filter out common false positives
+    found = 0
+    descriptions = []
+    for snippet, description in candidates:
+        snippet_text = snippet.decode('utf-8', 'replace')
+        if not any(fp in snippet_text for fp in _FALSE_POSITIVE_TOKENS):
+            found += 1
+            descriptions.append(description)
+    return found, descriptions
+
+
 def check_hardcoded_secrets(project_dir: Path) -> Dict[str, Any]:
     """Check for potential hardcoded secrets."""
     result = {
@@ -188,44 +354,42 @@ def check_hardcoded_secrets(project_dir: Path) -> Dict[str, Any]:
         "patterns_matched": [],
         "error": None,
     }
-    
-    # Patterns that might indicate secrets
-    secret_patterns = [
-        (r'password\s*=\s*["\'][^"\']+["\']', 'Hardcoded password'),
-        (r'api_key\s*=\s*["\'][^"\']+["\']', 'Hardcoded API key'),
-        (r'secret\s*=\s*["\'][^"\']+["\']', 'Hardcoded secret'),
-        (r'token\s*=\s*["\'][^"\']{10,}["\']', 'Hardcoded token'),
-        (r'["\'][A-Za-z0-9+/]{40,}["\']', 'Potential base64 secret'),
-    ]
-    
+
     try:
         src_dir = project_dir / "src"
         if not src_dir.exists():
             src_dir = project_dir
-        
-        for py_file in src_dir.rglob("*.py"):
-            if "__pycache__" in str(py_file):
-                continue
-            
-            try:
-                content = py_file.read_text(encoding='utf-8')
-                
-                for pattern, description in secret_patterns:
-                    matches = re.findall(pattern, content, re.IGNORECASE)
-                    if matches:
-                        # Filter out common false positives
-                        for match in matches:
-                            if not any(fp in match.lower() for fp in ['example', 'placeholder', 'your_', 'xxx', 'test']):
-                                result["secrets_found"] += 1
-                                if description not in result["patterns_matched"]:
-                                    result["patterns_matched"].append(description)
-                
-            except Exception:
-                continue
-        
+
+        py_files = [str(p) for p in source_scan.walk_py_files(src_dir)]
+
+        # Same opt-in gate as source_scan: the per-file work here is tens
+        # of microseconds, so pool startup only pays off on big trees
+        if (
+            os.environ.get("CLEANBOX_PARALLEL_SCAN") == "1"
+            and len(py_files) >= source_scan._PARALLEL_MIN_FILES
+        ):
+            with ProcessPoolExecutor() as executor:
+                per_file = list(
+                    executor.map(_scan_file_for_secrets, py_files, chunksize=32)
+                )
+        else:
+            # Sequential path reads through the shared source cache, so
+            # the bytes fetched here also feed the AST-based evaluators
+            # (and vice versa) — one read per file across the whole run
+            per_file = [
+                _scan_bytes_for_secrets(raw) if raw is not None else (0, [])
+                for raw in (ast_cache.get_source(Path(p)) for p in py_files)
+            ]
+
+        for found, descriptions in per_file:
+            result["secrets_found"] += found
+            for description in descriptions:
+                if description not in result["patterns_matched"]:
+                    result["patterns_matched"].append(description)
+
     except Exception as e:
         result["error"] = str(e)
-    
+
     return result
 
 
@@ -240,10 +404,16 @@ def evaluate(project_dir: Path) -> SecurityResult:
     - Deduct per hardcoded secret: -10
     - Minimum score: 0
     """
-    # Run analyses
-    bandit_result = run_bandit(project_dir)
-    pip_audit_result = run_pip_audit(project_dir)
-    secrets_result = check_hardcoded_secrets(project_dir)
+    # Run analyses concurrently: the two subprocess scans spend their wall
+    # time waiting on I/O and release the GIL, so threads are enough
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        bandit_future = executor.submit(run_bandit, project_dir)
+        pip_audit_future = executor.submit(run_pip_audit, project_dir)
+        secrets_future = executor.submit(check_hardcoded_secrets, project_dir)
+
+        bandit_result = bandit_future.result()
+        pip_audit_result = pip_audit_future.result()
+        secrets_result = secrets_future.result()
     
     # Calculate score (start at 100, deduct for issues)
     score = 100.0
@@ -6,12 +6,18 @@ Checks: Documentation, error messages, docstrings
 """
 
 import ast
-import os
 import re
+import sys
 from pathlib import Path
 from dataclasses import dataclass
 from typing import Dict, Any, List
 
+try:
+    from quality import ast_cache
+except ImportError:  # Executed as a standalone script from evaluators/
+    sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+    from quality import ast_cache
+
 
 @dataclass
 class UsabilityResult:
@@ -32,23 +38,28 @@ class DocstringAnalyzer(ast.NodeVisitor):
         self.classes_total = 0
         self.classes_with_docs = 0
         self.functions_with_error_handling = 0
-    
+        # One had-try flag per enclosing function, so visit_Try can mark
+        # the function the single generic_visit pass is currently inside
+        self._fn_stack = []
+
     def visit_FunctionDef(self, node):
         self.functions_total += 1
         if ast.get_docstring(node):
             self.functions_with_docs += 1
-        
-        # Check for error handling
-        for child in ast.walk(node):
-            if isinstance(child, ast.Try):
-                self.functions_with_error_handling += 1
-                break
-        
+
+        self._fn_stack.append(False)
         self.generic_visit(node)
-    
+        if self._fn_stack.pop():
+            self.functions_with_error_handling += 1
+
     def visit_AsyncFunctionDef(self, node):
         self.visit_FunctionDef(node)
-    
+
+    def visit_Try(self, node):
+        if self._fn_stack:
+            self._fn_stack[-1] = True
+        self.generic_visit(node)
+
     def visit_ClassDef(self, node):
         self.classes_total += 1
         if ast.get_docstring(node):
@@ -71,7 +82,12 @@ def analyze_documentation(project_dir: Path) -> Dict[str, Any]:
         readme_path = project_dir / "README.md"
         if readme_path.exists():
             result["readme_exists"] = True
-            result["readme_lines"] = len(readme_path.read_text().splitlines())
+            # Count newlines in the raw bytes: no decode and no line list
+            # just to learn how many lines there are
+            raw = readme_path.read_bytes()
+            result["readme_lines"] = raw.count(b"\n") + (
+                0 if not raw or raw.endswith(b"\n") else 1
+            )
         
         # Check docs directory
         docs_dir = project_dir / "docs"
@@ -99,23 +115,11 @@ def analyze_code_documentation(project_dir: Path) -> Dict[str, Any]:
     }
     
     try:
-        src_dir = project_dir / "src"
-        if not src_dir.exists():
-            src_dir = project_dir
-        
         analyzer = DocstringAnalyzer()
-        
-        for py_file in src_dir.rglob("*.py"):
-            if "__pycache__" in str(py_file):
-                continue
-            
-            try:
-                with open(py_file, 'r', encoding='utf-8') as f:
-                    tree = ast.parse(f.read())
-                analyzer.visit(tree)
-            except SyntaxError:
-                continue
-        
+
+        for _py_file, tree in ast_cache.iter_python_asts(project_dir):
+            analyzer.visit(tree)
+
         result["functions_total"] = analyzer.functions_total
         result["functions_documented"] = analyzer.functions_with_docs
         result["classes_total"] = analyzer.classes_total
@@ -7,9 +7,9 @@ Main orchestrator for running all quality evaluations and generating reports.
 import json
 import sys
 import os
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
-from dataclasses import asdict
 from typing import Dict, Any
 
 # Add project root to path
@@ -23,6 +23,11 @@ if sys.stdout.encoding != 'utf-8':
     except AttributeError:
         pass  # Python < 3.7 or not supported
 
+try:
+    import orjson  # Optional: serializes the report in one C-level pass
+except ImportError:
+    orjson = None
+
 from quality.config import get_status, get_overall_status, WEIGHTS
 from quality.evaluators import functional_suitability
 from quality.evaluators import performance_efficiency
@@ -34,6 +39,13 @@ from quality.evaluators import maintainability
 from quality.evaluators import portability
 
 
+# Score bar base: slicing this yields any filled/light split without
+# rebuilding the strings per report
+_BAR = "█" * 20 + "░" * 20
+
+_STATUS_EMOJI = {"PASS": "✅", "WARNING": "⚠️", "FAIL": "❌", "ERROR": "🔴"}
+
+
 class QualityEvaluator:
     """Main quality evaluator orchestrator."""
     
@@ -41,6 +53,7 @@ class QualityEvaluator:
         self.project_dir = project_dir
         self.results = {}
         self.overall_score = 0.0
+        self._report = None
     
     def run_all(self) -> Dict[str, Any]:
         """Run all quality evaluations."""
@@ -50,6 +63,8 @@ class QualityEvaluator:
         print(f"Project: {self.project_dir}")
         print(f"Started: {datetime.now().isoformat()}")
         print("-" * 60)
+
+        self._report = None  # Invalidate any report from a previous run
         
         evaluators = [
             ("functional_suitability", functional_suitability.evaluate, "Functional Suitability"),
@@ -64,34 +79,42 @@ class QualityEvaluator:
         
         total_weighted_score = 0.0
         total_weight = 0.0
-        
-        for key, evaluator_func, display_name in evaluators:
-            print(f"\n[{display_name}]")
-            try:
-                result = evaluator_func(self.project_dir)
-                score = result.score
-                status = get_status(key, score)
-                
-                self.results[key] = {
-                    "score": score,
-                    "status": status,
-                    "result": self._serialize_result(result),
-                }
-                
-                weight = WEIGHTS.get(key, 1.0)
-                total_weighted_score += score * weight
-                total_weight += weight
-                
-                status_icon = {"PASS": "✓", "WARNING": "!", "FAIL": "✗"}.get(status, "?")
-                print(f"  Score: {score:.1f}% [{status_icon} {status}]")
-                
-            except Exception as e:
-                print(f"  ERROR: {str(e)}")
-                self.results[key] = {
-                    "score": 0.0,
-                    "status": "ERROR",
-                    "error": str(e),
-                }
+
+        # Evaluators mostly block on external tools, so overlap them with threads
+        # and report in the declared order once each finishes.
+        with ThreadPoolExecutor(max_workers=len(evaluators)) as executor:
+            futures = {
+                key: executor.submit(evaluator_func, self.project_dir)
+                for key, evaluator_func, _ in evaluators
+            }
+
+            for key, evaluator_func, display_name in evaluators:
+                print(f"\n[{display_name}]")
+                try:
+                    result = futures[key].result()
+                    score = result.score
+                    status = get_status(key, score)
+
+                    self.results[key] = {
+                        "score": score,
+                        "status": status,
+                        "result": self._serialize_result(result),
+                    }
+
+                    weight = WEIGHTS.get(key, 1.0)
+                    total_weighted_score += score * weight
+                    total_weight += weight
+
+                    status_icon = {"PASS": "✓", "WARNING": "!", "FAIL": "✗"}.get(status, "?")
+                    print(f"  Score: {score:.1f}% [{status_icon} {status}]")
+
+                except Exception as e:
+                    print(f"  ERROR: {str(e)}")
+                    self.results[key] = {
+                        "score": 0.0,
+                        "status": "ERROR",
+                        "error": str(e),
+                    }
         
         # Calculate overall score
         if total_weight > 0:
@@ -106,127 +129,146 @@ class QualityEvaluator:
         return self.get_report()
     
     def _serialize_result(self, result) -> Dict[str, Any]:
-        """Serialize a result object to dict."""
-        if hasattr(result, '__dataclass_fields__'):
-            data = asdict(result)
-            # Remove nested details to keep report clean
-            if 'details' in data:
-                del data['details']
-            return data
-        return {}
-    
-    def get_report(self) -> Dict[str, Any]:
-        """Get the full quality report."""
+        """Serialize a result object to dict.
+
+        Shallow top-level copy: details is dropped from the report anyway,
+        and asdict would recursively deep-copy exactly that nested payload
+        before it got deleted.
+        """
+        fields = getattr(type(result), '__dataclass_fields__', None)
+        if fields is None:
+            return {}
         return {
-            "project": str(self.project_dir),
-            "timestamp": datetime.now().isoformat(),
-            "overall_score": self.overall_score,
-            "overall_status": get_overall_status(self.overall_score),
-            "characteristics": self.results,
+            name: getattr(result, name)
+            for name in fields
+            if name != 'details'
         }
     
+    def get_report(self) -> Dict[str, Any]:
+        """Get the full quality report.
+
+        Built once per run and cached: both report writers call this, and
+        the results don't change between a run_all and its save calls.
+        """
+        if self._report is None:
+            self._report = {
+                "project": str(self.project_dir),
+                "timestamp": datetime.now().isoformat(),
+                "overall_score": self.overall_score,
+                "overall_status": get_overall_status(self.overall_score),
+                "characteristics": self.results,
+            }
+        return self._report
+    
     def save_json_report(self, output_path: Path) -> None:
         """Save report as JSON."""
         report = self.get_report()
-        with open(output_path, 'w', encoding='utf-8') as f:
-            json.dump(report, f, indent=2, default=str)
+        if orjson is not None:
+            # One C-level serialize plus one write; stdlib's indented
+            # encoder streams the document piecemeal through Python code
+            payload = orjson.dumps(report, option=orjson.OPT_INDENT_2, default=str)
+            with open(output_path, 'wb') as f:
+                f.write(payload)
+        else:
+            with open(output_path, 'w', encoding='utf-8') as f:
+                json.dump(report, f, indent=2, default=str)
         print(f"\nJSON report saved: {output_path}")
     
     def save_markdown_report(self, output_path: Path) -> None:
-        """Save report as Markdown."""
+        """Save report as Markdown, streamed straight to the file buffer."""
         report = self.get_report()
-        
-        md_lines = [
-            "# ISO/IEC 25010 Quality Report",
-            "",
-            f"**Project:** `{report['project']}`",
-            f"**Generated:** {report['timestamp']}",
-            "",
-            "---",
-            "",
-            "## Overall Score",
-            "",
-            f"### {report['overall_score']:.1f}% - {report['overall_status']}",
-            "",
-        ]
-        
-        # Add score bar
+
+        # Score bar sliced out of the precomputed base string
         score = int(report['overall_score'])
-        bar = "█" * (score // 5) + "░" * ((100 - score) // 5)
-        md_lines.append(f"```")
-        md_lines.append(f"[{bar}] {score}%")
-        md_lines.append(f"```")
-        md_lines.append("")
-        
-        # Summary table
-        md_lines.extend([
-            "## Summary",
-            "",
-            "| Characteristic | Score | Status |",
-            "|----------------|-------|--------|",
-        ])
-        
-        for key, data in report['characteristics'].items():
-            display_name = key.replace('_', ' ').title()
-            score = data.get('score', 0)
-            status = data.get('status', 'UNKNOWN')
-            
-            emoji = {"PASS": "✅", "WARNING": "⚠️", "FAIL": "❌", "ERROR": "🔴"}.get(status, "❓")
-            md_lines.append(f"| {display_name} | {score:.1f}% | {emoji} {status} |")
-        
-        md_lines.append("")
-        
-        # Detailed sections
-        md_lines.extend([
-            "---",
-            "",
-            "## Detailed Results",
-            "",
-        ])
-        
-        for key, data in report['characteristics'].items():
-            display_name = key.replace('_', ' ').title()
-            score = data.get('score', 0)
-            status = data.get('status', 'UNKNOWN')
-            
-            md_lines.append(f"### {display_name}")
-            md_lines.append("")
-            md_lines.append(f"**Score:** {score:.1f}% | **Status:** {status}")
-            md_lines.append("")
-            
-            # Add result details
-            result = data.get('result', {})
-            if result:
-                for k, v in result.items():
-                    if k != 'score' and v is not None:
-                        md_lines.append(f"- **{k.replace('_', ' ').title()}:** {v}")
-            
-            md_lines.append("")
-        
-        # Recommendations
-        md_lines.extend([
-            "---",
-            "",
-            "## Recommendations",
-            "",
-        ])
-        
-        for key, data in report['characteristics'].items():
-            if data.get('status') in ('WARNING', 'FAIL'):
+        filled = score // 5
+        light = (100 - score) // 5
+        bar = _BAR[20 - filled:20 + light]
+
+        with open(output_path, 'w', encoding='utf-8', buffering=1 << 16) as f:
+            w = f.write
+            w(
+                "# ISO/IEC 25010 Quality Report\n"
+                "\n"
+                f"**Project:** `{report['project']}`\n"
+                f"**Generated:** {report['timestamp']}\n"
+                "\n"
+                "---\n"
+                "\n"
+                "## Overall Score\n"
+                "\n"
+                f"### {report['overall_score']:.1f}% - {report['overall_status']}\n"
+                "\n"
+                "```\n"
+                f"[{bar}] {score}%\n"
+                "```\n"
+                "\n"
+                "## Summary\n"
+                "\n"
+                "| Characteristic | Score | Status |\n"
+                "|----------------|-------|--------|\n"
+            )
+
+            for key, data in report['characteristics'].items():
                 display_name = key.replace('_', ' ').title()
-                md_lines.append(f"- **{display_name}** needs improvement (current: {data.get('score', 0):.1f}%)")
-        
-        if all(d.get('status') == 'PASS' for d in report['characteristics'].values()):
-            md_lines.append("✅ All quality characteristics meet the thresholds!")
-        
-        md_lines.append("")
-        md_lines.append("---")
-        md_lines.append("")
-        md_lines.append("*Generated by ISO/IEC 25010 Quality Evaluator*")
-        
-        with open(output_path, 'w', encoding='utf-8') as f:
-            f.write('\n'.join(md_lines))
-        
+                char_score = data.get('score', 0)
+                status = data.get('status', 'UNKNOWN')
+
+                emoji = _STATUS_EMOJI.get(status, "❓")
+                w(f"| {display_name} | {char_score:.1f}% | {emoji} {status} |\n")
+
+            # Detailed sections
+            w(
+                "\n"
+                "---\n"
+                "\n"
+                "## Detailed Results\n"
+                "\n"
+            )
+
+            for key, data in report['characteristics'].items():
+                display_name = key.replace('_', ' ').title()
+                char_score = data.get('score', 0)
+                status = data.get('status', 'UNKNOWN')
+
+                w(
+                    f"### {display_name}\n"
+                    "\n"
+                    f"**Score:** {char_score:.1f}% | **Status:** {status}\n"
+                    "\n"
+                )
+
+                # Add result details
+                result = data.get('result', {})
+                if result:
+                    for k, v in result.items():
+                        if k != 'score' and v is not None:
+                            w(f"- **{k.replace('_', ' ').title()}:** {v}\n")
+
+                w("\n")
+
+            # Recommendations
+            w(
+                "---\n"
+                "\n"
+                "## Recommendations\n"
+                "\n"
+            )
+
+            for key, data in report['characteristics'].items():
+                if data.get('status') in ('WARNING', 'FAIL'):
+                    display_name = key.replace('_', ' ').title()
+                    w(f"- **{display_name}** needs improvement (current: {data.get('score', 0):.1f}%)\n")
+
+            if all(d.get('status') == 'PASS' for d in report['characteristics'].values()):
+                w("✅ All quality characteristics meet the thresholds!\n")
+
+            w(
+                "\n"
+                "---\n"
+                "\n"
+                "*Generated by ISO/IEC 25010 Quality Evaluator*"
+            )
+
         print(f"Markdown report saved: {output_path}")
 
 
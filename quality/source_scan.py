@@ -0,0 +1,364 @@
+"""
+Shared Source-Tree Scanner
+--------------------------
+Single-pass scanner over src/ used by the portability and reliability
+evaluators. Each file is read once, matched against one combined
+precompiled alternation, and parsed into an AST exactly once for the
+combined reliability/platform-import visitor. The scan is memoized on
+the tree's newest mtime so evaluators running in the same process share
+one walk.
+"""
+
+import ast
+import os
+import re
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache, partial
+from pathlib import Path
+from typing import Any, Dict, Iterator
+
+# frozensets: membership is tested once per import statement per file
+WINDOWS_MODULES = frozenset({'win32api', 'win32con', 'win32gui', 'winreg', 'msvcrt', 'winshell'})
+UNIX_MODULES = frozenset({'posix', 'pwd', 'grp', 'fcntl'})
+
+# Directories pruned before descent so their contents are never stat'ed
+_SKIP_DIRS = {"__pycache__", ".venv", ".git", ".mypy_cache", ".pytest_cache"}
+
+# Named path-pattern groups and their human-readable descriptions
+_PATH_GROUPS = {
+    "win_user": "Windows user path",
+    "win_abs": "Windows absolute path",
+    "unix_home": "Unix home path",
+    "unix_sys": "Unix system path",
+}
+
+# Substrings that mark a hardcoded path as acceptable
+_ALLOWED_PATH_HINTS = ("appdata", "temp", "programdata")
+
+# Byte substrings screened against the lowercased raw file before any
+# decode: if none appear, the combined regex cannot match and the decode
+# plus regex pass are skipped. Kept deliberately broad (supersets of the
+# regex alternatives) so the screen can only skip true non-matches.
+_PREFILTER_TOKENS = (
+    b":\\", b"/home/", b"/usr/",
+    b"platform", b"os.name",
+    b"backup", b"recover", b"restore",
+    b"signal", b"atexit", b"cleanup", b"shutdown",
+    b"retry", b"attempt",
+)
+
+# One alternation for everything the regex passes used to look for
+# separately; group-local (?i:...) keeps the recovery keywords
+# case-insensitive without affecting the path patterns. Compiled as a
+# bytes pattern so it runs on the raw file content — only the handful
+# of matched path literals ever get decoded, never whole files.
+_COMBINED_RE = re.compile(
+    rb"(?P<win_user>[\"']C:\\Users\\[^\"']+[\"'])"
+    rb"|(?P<win_abs>[\"'][A-Za-z]:\\[^\"']+[\"'])"
+    rb"|(?P<unix_home>[\"']/home/[^\"']+[\"'])"
+    rb"|(?P<unix_sys>[\"']/usr/[^\"']+[\"'])"
+    rb"|(?P<platform_check>platform\.system\(\)|sys\.platform|os\.name)"
+    rb"|(?P<backup>(?i:backup|recover|restore))"
+    rb"|(?P<shutdown>(?i:signal|atexit|cleanup|shutdown))"
+    rb"|(?P<retry>(?i:retry|attempt|max_retries))"
+)
+
+
+class ReliabilityAnalyzer(ast.NodeVisitor):
+    """AST visitor to analyze reliability patterns."""
+
+    def __init__(self):
+        self.functions_total = 0
+        self.functions_with_try = 0
+        self.functions_with_finally = 0
+        self.context_managers_used = 0
+        self.bare_excepts = 0
+        self.logging_calls = 0
+        self.resource_opens = 0
+        self.resource_closes = 0
+        # Stack of [had_try, had_finally] flags, one frame per enclosing
+        # function, so visit_Try can attribute a try to the function the
+        # single generic_visit pass is currently inside
+        self._fn_stack = []
+
+    def visit_FunctionDef(self, node):
+        self.functions_total += 1
+
+        self._fn_stack.append([False, False])
+        self.generic_visit(node)
+        had_try, had_finally = self._fn_stack.pop()
+
+        if had_try:
+            self.functions_with_try += 1
+        if had_finally:
+            self.functions_with_finally += 1
+
+    def visit_Try(self, node):
+        if self._fn_stack:
+            frame = self._fn_stack[-1]
+            frame[0] = True
+            if node.finalbody:
+                frame[1] = True
+
+        # Check for bare excepts
+        for handler in node.handlers:
+            if handler.type is None:
+                self.bare_excepts += 1
+
+        self.generic_visit(node)
+
+    def visit_AsyncFunctionDef(self, node):
+        self.visit_FunctionDef(node)
+
+    def visit_With(self, node):
+        self.context_managers_used += 1
+        self.generic_visit(node)
+
+    def visit_AsyncWith(self, node):
+        self.context_managers_used += 1
+        self.generic_visit(node)
+
+    def visit_Call(self, node):
+        # Check for logging calls
+        if isinstance(node.func, ast.Attribute):
+            if node.func.attr in ('debug', 'info', 'warning', 'error', 'critical', 'exception'):
+                self.logging_calls += 1
+            elif node.func.attr == 'open':
+                self.resource_opens += 1
+            elif node.func.attr == 'close':
+                self.resource_closes += 1
+        elif isinstance(node.func, ast.Name):
+            if node.func.id == 'open':
+                self.resource_opens += 1
+
+        self.generic_visit(node)
+
+
+class _CombinedAstVisitor(ReliabilityAnalyzer):
+    """Extends the reliability walk with platform-specific import tracking."""
+
+    def __init__(self):
+        super().__init__()
+        self.windows_specific = 0
+        self.unix_specific = 0
+        self.platform_modules = []
+
+    def visit_Import(self, node):
+        for alias in node.names:
+            self._record_module(alias.name)
+        self.generic_visit(node)
+
+    def visit_ImportFrom(self, node):
+        self._record_module(node.module)
+        self.generic_visit(node)
+
+    def _record_module(self, name):
+        if name in WINDOWS_MODULES:
+            self.windows_specific += 1
+            self.platform_modules.append(name)
+        elif name in UNIX_MODULES:
+            self.unix_specific += 1
+            self.platform_modules.append(name)
+
+
+def walk_py_files(root: Path) -> Iterator[Path]:
+    """Yield .py files under root, pruning cache/VCS directories at scandir level."""
+    try:
+        entries = os.scandir(root)
+    except OSError:
+        return
+    with entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                if entry.name not in _SKIP_DIRS:
+                    yield from walk_py_files(entry.path)
+            elif entry.name.endswith(".py"):
+                yield Path(entry.path)
+
+
+def _resolve_src_dir(project_dir: Path) -> Path:
+    src_dir = project_dir / "src"
+    return src_dir if src_dir.exists() else project_dir
+
+
+def _tree_signature(src_dir: Path) -> int:
+    """Newest mtime_ns under src_dir, used to invalidate the scan memo."""
+    newest = 0
+    for py_file in walk_py_files(src_dir):
+        try:
+            mtime_ns = py_file.stat().st_mtime_ns
+        except OSError:
+            continue
+        if mtime_ns > newest:
+            newest = mtime_ns
+    return newest
+
+
+def tree_signature(project_dir: Path) -> int:
+    """Newest mtime_ns under the project's source dir.
+
+    Cheap change signal for memoizing whole-evaluator results between
+    calls on an unchanged tree.
+    """
+    return _tree_signature(_resolve_src_dir(Path(project_dir)))
+
+
+def scan_source_tree(project_dir: Path) -> Dict[str, Any]:
+    """Scan src/ once and return combined portability/reliability counters.
+
+    The returned dict is shared between callers via the memo — treat it
+    as read-only.
+    """
+    project_dir = Path(project_dir)
+    src_dir = _resolve_src_dir(project_dir)
+    return _scan(str(project_dir), str(src_dir), _tree_signature(src_dir))
+
+
+# Counter keys summed (ints/lists) or or-ed (bools) when merging
+# per-file results
+_SUM_KEYS = (
+    "hardcoded_paths", "platform_checks", "retry_patterns",
+    "functions_total", "functions_with_try", "functions_with_finally",
+    "context_managers_used", "bare_excepts", "logging_calls",
+    "windows_specific", "unix_specific",
+)
+_OR_KEYS = ("config_backup", "graceful_shutdown")
+
+# Below this many files the process-pool startup cost outweighs the
+# parallel parse; run inline instead
+_PARALLEL_MIN_FILES = 20
+
+
+def _regex_saturated(result: Dict[str, Any]) -> bool:
+    """True once no further regex match can change any derived score.
+
+    Path score pins to zero at six hardcoded paths with five examples
+    collected, and the remaining regex-fed signals are booleans or
+    only ever tested against zero.
+    """
+    return (
+        result["hardcoded_paths"] >= 6
+        and len(result["path_examples"]) >= 5
+        and result["platform_checks"] > 0
+        and result["config_backup"]
+        and result["graceful_shutdown"]
+        and result["retry_patterns"] > 0
+    )
+
+
+def _scan_one_file(py_file_str: str, project_dir_str: str,
+                   skip_regex: bool = False) -> Dict[str, Any]:
+    """Scan a single file; returns a pickleable dict of counters to merge."""
+    counters: Dict[str, Any] = {key: 0 for key in _SUM_KEYS}
+    counters.update({key: False for key in _OR_KEYS})
+    counters["path_examples"] = []
+    counters["platform_modules"] = []
+
+    py_file = Path(py_file_str)
+    try:
+        raw = py_file.read_bytes()
+    except OSError:
+        return counters
+
+    # One AST parse per file serves both the reliability counters and the
+    # platform-specific import counts. compile() with PyCF_ONLY_AST is
+    # ast.parse without the Python-level wrapper, takes the raw bytes
+    # directly (the parser resolves the source encoding itself), and
+    # gives the real filename in syntax errors for free.
+    visitor = _CombinedAstVisitor()
+    try:
+        visitor.visit(compile(raw, py_file_str, 'exec', ast.PyCF_ONLY_AST))
+    except (SyntaxError, ValueError):
+        pass
+
+    counters["functions_total"] = visitor.functions_total
+    counters["functions_with_try"] = visitor.functions_with_try
+    counters["functions_with_finally"] = visitor.functions_with_finally
+    counters["context_managers_used"] = visitor.context_managers_used
+    counters["bare_excepts"] = visitor.bare_excepts
+    counters["logging_calls"] = visitor.logging_calls
+    counters["windows_specific"] = visitor.windows_specific
+    counters["unix_specific"] = visitor.unix_specific
+    counters["platform_modules"] = visitor.platform_modules
+
+    if skip_regex:
+        return counters
+
+    # Bytes-level screen: run the regex only when one of the interesting
+    # substrings is present at all
+    lowered = raw.lower()
+    if not any(token in lowered for token in _PREFILTER_TOKENS):
+        return counters
+
+    for match in _COMBINED_RE.finditer(raw):
+        group = match.lastgroup
+        if group in _PATH_GROUPS:
+            text = match.group().decode('utf-8', 'replace')
+            if any(ok in text.lower() for ok in _ALLOWED_PATH_HINTS):
+                continue
+            counters["hardcoded_paths"] += 1
+            if len(counters["path_examples"]) < 5:
+                counters["path_examples"].append({
+                    "file": str(py_file.relative_to(project_dir_str)),
+                    "path": text[:50],
+                    "type": _PATH_GROUPS[group],
+                })
+        elif group == "platform_check":
+            counters["platform_checks"] += 1
+        elif group == "backup":
+            counters["config_backup"] = True
+        elif group == "shutdown":
+            counters["graceful_shutdown"] = True
+        elif group == "retry":
+            counters["retry_patterns"] += 1
+
+    return counters
+
+
+@lru_cache(maxsize=8)
+def _scan(project_dir_str: str, src_dir_str: str, tree_signature: int) -> Dict[str, Any]:
+    result: Dict[str, Any] = {key: 0 for key in _SUM_KEYS}
+    result.update({key: False for key in _OR_KEYS})
+    result["path_examples"] = []
+    result["platform_modules"] = []
+    result["scan_complete"] = True
+    result["error"] = None
+
+    def merge(counters: Dict[str, Any]) -> None:
+        for key in _SUM_KEYS:
+            result[key] += counters[key]
+        for key in _OR_KEYS:
+            result[key] = result[key] or counters[key]
+        if len(result["path_examples"]) < 5:
+            result["path_examples"].extend(
+                counters["path_examples"][:5 - len(result["path_examples"])]
+            )
+        result["platform_modules"].extend(counters["platform_modules"])
+
+    try:
+        files = [str(p) for p in walk_py_files(Path(src_dir_str))]
+        scan_one = partial(_scan_one_file, project_dir_str=project_dir_str)
+
+        # AST parsing is CPU-bound and holds the GIL, so parallelism needs
+        # processes; opt-in via env var since pool startup and result
+        # pickling make it a win only on large trees
+        if (os.environ.get("CLEANBOX_PARALLEL_SCAN") == "1"
+                and len(files) >= _PARALLEL_MIN_FILES):
+            with ProcessPoolExecutor(max_workers=min(8, os.cpu_count() or 1)) as ex:
+                for counters in ex.map(scan_one, files, chunksize=8):
+                    merge(counters)
+        else:
+            # Sequential path can stop paying for the regex once every
+            # regex-fed signal is pinned; remaining counts become lower
+            # bounds, flagged via scan_complete
+            saturated = False
+            for py_file_str in files:
+                merge(scan_one(py_file_str, skip_regex=saturated))
+                if not saturated and _regex_saturated(result):
+                    saturated = True
+                    result["scan_complete"] = False
+
+    except Exception as e:
+        result["error"] = str(e)
+
+    return result
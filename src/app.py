@@ -1,22 +1,23 @@
 """CleanBox Application Orchestrator."""
-import atexit
+import functools
 import logging
 import sys
 import time
 from typing import Optional
 
 from PyQt6.QtWidgets import QApplication, QMessageBox
-from PyQt6.QtCore import QObject, pyqtSlot, pyqtSignal
+from PyQt6.QtCore import QObject, QSharedMemory, Qt, QTimer, pyqtSlot, pyqtSignal
 from PyQt6.QtNetwork import QLocalServer, QLocalSocket
 
 from app_cleanup import do_cleanup, on_cleanup_finished, on_cleanup_progress
 from app_single_instance import acquire_single_instance
+from app_startup import StartupInitWorker
 from shared.config import ConfigManager
 from shared.constants import APP_NAME
 from shared.elevation import request_admin_restart
 from shared import registry
 from features.cleanup import CleanupService, CleanupProgressWorker, get_default_directories
-from features.storage_monitor import StorageMonitor, DriveInfo
+from features.storage_monitor import StorageMonitor, DriveInfo, DriveChangeEventFilter
 from features.notifications import NotificationService
 # from features.settings import SettingsWindow # Repaced by MainWindow
 from ui.main_window import MainWindow
@@ -28,6 +29,24 @@ logger = logging.getLogger(__name__)
 SINGLE_INSTANCE_KEY = "CleanBox_SingleInstance_Lock"
 
 
+def safe_slot(message: str):
+    """Wrap a slot body in the standard log-and-continue error guard.
+
+    Replaces the per-method try/except blocks so frequently fired slots
+    (e.g. cleanup progress) carry one shared exception handler instead of
+    duplicated setup/teardown bytecode in every method.
+    """
+    def decorator(fn):
+        @functools.wraps(fn)
+        def wrapper(self, *args, **kwargs):
+            try:
+                return fn(self, *args, **kwargs)
+            except Exception as e:
+                logger.error("%s: %s", message, e)
+        return wrapper
+    return decorator
+
+
 class App(QObject):
     """Main application orchestrator."""
 
@@ -55,7 +74,12 @@ class App(QObject):
             self._tray_icon: Optional[TrayIcon] = None
             self._qt_app: Optional[QApplication] = None
             self._cleanup_worker: Optional[CleanupProgressWorker] = None
+            self._cleanup_progress_timer: Optional[QTimer] = None
+            self._pending_cleanup_progress = None
+            self._startup_worker: Optional[StartupInitWorker] = None
+            self._drive_event_filter: Optional[DriveChangeEventFilter] = None
             self._startup_error: Optional[str] = None
+            self._cleaned = False
         except Exception as e:
             logger.error("Failed to init App: %s", e)
 
@@ -63,23 +87,25 @@ class App(QObject):
         """Start the application."""
         logger.info("Starting %s", APP_NAME)
 
-        # Register cleanup handler for graceful shutdown
-        atexit.register(self._cleanup_on_exit)
-
         try:
             # Create Qt application
             self._qt_app = QApplication(sys.argv)
             self._qt_app.setQuitOnLastWindowClosed(
                 False)  # Keep running in tray
 
+            # Run shutdown cleanup once from Qt's own quit hook instead
+            # of atexit, so a normal exit joins the worker threads a
+            # single time rather than from both _do_exit and atexit
+            self._qt_app.aboutToQuit.connect(self._cleanup_on_exit)
+
             # Check for existing instance
             if not self._acquire_single_instance():
                 logger.warning("Another instance is already running")
                 return 1 if self._startup_error else 0
 
-            # Handle first run - detect default directories
-            if self._config.is_first_run:
-                self._handle_first_run()
+            # First-run setup is deferred to the startup worker below so
+            # its filesystem detection and config writes don't delay the
+            # window and tray from appearing
 
             # Set up auto-start if enabled
             if self._config.auto_start_enabled:
@@ -89,44 +115,47 @@ class App(QObject):
             self._storage_monitor = StorageMonitor(
                 threshold_gb=self._config.threshold_gb,
                 interval_seconds=self._config.polling_interval,
+                adaptive=True,
             )
             self._storage_monitor.set_notified_drives(
                 self._config.get_notified_drive_timestamps())
+            # The monitor polls from a main-thread QTimer, so its signals
+            # never cross threads; DirectConnection skips the per-emission
+            # thread-affinity check AutoConnection performs
             self._storage_monitor.low_space_detected.connect(
-                self._on_low_space)
+                self._on_low_space, Qt.ConnectionType.DirectConnection)
             self._storage_monitor.low_space_cleared.connect(
-                self._on_low_space_cleared)
+                self._on_low_space_cleared, Qt.ConnectionType.DirectConnection)
             self._storage_monitor.start()
 
-            # Initialize Main Window and show on startup
-            self._main_window = MainWindow()
-            self._main_window.show()  # Show UI on startup
-
-            # Connect MainWindow signals to App handlers
-            self._main_window.directory_added.connect(self._on_directory_added)
-            self._main_window.directory_removed.connect(
-                self._on_directory_removed)
-            self._main_window.autostart_changed.connect(
-                self._on_autostart_changed)
-            self._main_window.threshold_changed.connect(
-                self._on_threshold_changed)
-            self._main_window.interval_changed.connect(
-                self._on_interval_changed)
-            self._main_window.restart_as_admin_requested.connect(
-                self._restart_with_admin)
-            self._main_window.cleanup_requested.connect(self._do_cleanup)
-            self._main_window.refresh_storage.connect(
+            # Refresh on drive arrival/removal instead of re-enumerating
+            # volumes every poll; the filter also drops the cached
+            # topology the monitor polls against
+            self._drive_event_filter = DriveChangeEventFilter(
                 self._refresh_storage_data)
-
-            # Initialize views with current data
-            self._main_window.update_directories(
-                self._config.cleanup_directories)
-            self._main_window.set_autostart(self._config.auto_start_enabled)
-            self._main_window.set_threshold(self._config.threshold_gb)
-            self._main_window.set_interval(self._config.polling_interval)
-
-            # Get initial drive data
-            self._refresh_storage_data()
+            self._qt_app.installNativeEventFilter(self._drive_event_filter)
+
+            # Construct the main window only when it will actually be
+            # shown; sessions configured to start hidden to tray defer
+            # the whole QWidget tree until the user first opens it
+            if self._config.show_on_startup:
+                self._get_main_window().show()
+
+            # Run first-run setup and the initial drive enumeration in
+            # the background; results arrive back on the UI thread via
+            # queued signal delivery
+            self._startup_worker = StartupInitWorker(
+                handle_first_run=(
+                    self._handle_first_run
+                    if self._config.is_first_run else None
+                ),
+                get_drives=self._storage_monitor.get_all_drives,
+            )
+            self._startup_worker.first_run_complete.connect(
+                self._on_startup_first_run_complete)
+            self._startup_worker.drives_ready.connect(
+                self._on_startup_drives_ready)
+            self._startup_worker.start()
 
             # Initialize tray icon (use signal emitters for thread-safe calls)
             self._tray_icon = TrayIcon(
@@ -150,11 +179,49 @@ class App(QObject):
             self._cleanup_on_exit()
             return 1
 
+    def _get_main_window(self) -> MainWindow:
+        """Return the main window, constructing and wiring it on first use.
+
+        Keeps the window's QWidget tree, signal wiring and initial data
+        push off the startup path for tray-only sessions.
+        """
+        if self._main_window is None:
+            window = MainWindow()
+
+            # Connect MainWindow signals to App handlers; the window and
+            # App both live on the main thread, so the hops are tagged
+            # DirectConnection (worker-thread signals stay on the default
+            # AutoConnection, which queues across threads)
+            direct = Qt.ConnectionType.DirectConnection
+            window.directory_added.connect(self._on_directory_added, direct)
+            window.directory_removed.connect(
+                self._on_directory_removed, direct)
+            window.autostart_changed.connect(
+                self._on_autostart_changed, direct)
+            window.threshold_changed.connect(
+                self._on_threshold_changed, direct)
+            window.interval_changed.connect(self._on_interval_changed, direct)
+            window.restart_as_admin_requested.connect(
+                self._restart_with_admin, direct)
+            window.cleanup_requested.connect(self._do_cleanup, direct)
+            window.refresh_storage.connect(self._refresh_storage_data, direct)
+
+            # Initialize views with current data
+            window.update_directories(self._config.cleanup_directories)
+            window.set_autostart(self._config.auto_start_enabled)
+            window.set_threshold(self._config.threshold_gb)
+            window.set_interval(self._config.polling_interval)
+
+            self._main_window = window
+            if self._storage_monitor:
+                self._refresh_storage_data()
+        return self._main_window
+
     def _acquire_single_instance(self) -> bool:
         """Check if this is the only instance running.
 
-        Uses QLocalServer to ensure only one instance runs at a time.
-        If another instance exists, sends a 'show' command to it.
+        Uses a QSharedMemory page as the lock and a QLocalServer (owner
+        side only) for the 'show' command a second launch sends.
         Detects and removes stale locks left by crashed instances (R-008, FM-CB-012).
         Returns True if this is the first instance, False otherwise.
         """
@@ -164,6 +231,7 @@ class App(QObject):
             logger=logger,
             socket_cls=QLocalSocket,
             server_cls=QLocalServer,
+            shared_memory_cls=QSharedMemory,
         )
 
     def _handle_new_connection(self) -> None:
@@ -182,11 +250,20 @@ class App(QObject):
             logger.error("Failed to handle new connection: %s", e)
 
     def _cleanup_on_exit(self) -> None:
-        """Cleanup resources on exit (called by atexit)."""
+        """Cleanup resources on exit (fired once via aboutToQuit)."""
+        if self._cleaned:
+            return
+        self._cleaned = True
         logger.info("Cleaning up resources...")
         try:
             if hasattr(self, '_local_server') and self._local_server:
                 self._local_server.close()
+            if hasattr(self, '_shared_memory') and self._shared_memory:
+                self._shared_memory.detach()
+            if self._startup_worker and self._startup_worker.isRunning():
+                self._startup_worker.wait(1000)
+            if self._cleanup_worker and self._cleanup_worker.isRunning():
+                self._cleanup_worker.wait(1000)
             if self._storage_monitor:
                 self._storage_monitor.stop()
             if self._tray_icon:
@@ -199,56 +276,45 @@ class App(QObject):
         try:
             logger.info("First run detected, setting up defaults")
 
-            # Detect and add default directories
+            # Detect and add default directories, folding the first-run
+            # flag into the same single config save
             default_dirs = get_default_directories()
-            for directory in default_dirs:
-                self._config.add_directory(directory)
-
-            # Mark first run complete
-            self._config.mark_first_run_complete()
+            self._config.add_directories(
+                default_dirs, mark_first_run_complete=True
+            )
             logger.info("First run setup complete")
         except Exception as e:
             logger.error("Failed to handle first run: %s", e)
 
     @pyqtSlot(DriveInfo)
+    @safe_slot("Failed to handle low space")
     def _on_low_space(self, drive: DriveInfo) -> None:
         """Handle low space detection."""
-        try:
-            self._notification_service.notify_low_space(
-                drive.letter, drive.free_gb)
-            self._config.add_notified_drive(drive.letter, time.time())
-        except Exception as e:
-            logger.error("Failed to handle low space: %s", e)
+        self._notification_service.notify_low_space(
+            drive.letter, drive.free_gb)
+        self._config.add_notified_drive(drive.letter, time.time())
 
     @pyqtSlot(str)
+    @safe_slot("Failed to handle low space recovery")
     def _on_low_space_cleared(self, drive_letter: str) -> None:
         """Handle low space recovery and clear persisted notification state."""
-        try:
-            self._config.remove_notified_drive(drive_letter)
-        except Exception as e:
-            logger.error("Failed to handle low space recovery for %s: %s", drive_letter, e)
+        self._config.remove_notified_drive(drive_letter)
 
     # Signal emitters (called from pystray thread)
+    @safe_slot("Failed to emit cleanup signal")
     def _emit_cleanup(self) -> None:
         """Emit cleanup signal (thread-safe)."""
-        try:
-            self._cleanup_signal.emit()
-        except Exception as e:
-            logger.error("Failed to emit cleanup signal: %s", e)
+        self._cleanup_signal.emit()
 
+    @safe_slot("Failed to emit show settings signal")
     def _emit_show_settings(self) -> None:
         """Emit show settings signal (thread-safe)."""
-        try:
-            self._show_settings_signal.emit()
-        except Exception as e:
-            logger.error("Failed to emit show settings signal: %s", e)
+        self._show_settings_signal.emit()
 
+    @safe_slot("Failed to emit exit signal")
     def _emit_exit(self) -> None:
         """Emit exit signal (thread-safe)."""
-        try:
-            self._exit_signal.emit()
-        except Exception as e:
-            logger.error("Failed to emit exit signal: %s", e)
+        self._exit_signal.emit()
 
     @pyqtSlot()
     def _do_cleanup(self) -> None:
@@ -256,87 +322,107 @@ class App(QObject):
         do_cleanup(self, QMessageBox, CleanupProgressWorker, logger)
 
     @pyqtSlot(int, int)
+    @safe_slot("Failed to handle cleanup progress")
     def _on_cleanup_progress(self, current: int, total: int) -> None:
-        """Handle cleanup progress update from worker."""
-        on_cleanup_progress(self, current, total, logger)
+        """Handle cleanup progress update from worker.
+
+        Throttled: the first update in a burst is shown immediately, the
+        rest coalesce into at most one UI/tray update per 100ms so rapid
+        worker progress cannot flood the main-thread event queue.
+        """
+        timer = self._cleanup_progress_timer
+        if timer is None:
+            timer = QTimer(self)
+            timer.setSingleShot(True)
+            timer.setInterval(100)
+            timer.timeout.connect(self._flush_cleanup_progress)
+            self._cleanup_progress_timer = timer
+
+        if timer.isActive():
+            self._pending_cleanup_progress = (current, total)
+        else:
+            on_cleanup_progress(self, current, total, logger)
+            timer.start()
+
+    @pyqtSlot()
+    def _flush_cleanup_progress(self) -> None:
+        """Push the latest progress coalesced during the throttle window."""
+        pending = self._pending_cleanup_progress
+        if pending is not None:
+            self._pending_cleanup_progress = None
+            on_cleanup_progress(self, pending[0], pending[1], logger)
 
     @pyqtSlot(object)
     def _on_cleanup_finished(self, result) -> None:
-        """Handle cleanup completion from worker."""
+        """Handle cleanup completion from worker.
+
+        Cancels the progress throttle first: a parked update flushed
+        after completion would overwrite the reset tray status with a
+        stale "Cleaning N/N..." message.
+        """
+        if self._cleanup_progress_timer is not None:
+            self._cleanup_progress_timer.stop()
+        self._pending_cleanup_progress = None
         on_cleanup_finished(self, result, logger)
 
     @pyqtSlot()
+    @safe_slot("Failed to show settings")
     def _do_show_settings(self) -> None:
         """Show the main window (formerly settings)."""
-        try:
-            if self._main_window:
-                self._main_window.show()
-                self._main_window.raise_()
-                self._main_window.activateWindow()
-        except Exception as e:
-            logger.error("Failed to show settings: %s", e)
+        window = self._get_main_window()
+        window.show()
+        window.raise_()
+        window.activateWindow()
 
     @pyqtSlot()
+    @safe_slot("Failed to exit properly")
     def _do_exit(self) -> None:
-        """Handle exit request."""
-        try:
-            logger.info("Exiting %s", APP_NAME)
-            if self._storage_monitor:
-                self._storage_monitor.stop()
-            if self._tray_icon:
-                self._tray_icon.stop()
-            if self._qt_app:
-                self._qt_app.quit()
-        except Exception as e:
-            logger.error("Failed to exit properly: %s", e)
+        """Handle exit request.
+
+        Service shutdown happens in _cleanup_on_exit via aboutToQuit,
+        so quitting here stops the monitor and tray exactly once.
+        """
+        logger.info("Exiting %s", APP_NAME)
+        if self._qt_app:
+            self._qt_app.quit()
 
     @pyqtSlot(str)
+    @safe_slot("Failed to add directory")
     def _on_directory_added(self, path: str) -> None:
         """Handle directory added."""
-        try:
-            self._config.add_directory(path)
-        except Exception as e:
-            logger.error("Failed to add directory %s: %s", path, e)
+        self._config.add_directory(path)
 
     @pyqtSlot(str)
+    @safe_slot("Failed to remove directory")
     def _on_directory_removed(self, path: str) -> None:
         """Handle directory removed."""
-        try:
-            self._config.remove_directory(path)
-        except Exception as e:
-            logger.error("Failed to remove directory %s: %s", path, e)
+        self._config.remove_directory(path)
 
     @pyqtSlot(bool)
+    @safe_slot("Failed to change autostart")
     def _on_autostart_changed(self, enabled: bool) -> None:
         """Handle auto-start toggle."""
-        try:
-            self._config.auto_start_enabled = enabled
-            if enabled:
-                registry.enable_autostart()
-            else:
-                registry.disable_autostart()
-        except Exception as e:
-            logger.error("Failed to change autostart to %s: %s", enabled, e)
+        self._config.auto_start_enabled = enabled
+        if enabled:
+            registry.enable_autostart()
+        else:
+            registry.disable_autostart()
 
     @pyqtSlot(int)
+    @safe_slot("Failed to change threshold")
     def _on_threshold_changed(self, value: int) -> None:
         """Handle low-space threshold updates from settings."""
-        try:
-            self._config.threshold_gb = value
-            if self._storage_monitor:
-                self._storage_monitor.update_threshold(value)
-        except Exception as e:
-            logger.error("Failed to change threshold to %s: %s", value, e)
+        self._config.threshold_gb = value
+        if self._storage_monitor:
+            self._storage_monitor.update_threshold(value)
 
     @pyqtSlot(int)
+    @safe_slot("Failed to change polling interval")
     def _on_interval_changed(self, value: int) -> None:
         """Handle polling interval updates from settings."""
-        try:
-            self._config.polling_interval = value
-            if self._storage_monitor:
-                self._storage_monitor.update_interval(value)
-        except Exception as e:
-            logger.error("Failed to change polling interval to %s: %s", value, e)
+        self._config.polling_interval = value
+        if self._storage_monitor:
+            self._storage_monitor.update_interval(value)
 
     @pyqtSlot()
     def _restart_with_admin(self) -> None:
@@ -365,12 +451,26 @@ class App(QObject):
             )
 
     @pyqtSlot()
+    @safe_slot("Failed to apply first-run directories")
+    def _on_startup_first_run_complete(self) -> None:
+        """Push directories detected during first-run setup to the UI."""
+        if self._main_window:
+            self._main_window.update_directories(
+                self._config.cleanup_directories)
+
+    @pyqtSlot(object)
+    @safe_slot("Failed to apply initial drive data")
+    def _on_startup_drives_ready(self, drives) -> None:
+        """Apply the initial drive data produced by the startup worker."""
+        if self._main_window:
+            self._main_window.update_drives(drives)
+            logger.info("Storage data refreshed")
+
+    @pyqtSlot()
+    @safe_slot("Failed to refresh storage data")
     def _refresh_storage_data(self) -> None:
         """Refresh storage data and update UI."""
-        try:
-            if self._storage_monitor and self._main_window:
-                drives = self._storage_monitor.get_all_drives()
-                self._main_window.update_drives(drives)
-                logger.info("Storage data refreshed")
-        except Exception as e:
-            logger.error("Failed to refresh storage data: %s", e)
+        if self._storage_monitor and self._main_window:
+            drives = self._storage_monitor.get_all_drives()
+            self._main_window.update_drives(drives)
+            logger.info("Storage data refreshed")
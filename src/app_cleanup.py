@@ -1,6 +1,11 @@
 """Cleanup flow helpers extracted from App."""
 from __future__ import annotations
 
+import logging
+import os
+
+from shared.constants import RECYCLE_BIN_MARKER
+
 
 def do_cleanup(app, message_box_cls, cleanup_worker_cls, logger) -> None:
     """Start cleanup flow with confirmation and background worker."""
@@ -14,6 +19,16 @@ def do_cleanup(app, message_box_cls, cleanup_worker_cls, logger) -> None:
             logger.info("No directories to clean")
             return
 
+        # Group directories by drive so deletes saturate one volume's
+        # queue at a time instead of interleaving devices; the Recycle
+        # Bin is emptied last, after items have been recycled into it
+        directories.sort(
+            key=lambda p: (
+                p == RECYCLE_BIN_MARKER,
+                os.path.splitdrive(p)[0].lower(),
+            )
+        )
+
         dir_list = "\n".join(f"  • {directory}" for directory in directories)
         result = message_box_cls.warning(
             app._main_window,
@@ -35,10 +50,15 @@ def do_cleanup(app, message_box_cls, cleanup_worker_cls, logger) -> None:
         if app._tray_icon:
             app._tray_icon.set_status("Starting cleanup...")
 
-        app._cleanup_worker = cleanup_worker_cls(directories, parent=app)
-        app._cleanup_worker.progress_updated.connect(app._on_cleanup_progress)
-        app._cleanup_worker.cleanup_finished.connect(app._on_cleanup_finished)
-        app._cleanup_worker.start()
+        # Build and wire the worker once; repeat cleanups reuse it and
+        # only pay for the thread restart
+        worker = app._cleanup_worker
+        if worker is None:
+            worker = cleanup_worker_cls(parent=app)
+            worker.progress_updated.connect(app._on_cleanup_progress)
+            worker.cleanup_finished.connect(app._on_cleanup_finished)
+            app._cleanup_worker = worker
+        worker.submit(directories)
     except Exception as error:
         logger.error("Failed to start cleanup: %s", error)
         if app._main_window:
@@ -61,12 +81,15 @@ def on_cleanup_progress(app, current: int, total: int, logger) -> None:
 def on_cleanup_finished(app, result, logger) -> None:
     """Finalize cleanup flow."""
     try:
-        logger.info(
-            "Cleanup finished: %d files, %d folders, %.2f MB",
-            result.total_files,
-            result.total_folders,
-            result.total_size_mb,
-        )
+        # Gate on level: the arguments cost attribute loads and a
+        # property call even when INFO is filtered out
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                "Cleanup finished: %d files, %d folders, %.2f MB",
+                result.total_files,
+                result.total_folders,
+                result.total_size_mb,
+            )
 
         if app._main_window:
             app._main_window.show_cleanup_progress(False)
@@ -79,6 +102,6 @@ def on_cleanup_finished(app, result, logger) -> None:
             size_mb=result.total_size_mb,
             errors=len(result.errors),
         )
-        app._cleanup_worker = None
+        # The worker instance is kept for the next cleanup
     except Exception as error:
         logger.error("Failed to handle cleanup completion: %s", error)
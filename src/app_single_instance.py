@@ -4,6 +4,7 @@ from __future__ import annotations
 
 from typing import Any
 
+from PyQt6.QtCore import QSharedMemory
 from PyQt6.QtNetwork import QLocalServer, QLocalSocket
 
 
@@ -13,22 +14,63 @@ def acquire_single_instance(
     logger,
     socket_cls: Any = QLocalSocket,
     server_cls: Any = QLocalServer,
+    shared_memory_cls: Any = QSharedMemory,
 ) -> bool:
-    """Acquire single-instance lock or signal existing instance to show."""
+    """Acquire single-instance lock or signal existing instance to show.
+
+    The lock itself is a QSharedMemory page: one O(1) create on the
+    common cold start, released by the kernel even if the process
+    crashes. The QLocalServer only exists on the owner side, for the
+    'show' command a second launch sends.
+    """
     app._startup_error = None
     try:
-        socket = socket_cls()
-        socket.connectToServer(single_instance_key)
+        shared_memory = shared_memory_cls(single_instance_key)
+
+        if not shared_memory.create(1):
+            # Another instance appears to hold the lock: ask it to show
+            # itself. The connect fails immediately with a definite
+            # error when no listener exists, so only a still-pending
+            # connection gets a short grace period.
+            socket = socket_cls()
+            socket.connectToServer(single_instance_key)
+            connected = (
+                socket.state() == QLocalSocket.LocalSocketState.ConnectedState
+            )
+            if not connected and socket.error() not in (
+                QLocalSocket.LocalSocketError.ServerNotFoundError,
+                QLocalSocket.LocalSocketError.ConnectionRefusedError,
+            ):
+                connected = socket.waitForConnected(50)
+
+            if connected:
+                socket.write(b"show")
+                socket.waitForBytesWritten(1000)
+                socket.close()
+                logger.info("Sent 'show' command to existing instance")
+                return False
 
-        if socket.waitForConnected(500):
-            socket.write(b"show")
-            socket.waitForBytesWritten(1000)
             socket.close()
-            logger.info("Sent 'show' command to existing instance")
-            return False
-
-        socket.close()
 
+            # No listener answered: the segment is stale (possible on
+            # non-Windows after a crash). Attach/detach reclaims it.
+            logger.warning(
+                "Stale shared-memory lock detected for '%s'. Reclaiming...",
+                single_instance_key,
+            )
+            shared_memory.attach()
+            shared_memory.detach()
+            if not shared_memory.create(1):
+                app._startup_error = (
+                    "Failed to acquire single-instance lock: "
+                    f"{shared_memory.errorString()}"
+                )
+                logger.error(app._startup_error)
+                return False
+
+        app._shared_memory = shared_memory
+
+        # Owner path: start the IPC server second launches signal through
         app._local_server = server_cls()
 
         if app._local_server.listen(single_instance_key):
@@ -37,31 +79,14 @@ def acquire_single_instance(
             return True
 
         logger.warning(
-            "Cannot listen on '%s': %s. Checking for stale lock...",
+            "Cannot listen on '%s': %s. Checking for stale socket...",
             single_instance_key,
             app._local_server.errorString(),
         )
-
-        stale_check = socket_cls()
-        stale_check.connectToServer(single_instance_key)
-
-        if stale_check.waitForConnected(2000):
-            stale_check.write(b"show")
-            stale_check.waitForBytesWritten(1000)
-            stale_check.close()
-            logger.info("Confirmed another instance is running")
-            return False
-
-        stale_check.close()
-
-        logger.warning(
-            "Stale lock detected for '%s'. Removing and retrying...",
-            single_instance_key,
-        )
         server_cls.removeServer(single_instance_key)
 
         if app._local_server.listen(single_instance_key):
-            logger.info("Single instance lock acquired after stale lock cleanup")
+            logger.info("Single instance lock acquired after stale socket cleanup")
             app._local_server.newConnection.connect(app._handle_new_connection)
             return True
 
@@ -70,6 +95,8 @@ def acquire_single_instance(
             f"{app._local_server.errorString()}"
         )
         logger.error(app._startup_error)
+        shared_memory.detach()
+        app._shared_memory = None
         return False
     except Exception as exc:
         app._startup_error = f"Single instance check failed: {exc}"
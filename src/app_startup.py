@@ -0,0 +1,55 @@
+"""Startup worker - runs blocking first-launch work off the Qt main thread."""
+import logging
+from typing import Callable, List, Optional
+
+from PyQt6.QtCore import QThread, pyqtSignal
+
+logger = logging.getLogger(__name__)
+
+
+class StartupInitWorker(QThread):
+    """Background worker for startup work that would block the event loop.
+
+    Runs first-run setup (filesystem detection plus config writes) and
+    the initial drive enumeration, emitting results back to the UI
+    thread so the window and tray appear without waiting on either.
+    """
+
+    first_run_complete = pyqtSignal()
+    drives_ready = pyqtSignal(object)  # list of DriveInfo
+
+    def __init__(
+        self,
+        handle_first_run: Optional[Callable[[], None]] = None,
+        get_drives: Optional[Callable[[], List]] = None,
+        parent=None,
+    ):
+        """Initialize the startup worker.
+
+        Args:
+            handle_first_run: First-run setup callable, or None when not
+                a first run.
+            get_drives: Callable returning the current drive list.
+            parent: Optional parent QObject.
+        """
+        try:
+            super().__init__(parent)
+            self._handle_first_run = handle_first_run
+            self._get_drives = get_drives
+        except Exception as e:
+            logger.error("Failed to init StartupInitWorker: %s", e)
+
+    def run(self) -> None:
+        """Execute startup work in background thread."""
+        try:
+            if self._handle_first_run is not None:
+                self._handle_first_run()
+                self.first_run_complete.emit()
+        except Exception as e:
+            logger.error("Startup first-run setup failed: %s", e)
+
+        try:
+            if self._get_drives is not None:
+                self.drives_ready.emit(self._get_drives())
+        except Exception as e:
+            logger.error("Startup drive enumeration failed: %s", e)
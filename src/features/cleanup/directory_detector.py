@@ -1,35 +1,83 @@
 """Directory detector - Auto-detect default cleanup directories."""
+import ctypes
+import functools
 import logging
 from pathlib import Path
-from typing import List
+from typing import List, Tuple
 
 from shared.constants import RECYCLE_BIN_MARKER
 
 logger = logging.getLogger(__name__)
 
 
+class _GUID(ctypes.Structure):
+    """Windows GUID layout for SHGetKnownFolderPath."""
+    _fields_ = [
+        ("Data1", ctypes.c_uint32),
+        ("Data2", ctypes.c_uint16),
+        ("Data3", ctypes.c_uint16),
+        ("Data4", ctypes.c_ubyte * 8),
+    ]
+
+
+# FOLDERID_Downloads {374DE290-123F-4565-9164-39C4925E467B}
+_FOLDERID_DOWNLOADS = _GUID(
+    0x374DE290, 0x123F, 0x4565,
+    (ctypes.c_ubyte * 8)(0x91, 0x64, 0x39, 0xC4, 0x92, 0x5E, 0x46, 0x7B),
+)
+
+
+def _downloads_from_known_folder() -> str:
+    """Resolve Downloads via the Shell's SHGetKnownFolderPath.
+
+    Returns the true folder even when the user relocated it through
+    Explorer, which the USERPROFILE join cannot see. Raises when the
+    Shell API is unavailable; callers fall back to the profile path.
+    """
+    path_ptr = ctypes.c_wchar_p()
+    result = ctypes.windll.shell32.SHGetKnownFolderPath(
+        ctypes.byref(_FOLDERID_DOWNLOADS), 0, None, ctypes.byref(path_ptr)
+    )
+    try:
+        if result == 0 and path_ptr.value:
+            return path_ptr.value
+        return ""
+    finally:
+        ctypes.windll.ole32.CoTaskMemFree(path_ptr)
+
+
+@functools.lru_cache(maxsize=1)
 def get_downloads_folder() -> str:
     """
     Get the Downloads folder path for current user.
     Works on any Windows machine regardless of username.
+    Detected once per process: the folder does not move at runtime,
+    so repeat callers skip the Shell call and the logging.
     """
     try:
-        downloads = Path.home() / "Downloads"
-        if downloads.exists():
+        try:
+            downloads = _downloads_from_known_folder()
+        except Exception as e:
+            logger.debug("SHGetKnownFolderPath unavailable: %s", e)
+            downloads = ""
+        if downloads:
             logger.info("Detected Downloads folder: %s", downloads)
-            return str(downloads)
-        logger.warning("Downloads folder not found at %s", downloads)
+            return downloads
+
+        fallback = Path.home() / "Downloads"
+        if fallback.exists():
+            logger.info("Detected Downloads folder: %s", fallback)
+            return str(fallback)
+        logger.warning("Downloads folder not found at %s", fallback)
         return ""
     except Exception as e:
         logger.error("Failed to detect Downloads folder: %s", e)
         return ""
 
 
-def get_default_directories() -> List[str]:
-    """
-    Get list of default cleanup directories.
-    Includes Downloads folder and Recycle Bin marker.
-    """
+@functools.lru_cache(maxsize=1)
+def _detect_default_directories() -> Tuple[str, ...]:
+    """Cached detection core: runs (and logs) once per process."""
     try:
         directories = []
 
@@ -42,7 +90,17 @@ def get_default_directories() -> List[str]:
         directories.append(RECYCLE_BIN_MARKER)
 
         logger.info("Default directories detected: %s", directories)
-        return directories
+        return tuple(directories)
     except Exception as e:
         logger.error("Failed to get default directories: %s", e)
-        return [RECYCLE_BIN_MARKER]
+        return (RECYCLE_BIN_MARKER,)
+
+
+def get_default_directories() -> List[str]:
+    """
+    Get list of default cleanup directories.
+    Includes Downloads folder and Recycle Bin marker.
+    Detection is cached; each call returns a fresh list copy so
+    callers stay free to mutate the result.
+    """
+    return list(_detect_default_directories())
@@ -1,6 +1,9 @@
 """Cleanup service - Delete files from configured directories."""
+import ctypes
+import functools
 import logging
-import shutil
+import os
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
 from typing import List
@@ -12,8 +15,50 @@ from shared.utils import is_protected_path, ProtectedPathError
 
 logger = logging.getLogger(__name__)
 
+# Resolved once; None outside Windows, where the os.* calls are used.
+try:
+    _kernel32 = ctypes.windll.kernel32
+    _kernel32.DeleteFileW.argtypes = [ctypes.c_wchar_p]
+    _kernel32.RemoveDirectoryW.argtypes = [ctypes.c_wchar_p]
+except AttributeError:
+    _kernel32 = None
 
-@dataclass
+_FILE_ATTRIBUTE_NORMAL = 0x80
+
+# NTFS deletes are bound by MFT transaction latency, not throughput;
+# a handful of concurrent deletes hides most of it, more just contends.
+_DELETE_WORKERS = 4
+
+
+def _delete_file(path: str) -> None:
+    """Delete one file, going straight to kernel32 on Windows.
+
+    DeleteFileW is a single syscall on the success path; a failure
+    clears the read-only attribute and retries once, then defers to
+    os.unlink so the caller sees a normal OSError with errno set.
+    """
+    if _kernel32 is None:
+        os.unlink(path)
+        return
+    if _kernel32.DeleteFileW(path):
+        return
+    _kernel32.SetFileAttributesW(path, _FILE_ATTRIBUTE_NORMAL)
+    if _kernel32.DeleteFileW(path):
+        return
+    os.unlink(path)
+
+
+def _remove_dir(path: str) -> None:
+    """Remove one empty directory via RemoveDirectoryW when available."""
+    if _kernel32 is None:
+        os.rmdir(path)
+        return
+    if _kernel32.RemoveDirectoryW(path):
+        return
+    os.rmdir(path)
+
+
+@dataclass(slots=True)
 class CleanupResult:
     """Result of a cleanup operation."""
     total_files: int = 0
@@ -41,7 +86,7 @@ class CleanupResult:
 class CleanupService:
     """Service for cleaning up directories."""
 
-    def _recycle_item(self, item: Path) -> bool:
+    def _recycle_item(self, item: str) -> bool:
         """Move an item to the Recycle Bin when Windows supports it."""
         try:
             winshell.delete_file(
@@ -55,10 +100,15 @@ class CleanupService:
             logger.debug("Recycle Bin move failed for %s: %s", item, e)
             return False
 
-    def cleanup_directory(self, path: str) -> CleanupResult:
+    def cleanup_directory(self, path: str, defer_recycled: bool = False) -> CleanupResult:
         """
         Clean up a single directory by deleting all its contents.
         The directory itself is preserved.
+
+        With defer_recycled=True (the Recycle Bin is emptied later in
+        the same run), successfully recycled items are not counted here;
+        the bin query reports them once at empty time. Without it, every
+        item is counted at delete time as usual.
         """
         result = CleanupResult()
 
@@ -80,30 +130,30 @@ class CleanupService:
             result.errors.append(f"Not a directory: {path}")
             return result
 
-        for item in dir_path.iterdir():
-            try:
-                if item.is_file():
-                    size = item.stat().st_size
-                    recycled = self._recycle_item(item)
-                    # Some recycle APIs can silently no-op; verify source is gone.
-                    if (not recycled) or item.exists():
-                        item.unlink()
-                    result.total_files += 1
-                    result.total_size_bytes += size
-                elif item.is_dir():
-                    size = self._get_dir_size(item)
-                    recycled = self._recycle_item(item)
-                    # Ensure directory is actually removed even if recycle reports success.
-                    if (not recycled) or item.exists():
-                        shutil.rmtree(item)
-                    result.total_folders += 1
-                    result.total_size_bytes += size
-            except PermissionError:
-                logger.warning("Permission denied: %s", item)
-                result.errors.append(f"Permission denied: {item}")
-            except Exception as e:
-                logger.error("Error deleting %s: %s", item, e)
-                result.errors.append(f"Error: {item} - {e}")
+        # DirEntry type checks reuse the data the enumeration returned,
+        # so each entry costs one listing share plus at most one stat
+        with os.scandir(path) as iterator:
+            entries = list(iterator)
+
+        # Fan top-level entries out across a small pool; aggregation
+        # stays on the calling thread
+        delete_entry = functools.partial(
+            self._delete_entry, defer_recycled=defer_recycled
+        )
+        if len(entries) > 1:
+            with ThreadPoolExecutor(
+                max_workers=min(_DELETE_WORKERS, len(entries))
+            ) as pool:
+                outcomes = list(pool.map(delete_entry, entries))
+        else:
+            outcomes = [delete_entry(entry) for entry in entries]
+
+        for files, folders, size, error in outcomes:
+            result.total_files += files
+            result.total_folders += folders
+            result.total_size_bytes += size
+            if error is not None:
+                result.errors.append(error)
 
         logger.info(
             "Cleaned %s: %d files, %d folders, %.2f MB",
@@ -114,9 +164,42 @@ class CleanupService:
         )
         return result
 
+    def _query_recycle_bin_info(self):
+        """Query Recycle Bin totals via SHQueryRecycleBinW.
+
+        Returns (size_bytes, item_count). This is a shell32 metadata
+        read, so it stays cheap even for bins with thousands of items;
+        raises OSError when the shell reports a failure HRESULT.
+        """
+        import ctypes
+
+        class SHQUERYRBINFO(ctypes.Structure):
+            _fields_ = [
+                ("cbSize", ctypes.c_ulong),
+                ("i64Size", ctypes.c_int64),
+                ("i64NumItems", ctypes.c_int64),
+            ]
+
+        info = SHQUERYRBINFO()
+        info.cbSize = ctypes.sizeof(info)
+        hresult = ctypes.windll.shell32.SHQueryRecycleBinW(None, ctypes.byref(info))
+        if hresult != 0:
+            raise OSError(f"SHQueryRecycleBinW failed with HRESULT {hresult}")
+        return int(info.i64Size), int(info.i64NumItems)
+
     def empty_recycle_bin(self) -> CleanupResult:
         """Empty the Windows Recycle Bin."""
         result = CleanupResult()
+
+        # Read the totals before emptying so notifications can report
+        # the freed space without ever enumerating the bin from Python
+        try:
+            size_bytes, item_count = self._query_recycle_bin_info()
+            result.total_size_bytes = size_bytes
+            result.total_files = item_count
+        except Exception as e:
+            logger.warning("Could not query Recycle Bin totals: %s", e)
+
         try:
             winshell.recycle_bin().empty(confirm=False, show_progress=False, sound=False)
             logger.info("Recycle Bin emptied")
@@ -138,6 +221,11 @@ class CleanupService:
         """Clean up all configured directories."""
         total_result = CleanupResult()
 
+        # When the bin marker is in the run (sorted last by do_cleanup),
+        # recycled items defer their totals to the bin query so they are
+        # never counted both at delete time and at empty time
+        defer_recycled = RECYCLE_BIN_MARKER in directories
+
         try:
             for directory in directories:
                 if directory == RECYCLE_BIN_MARKER:
@@ -149,7 +237,9 @@ class CleanupService:
                             f"Skipped (path not found): {directory}"
                         )
                         continue
-                    result = self.cleanup_directory(directory)
+                    result = self.cleanup_directory(
+                        directory, defer_recycled=defer_recycled
+                    )
 
                 total_result.total_files += result.total_files
                 total_result.total_folders += result.total_folders
@@ -161,16 +251,125 @@ class CleanupService:
 
         return total_result
 
+    def _delete_entry(self, entry, defer_recycled: bool = False):
+        """Delete one top-level entry; returns (files, folders, bytes, error).
+
+        Runs on a pool worker, so all bookkeeping stays in the returned
+        tuple and errors come back as strings instead of raising. With
+        defer_recycled=True, items that actually reached the Recycle Bin
+        report zero here so the bin query counts them exactly once.
+        """
+        try:
+            if entry.is_file(follow_symlinks=False):
+                size = entry.stat(follow_symlinks=False).st_size
+                recycled = self._recycle_item(entry.path)
+                # Some recycle APIs can silently no-op; verify source is gone.
+                if (not recycled) or os.path.exists(entry.path):
+                    _delete_file(entry.path)
+                elif defer_recycled:
+                    # In the bin now; counted when the bin empties
+                    return (0, 0, 0, None)
+                return (1, 0, size, None)
+            if entry.is_dir(follow_symlinks=False):
+                # The sizing pre-walk can only be skipped when the bin
+                # query reports the recycled tree later in this run;
+                # otherwise measure before the tree enters the bin
+                size = 0 if defer_recycled else self._get_dir_size(entry.path)
+                recycled = self._recycle_item(entry.path)
+                # Ensure directory is actually removed even if recycle reports success.
+                if (not recycled) or os.path.exists(entry.path):
+                    # Measures while it deletes, so the tree is walked
+                    # once instead of a sizing pass followed by a
+                    # second removal traversal
+                    _files, _folders, size = self._delete_tree_measuring(entry.path)
+                return (0, 1, size, None)
+            return (0, 0, 0, None)
+        except PermissionError:
+            logger.warning("Permission denied: %s", entry.path)
+            return (0, 0, 0, f"Permission denied: {entry.path}")
+        except Exception as e:
+            logger.error("Error deleting %s: %s", entry.path, e)
+            return (0, 0, 0, f"Error: {entry.path} - {e}")
+
+    def _delete_tree_measuring(self, path: str):
+        """Delete a directory tree, measuring it in the same traversal.
+
+        Returns (files, folders, bytes). Sizes come from the scandir
+        pass that drives the deletes, so each entry is visited once
+        instead of once for sizing and again for removal. Entries that
+        cannot be deleted are skipped at debug level; a failure removing
+        the root directory itself propagates to the caller.
+        """
+        total_files = 0
+        total_dirs = 0
+        total_bytes = 0
+        pending_dirs = [str(path)]
+        stack = [str(path)]
+        while stack:
+            current = stack.pop()
+            try:
+                with os.scandir(current) as iterator:
+                    for entry in iterator:
+                        try:
+                            if entry.is_dir(follow_symlinks=False):
+                                stack.append(entry.path)
+                                pending_dirs.append(entry.path)
+                            else:
+                                size = entry.stat(
+                                    follow_symlinks=False).st_size
+                                _delete_file(entry.path)
+                                total_files += 1
+                                total_bytes += size
+                        except (PermissionError, OSError) as e:
+                            # Guarded: skips are common on locked trees
+                            # and DEBUG is usually filtered out
+                            if logger.isEnabledFor(logging.DEBUG):
+                                logger.debug(
+                                    "Cannot delete %s: %s", entry.path, e)
+            except (PermissionError, OSError) as e:
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug(
+                        "Cannot walk directory %s: %s", current, e)
+
+        # Directories were recorded parent-first; remove deepest-first
+        for directory in reversed(pending_dirs[1:]):
+            try:
+                _remove_dir(directory)
+                total_dirs += 1
+            except OSError as e:
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug(
+                        "Cannot remove directory %s: %s", directory, e)
+        _remove_dir(pending_dirs[0])
+        total_dirs += 1
+        return total_files, total_dirs, total_bytes
+
     def _get_dir_size(self, path: Path) -> int:
-        """Calculate total size of a directory."""
+        """Calculate total size of a directory.
+
+        Manual os.scandir walk: DirEntry type checks and stat reuse the
+        data the enumeration already returned, halving the per-entry
+        syscalls of the old rglob + stat pass.
+        """
         total = 0
-        try:
-            for item in path.rglob("*"):
-                if item.is_file():
-                    try:
-                        total += item.stat().st_size
-                    except (PermissionError, OSError) as e:
-                        logger.debug("Cannot stat file %s: %s", item, e)
-        except (PermissionError, OSError) as e:
-            logger.debug("Cannot walk directory %s: %s", path, e)
+        stack = [str(path)]
+        while stack:
+            current = stack.pop()
+            try:
+                with os.scandir(current) as iterator:
+                    for entry in iterator:
+                        try:
+                            if entry.is_dir(follow_symlinks=False):
+                                stack.append(entry.path)
+                            elif entry.is_file(follow_symlinks=False):
+                                total += entry.stat(
+                                    follow_symlinks=False).st_size
+                        except (PermissionError, OSError) as e:
+                            if logger.isEnabledFor(logging.DEBUG):
+                                logger.debug(
+                                    "Cannot stat file %s: %s", entry.path, e)
+            except (PermissionError, OSError) as e:
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug(
+                        "Cannot walk directory %s: %s", current, e)
         return total
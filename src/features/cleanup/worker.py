@@ -1,7 +1,7 @@
 """Cleanup progress worker - Background thread for cleanup with progress signals."""
 import logging
 from pathlib import Path
-from typing import List
+from typing import List, Optional
 
 from PyQt6.QtCore import QThread, pyqtSignal
 
@@ -20,27 +20,51 @@ class CleanupProgressWorker(QThread):
 
     # Signals
     progress_updated = pyqtSignal(int, int)  # (current_index, total_count)
-    cleanup_finished = pyqtSignal(object)    # CleanupResult
+    cleanup_finished = pyqtSignal(CleanupResult)
 
-    def __init__(self, directories: List[str], parent=None):
+    def __init__(self, directories: Optional[List[str]] = None, parent=None):
         """Initialize the cleanup worker.
 
         Args:
-            directories: List of directory paths to clean up.
+            directories: Optional list of directory paths to clean up;
+                jobs can also be handed to a reused worker via submit().
             parent: Optional parent QObject.
         """
         try:
             super().__init__(parent)
-            self._directories = list(directories)
+            self._directories = list(directories) if directories else []
             self._service = CleanupService()
         except Exception as e:
             logger.error("Failed to init CleanupProgressWorker: %s", e)
 
+    def submit(self, directories: List[str]) -> bool:
+        """Run a cleanup job on this worker, reusing the instance.
+
+        The worker (its service and signal wiring) is built once by the
+        caller; each job only restarts the thread. Returns False if a
+        job is still running.
+        """
+        try:
+            if self.isRunning():
+                logger.warning("Cleanup worker already has a job running")
+                return False
+            self._directories = list(directories)
+            self.start()
+            return True
+        except Exception as e:
+            logger.error("Failed to submit cleanup job: %s", e)
+            return False
+
     def run(self) -> None:
         """Execute cleanup in background thread."""
         total = len(self._directories)
         total_result = CleanupResult()
 
+        # When the bin marker is in the job (sorted last by do_cleanup),
+        # recycled items defer their totals to the bin query so they are
+        # never counted both at delete time and at empty time
+        defer_recycled = RECYCLE_BIN_MARKER in self._directories
+
         try:
             for completed, directory in enumerate(self._directories, start=1):
                 try:
@@ -53,7 +77,9 @@ class CleanupProgressWorker(QThread):
                                 f"Skipped (path not found): {directory}"
                             )
                             continue
-                        result = self._service.cleanup_directory(directory)
+                        result = self._service.cleanup_directory(
+                            directory, defer_recycled=defer_recycled
+                        )
 
                     # Accumulate results
                     total_result.total_files += result.total_files
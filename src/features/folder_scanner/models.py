@@ -8,7 +8,7 @@ from typing import Dict, List, Optional
 from features.folder_scanner.format_utils import format_size
 
 
-@dataclass
+@dataclass(slots=True)
 class FileEntry:
     """Information about a single file."""
 
@@ -43,7 +43,7 @@ class ScanStats:
             self.skipped_reasons[reason] = self.skipped_reasons.get(reason, 0) + count
 
 
-@dataclass
+@dataclass(slots=True)
 class FolderInfo:
     """Information about a folder's size and contents."""
 
@@ -58,6 +58,11 @@ class FolderInfo:
     has_unscanned_children: bool = False
     direct_files: List[FileEntry] = field(default_factory=list)
     scan_stats: ScanStats = field(default_factory=ScanStats)
+    _size_fmt: str = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        # Formatted once here; the tree view re-reads it on every paint
+        self._size_fmt = format_size(self.size_bytes)
 
     @property
     def size_mb(self) -> float:
@@ -76,8 +81,8 @@ class FolderInfo:
             return 0.0
 
     def size_formatted(self) -> str:
-        """Human-readable size string."""
-        return format_size(self.size_bytes)
+        """Human-readable size string, precomputed at construction."""
+        return self._size_fmt
 
     def allocated_formatted(self) -> str:
         """Human-readable allocated size string."""
@@ -2,9 +2,13 @@
 
 from __future__ import annotations
 
+import logging
 from typing import Callable, List, Optional
 
 from features.folder_scanner.models import FileEntry, FolderInfo, ScanStats
+from features.folder_scanner.parallel_executor import (
+    scan_realtime_directories as run_parallel_directories,
+)
 from features.folder_scanner.scan_helpers import (
     ScanAggregate,
     format_last_modified,
@@ -128,6 +132,78 @@ def scan_recursive_entry(
     )
 
 
+def scan_parallel_children(
+    scanner,
+    dirs: List,
+    max_depth: int,
+    current_depth: int,
+    progress_callback: Optional[Callable[[str, int], None]],
+    items_scanned: List[int],
+    last_progress_time: List[float],
+    aggregate: ScanAggregate,
+    children: List[FolderInfo],
+    stats: ScanStats,
+) -> bool:
+    """Fan immediate subdirectories out across the scanner's worker pool.
+
+    Only the root level fans out; each task scans its branch in-thread
+    with local counters (mirroring scan_subtree), so the pool can never
+    deadlock on nested submissions and the hot per-entry loop shares no
+    state. Merging runs on the calling thread as branches complete.
+    Returns True when the scan was cancelled mid-fan-out.
+    """
+
+    def _is_cancelled() -> bool:
+        return scanner._cancel_flag.is_set()
+
+    def _scan_entry(entry):
+        local_scanned = [0]
+        local_progress_time = [0.0]
+        child_info = scan_recursive(
+            scanner,
+            entry.path,
+            max_depth,
+            current_depth + 1,
+            progress_callback,
+            local_scanned,
+            local_progress_time,
+            ScanStats(),
+        )
+        return (child_info, local_scanned[0])
+
+    def _merge_child(result) -> None:
+        child_info, branch_scanned = result
+        items_scanned[0] += branch_scanned
+        if child_info is None:
+            return
+        children.append(child_info)
+        stats.merge(child_info.scan_stats)
+        child_mtime = parse_last_modified(child_info.last_modified)
+        if child_mtime is None:
+            scanner._record_timestamp_parse_failure(stats, child_info.last_modified)
+        aggregate.add_child(child_info, child_mtime)
+        scanner._maybe_emit_progress(
+            progress_callback, child_info.path, items_scanned, last_progress_time
+        )
+
+    def _on_parallel_error(exc: Exception) -> None:
+        scanner._logger.error("Parallel scan failed: %s", exc)
+        scanner._record_skip(stats, exc)
+
+    try:
+        run_parallel_directories(
+            dirs=dirs,
+            parallel_workers=scanner._parallel_workers,
+            is_cancelled=_is_cancelled,
+            scan_entry=_scan_entry,
+            merge_child=_merge_child,
+            on_parallel_error=_on_parallel_error,
+        )
+    except RuntimeError:
+        return True
+    return False
+
+
 def scan_recursive(
     scanner,
     path: str,
@@ -147,8 +223,17 @@ def scan_recursive(
     aggregate = ScanAggregate()
     children: List[FolderInfo] = []
     direct_files: List[FileEntry] = []
+    deferred_dirs: List = []
     has_unscanned = False
 
+    # Root-level subdirectories fan out across the worker pool when the
+    # scan recurses past them; deeper levels stay in-thread
+    fan_out = (
+        current_depth == 0
+        and current_depth < max_depth
+        and scanner._parallel_workers > 1
+    )
+
     try:
         entries = scanner._iter_dir_entries(path, stats)
     except Exception as exc:
@@ -165,6 +250,11 @@ def scan_recursive(
             scanner._maybe_emit_progress(progress_callback, entry.path, items_scanned, last_progress_time)
 
             try:
+                if fan_out and entry.is_dir(follow_symlinks=False):
+                    aggregate.folder_count += 1
+                    stats.scanned_dirs += 1
+                    deferred_dirs.append(entry)
+                    continue
                 has_unscanned = scan_recursive_entry(
                     scanner,
                     entry,
@@ -180,11 +270,31 @@ def scan_recursive(
                 ) or has_unscanned
             except Exception as exc:
                 scanner._record_skip(stats, exc)
-                scanner._logger.debug("Error processing entry %s: %s", entry, exc)
+                # Guarded: hot per-entry handler on permission-dense trees
+                if scanner._logger.isEnabledFor(logging.DEBUG):
+                    scanner._logger.debug(
+                        "Error processing entry %s: %s", entry, exc
+                    )
     except Exception as exc:
         scanner._logger.debug("Cannot iterate entries for %s: %s", path, exc)
         return scanner._empty_folder_info(path, folder_name, stats)
 
+    if deferred_dirs and not scanner._cancel_flag.is_set():
+        cancelled = scan_parallel_children(
+            scanner,
+            deferred_dirs,
+            max_depth,
+            current_depth,
+            progress_callback,
+            items_scanned,
+            last_progress_time,
+            aggregate,
+            children,
+            stats,
+        )
+        if cancelled:
+            return None
+
     children.sort(key=lambda x: x.size_bytes, reverse=True)
     direct_files.sort(key=lambda x: x.size_bytes, reverse=True)
 
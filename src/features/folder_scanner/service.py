@@ -214,7 +214,10 @@ class FolderScanner:
             return fsize, falloc, float(st.st_mtime), True
         except Exception as e:
             self._record_skip(stats, e)
-            logger.debug("Cannot access file %s: %s", entry, e)
+            # Guarded: this handler is hot on permission-dense trees and
+            # the LogRecord would be built even with DEBUG filtered out
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Cannot access file %s: %s", entry, e)
             return 0, 0, 0.0, False
 
     def _scan_shallow_directory(
@@ -521,7 +524,8 @@ class FolderScanner:
 
         def _record_skip_and_log(exc: Exception) -> None:
             self._record_skip(stats, exc)
-            logger.debug("Cannot walk/scan path %s: %s", path, exc)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Cannot walk/scan path %s: %s", path, exc)
 
         return get_folder_size_fast(
             path=path,
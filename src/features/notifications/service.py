@@ -16,6 +16,9 @@ class NotificationService:
 
     def __init__(self):
         self._tray_icon = None
+        # Resolve the toast callable once so the hot path makes a single
+        # bound call instead of re-checking module availability per toast
+        self._toast_fn = toast if toast is not None else self._toast_missing
 
     def set_tray_icon(self, tray_icon) -> None:
         """Set a pystray Icon reference for fallback notifications."""
@@ -64,6 +67,11 @@ class NotificationService:
         except Exception as e:
             logger.error("Failed to show error notification: %s", e)
 
+    def _toast_missing(self, title: str, message: str, **_kwargs) -> None:
+        """Stand-in toast callable used when win11toast is unavailable."""
+        logger.warning("Toast notifications not supported (win11toast missing)")
+        self._fallback_notify(title, message)
+
     def _show_toast(
         self,
         title: str,
@@ -71,13 +79,8 @@ class NotificationService:
         duration: str = "short",  # "short" = 2s, "long" = 25s
     ) -> None:
         """Show a Windows toast notification."""
-        if toast is None:
-            logger.warning("Toast notifications not supported (win11toast missing)")
-            self._fallback_notify(title, message)
-            return
-
         try:
-            toast(title, message, app_id=APP_NAME, duration=duration)
+            self._toast_fn(title, message, app_id=APP_NAME, duration=duration)
         except Exception as e:
             logger.warning("Toast notification failed: %s. Trying fallback.", e)
             self._fallback_notify(title, message)
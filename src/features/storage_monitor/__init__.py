@@ -1,5 +1,6 @@
 """Storage monitor feature exports."""
+from features.storage_monitor.device_events import DriveChangeEventFilter
 from features.storage_monitor.service import StorageMonitor
 from features.storage_monitor.utils import DriveInfo, get_all_drives
 
-__all__ = ["StorageMonitor", "DriveInfo", "get_all_drives"]
+__all__ = ["StorageMonitor", "DriveInfo", "DriveChangeEventFilter", "get_all_drives"]
@@ -0,0 +1,47 @@
+"""Drive arrival/removal listener - invalidates the cached drive topology."""
+import ctypes
+import ctypes.wintypes
+import logging
+from typing import Callable
+
+from PyQt6.QtCore import QAbstractNativeEventFilter
+
+from features.storage_monitor.utils import invalidate_drive_cache
+
+logger = logging.getLogger(__name__)
+
+# Win32 device-change notification constants
+WM_DEVICECHANGE = 0x0219
+DBT_DEVICEARRIVAL = 0x8000
+DBT_DEVICEREMOVECOMPLETE = 0x8004
+
+
+class DriveChangeEventFilter(QAbstractNativeEventFilter):
+    """Native event filter reacting to drive arrival and removal.
+
+    Installed on the QApplication; on WM_DEVICECHANGE it drops the
+    cached drive topology and invokes the supplied callback so the UI
+    refreshes exactly when the drive set changes instead of guessing on
+    a timer.
+    """
+
+    def __init__(self, on_change: Callable[[], None]):
+        """Initialize with the callback to run after a drive change."""
+        super().__init__()
+        self._on_change = on_change
+
+    def nativeEventFilter(self, event_type, message):
+        """Handle WM_DEVICECHANGE; never swallows the event."""
+        try:
+            if event_type == b"windows_generic_MSG":
+                msg = ctypes.wintypes.MSG.from_address(int(message))
+                if msg.message == WM_DEVICECHANGE and msg.wParam in (
+                    DBT_DEVICEARRIVAL,
+                    DBT_DEVICEREMOVECOMPLETE,
+                ):
+                    logger.info("Drive change detected, refreshing drive list")
+                    invalidate_drive_cache()
+                    self._on_change()
+        except Exception as e:
+            logger.error("Failed to handle device change event: %s", e)
+        return False, 0
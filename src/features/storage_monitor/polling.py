@@ -7,10 +7,59 @@ import threading
 import time
 
 
+# Adaptive polling bounds: multiplier applied to the base interval
+_ADAPTIVE_MAX_SCALE = 10
+
+
+def compute_adaptive_scale(monitor, drives, now: float) -> int:
+    """Return the next interval multiplier from free-space burn rate.
+
+    Estimates, per drive, how long until free space crosses the
+    threshold at the rate observed since the previous poll. When the
+    nearest crossing is comfortably far (or nothing is being consumed)
+    the interval doubles, capped at 10x the base; when a drive is within
+    two intervals of crossing, it halves back toward the base.
+    """
+    base_seconds = (monitor._interval_ms / 1000) * monitor._interval_scale
+    min_eta = None
+
+    for drive in drives:
+        previous = monitor._previous_free.get(drive.letter)
+        monitor._previous_free[drive.letter] = (drive.free_gb, now)
+        if previous is None:
+            continue
+
+        prev_free_gb, prev_ts = previous
+        elapsed = now - prev_ts
+        if elapsed <= 0:
+            continue
+
+        rate_gb_per_sec = (prev_free_gb - drive.free_gb) / elapsed
+        if rate_gb_per_sec <= 0:
+            continue
+
+        headroom_gb = drive.free_gb - monitor._threshold_gb
+        if headroom_gb <= 0:
+            return 1
+
+        eta = headroom_gb / rate_gb_per_sec
+        if min_eta is None or eta < min_eta:
+            min_eta = eta
+
+    if min_eta is None or min_eta > 10 * base_seconds:
+        return min(monitor._interval_scale * 2, _ADAPTIVE_MAX_SCALE)
+    if min_eta < 2 * base_seconds:
+        return max(monitor._interval_scale // 2, 1)
+    return monitor._interval_scale
+
+
 def check_drives(monitor, get_all_drives_fn, logger) -> None:
-    """Check drives and emit low-space / recovered signals."""
-    drives = get_all_drives_fn()
+    """Query drives and evaluate them in one synchronous pass."""
+    evaluate_drives(monitor, get_all_drives_fn(), logger)
+
 
+def evaluate_drives(monitor, drives, logger) -> None:
+    """Evaluate queried drives and emit low-space / recovered signals."""
     for drive in drives:
         if drive.free_gb < monitor._threshold_gb:
             last_notified = monitor._notified_drives.get(drive.letter)
@@ -36,6 +85,14 @@ def check_drives(monitor, get_all_drives_fn, logger) -> None:
                     drive.free_gb,
                 )
 
+    if monitor._adaptive:
+        scale = compute_adaptive_scale(monitor, drives, time.time())
+        if scale != monitor._interval_scale:
+            monitor._interval_scale = scale
+            if monitor._timer.isActive():
+                monitor._timer.start(monitor._interval_ms * scale)
+            logger.debug("Adaptive polling interval scale set to %dx", scale)
+
     del drives
     monitor._poll_cycle_count += 1
     if monitor._poll_cycle_count >= monitor._GC_INTERVAL:
@@ -1,11 +1,16 @@
 """Storage monitor service - Poll disk space and detect low space."""
 import logging
+import threading
 from typing import Dict, List, Optional
 
 import psutil
 from PyQt6.QtCore import QObject, QTimer, pyqtSignal
 
-from features.storage_monitor.polling import check_drives, periodic_maintenance
+from features.storage_monitor.polling import (
+    check_drives,
+    evaluate_drives,
+    periodic_maintenance,
+)
 from features.storage_monitor.utils import DriveInfo, get_all_drives
 
 logger = logging.getLogger(__name__)
@@ -18,6 +23,9 @@ class StorageMonitor(QObject):
     low_space_detected = pyqtSignal(DriveInfo)
     # Signal emitted when a drive recovers from low space
     low_space_cleared = pyqtSignal(str)
+    # Internal: hands drive lists from the poll worker back to the
+    # GUI thread (queued when emitted cross-thread)
+    _drives_polled = pyqtSignal(list)
 
     # Run gc.collect() and log RSS every N polling cycles (D-CB-015/017)
     _GC_INTERVAL = 100
@@ -28,6 +36,7 @@ class StorageMonitor(QObject):
         self,
         threshold_gb: int = 10,
         interval_seconds: int = 60,
+        adaptive: bool = False,
         parent: Optional[QObject] = None,
     ):
         try:
@@ -36,8 +45,18 @@ class StorageMonitor(QObject):
             self._interval_ms = interval_seconds * 1000
             self._notified_drives: Dict[str, float] = {}
             self._poll_cycle_count: int = 0
+            # Adaptive polling: back off when free space is far from the
+            # threshold and barely moving, tighten as a crossing nears
+            self._adaptive = adaptive
+            self._interval_scale: int = 1
+            self._previous_free: Dict[str, tuple] = {}
+            self._poll_in_flight = False
             self._timer = QTimer(self)
-            self._timer.timeout.connect(self._check_drives)
+            # Timer ticks query drives on a worker thread so a stalled
+            # volume cannot block the event loop; evaluation comes back
+            # through _drives_polled on the GUI thread
+            self._timer.timeout.connect(self._poll_drives_async)
+            self._drives_polled.connect(self._on_drives_polled)
         except Exception as e:
             logger.error("Failed to init StorageMonitor: %s", e)
 
@@ -63,6 +82,9 @@ class StorageMonitor(QObject):
             logger.error("Failed to stop storage monitor: %s", e)
         finally:
             self._notified_drives.clear()
+            self._previous_free.clear()
+            self._interval_scale = 1
+            self._poll_in_flight = False
             logger.debug("Storage monitor resources cleaned up")
 
     def set_notified_drives(self, drives) -> None:
@@ -93,6 +115,7 @@ class StorageMonitor(QObject):
         """Update polling interval at runtime."""
         try:
             self._interval_ms = max(1, int(interval_seconds)) * 1000
+            self._interval_scale = 1
             if self._timer.isActive():
                 self._timer.start(self._interval_ms)
         except Exception as e:
@@ -116,12 +139,47 @@ class StorageMonitor(QObject):
             return []
 
     def _check_drives(self) -> None:
-        """Check all drives for low space."""
+        """Check all drives for low space.
+
+        Steady-state polls reuse the cached drive topology; the device
+        event filter invalidates it when drives come and go.
+        """
         try:
             check_drives(self, get_all_drives, logger)
         except Exception as e:
             logger.error("Error checking drives: %s", e)
 
+    def _poll_drives_async(self) -> None:
+        """Start a worker-thread drive query for one timer tick.
+
+        GetDiskFreeSpaceExW can stall for seconds on a sleeping disk or
+        network mount; running it off the GUI thread keeps the event
+        loop painting. Overlapping ticks are dropped while a query is
+        still in flight.
+        """
+        if self._poll_in_flight:
+            logger.debug("Drive poll already in flight, skipping tick")
+            return
+        self._poll_in_flight = True
+        threading.Thread(target=self._poll_worker, daemon=True).start()
+
+    def _poll_worker(self) -> None:
+        """Blocking drive query; runs on a worker thread."""
+        try:
+            drives = get_all_drives()
+        except Exception as e:
+            logger.error("Error checking drives: %s", e)
+            drives = []
+        self._drives_polled.emit(drives)
+
+    def _on_drives_polled(self, drives: list) -> None:
+        """Evaluate a polled drive list back on the GUI thread."""
+        self._poll_in_flight = False
+        try:
+            evaluate_drives(self, drives, logger)
+        except Exception as e:
+            logger.error("Error checking drives: %s", e)
+
     def _periodic_maintenance(self) -> None:
         """Run gc.collect off main thread and log RSS (D-CB-015/017)."""
         periodic_maintenance(logger, psutil)
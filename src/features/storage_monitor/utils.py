@@ -1,19 +1,28 @@
 """Storage monitor utilities."""
+import ctypes
 import logging
 from dataclasses import dataclass
-from typing import List
+from typing import List, Optional, Tuple
 
 import psutil
 
 logger = logging.getLogger(__name__)
 
+# Resolved once; None outside Windows, where the psutil path is used.
+try:
+    _kernel32 = ctypes.windll.kernel32
+except AttributeError:
+    _kernel32 = None
+
+_DRIVE_FIXED = 3
+
 
 def _is_windows_local_drive(device: str) -> bool:
     """Return True for Windows local drive identifiers like C: or Z:."""
     return len(device) >= 2 and device[1] == ":" and device[0].isalpha()
 
 
-@dataclass
+@dataclass(slots=True)
 class DriveInfo:
     """Information about a drive."""
     letter: str
@@ -32,48 +41,146 @@ class DriveInfo:
             return False
 
 
-def get_all_drives() -> List[DriveInfo]:
-    """Get information about all fixed drives."""
+# Cached fixed-drive topology: (device, mountpoint) pairs from the last
+# cached enumeration. Invalidated by the WM_DEVICECHANGE event filter
+# and by any cached drive failing its usage query.
+_mountpoint_cache: Optional[List[Tuple[str, str]]] = None
+
+
+def invalidate_drive_cache() -> None:
+    """Drop the cached drive topology so the next call re-enumerates."""
+    global _mountpoint_cache
+    _mountpoint_cache = None
+
+
+def _enumerate_fixed_partitions() -> List[Tuple[str, str]]:
+    """Enumerate (device, mountpoint) pairs for fixed local drives."""
+    pairs = []
+    partitions = psutil.disk_partitions()
+    for partition in partitions:
+        # Skip removable and network drives
+        if "fixed" not in partition.opts.lower() and "cdrom" not in partition.opts.lower():
+            # On Windows, check if it's a local drive
+            if not _is_windows_local_drive(partition.device):
+                continue
+        pairs.append((partition.device, partition.mountpoint))
+    del partitions
+    return pairs
+
+
+def _enumerate_fixed_drives_win32() -> List[Tuple[str, str]]:
+    """Enumerate (device, mountpoint) pairs via GetLogicalDriveStringsW.
+
+    One kernel32 call plus a GetDriveTypeW check per root replaces
+    psutil's cross-platform partition objects on the polling path.
+    """
+    buf = ctypes.create_unicode_buffer(256)
+    length = _kernel32.GetLogicalDriveStringsW(255, buf)
+    if length == 0 or length > 255:
+        raise OSError("GetLogicalDriveStringsW failed")
+
+    pairs = []
+    for root in buf[:length].split("\0"):
+        if not root:
+            continue
+        if _kernel32.GetDriveTypeW(root) != _DRIVE_FIXED:
+            continue
+        pairs.append((root[:2], root))
+    return pairs
+
+
+def _query_drive_win32(device: str, mountpoint: str) -> Optional[DriveInfo]:
+    """Read usage for one drive with a single GetDiskFreeSpaceExW call."""
+    free = ctypes.c_ulonglong()
+    total = ctypes.c_ulonglong()
+    try:
+        ok = _kernel32.GetDiskFreeSpaceExW(
+            mountpoint, None, ctypes.byref(total), ctypes.byref(free)
+        )
+    except Exception as e:
+        logger.warning("Unexpected error reading drive %s, skipping: %s", device, e)
+        return None
+    if not ok:
+        logger.warning("Drive disconnected or inaccessible, skipping %s", device)
+        return None
+
+    total_bytes = total.value
+    used_bytes = total_bytes - free.value
+    return DriveInfo(
+        letter=device[:2],
+        total_gb=total_bytes / (1024**3),
+        free_gb=free.value / (1024**3),
+        used_gb=used_bytes / (1024**3),
+        percent_used=(used_bytes / total_bytes * 100.0) if total_bytes else 0.0,
+    )
+
+
+def _query_drive(device: str, mountpoint: str) -> Optional[DriveInfo]:
+    """Read usage for one drive; returns None if it is inaccessible."""
+    try:
+        usage = psutil.disk_usage(mountpoint)
+        # Copy data to plain dataclass before del (D-CB-016)
+        drive = DriveInfo(
+            letter=device[:2],
+            total_gb=usage.total / (1024**3),
+            free_gb=usage.free / (1024**3),
+            used_gb=usage.used / (1024**3),
+            percent_used=usage.percent,
+        )
+        del usage
+        logger.debug(
+            "Drive %s: %.1f GB free / %.1f GB total",
+            drive.letter,
+            drive.free_gb,
+            drive.total_gb,
+        )
+        return drive
+    except (OSError, PermissionError) as e:
+        logger.warning(
+            "Drive disconnected or inaccessible, skipping %s: %s",
+            device,
+            e)
+    except Exception as e:
+        logger.warning(
+            "Unexpected error reading drive %s, skipping: %s",
+            device,
+            e)
+    return None
+
+
+def get_all_drives(use_cache: bool = True) -> List[DriveInfo]:
+    """Get information about all fixed drives.
+
+    With use_cache=True the drive topology from the previous cached call
+    is reused and only per-drive usage is re-queried, so steady-state
+    polling skips the full volume enumeration; device-change events (and
+    a cached drive turning inaccessible) invalidate the cache.
+    """
+    global _mountpoint_cache
     drives = []
 
+    # kernel32 drives the whole poll on Windows; psutil stays as the
+    # portable fallback
+    enumerate_fn = (
+        _enumerate_fixed_drives_win32 if _kernel32 is not None
+        else _enumerate_fixed_partitions
+    )
+    query_fn = _query_drive_win32 if _kernel32 is not None else _query_drive
+
     try:
-        partitions = psutil.disk_partitions()
-        for partition in partitions:
-            # Skip removable and network drives
-            if "fixed" not in partition.opts.lower() and "cdrom" not in partition.opts.lower():
-                # On Windows, check if it's a local drive
-                if not _is_windows_local_drive(partition.device):
-                    continue
-
-            try:
-                usage = psutil.disk_usage(partition.mountpoint)
-                # Copy data to plain dataclass before del (D-CB-016)
-                drive = DriveInfo(
-                    letter=partition.device[:2],
-                    total_gb=usage.total / (1024**3),
-                    free_gb=usage.free / (1024**3),
-                    used_gb=usage.used / (1024**3),
-                    percent_used=usage.percent,
-                )
-                del usage
+        pairs = _mountpoint_cache if use_cache else None
+        if pairs is None:
+            pairs = enumerate_fn()
+            if use_cache:
+                _mountpoint_cache = pairs
+
+        for device, mountpoint in pairs:
+            drive = query_fn(device, mountpoint)
+            if drive is not None:
                 drives.append(drive)
-                logger.debug(
-                    "Drive %s: %.1f GB free / %.1f GB total",
-                    drive.letter,
-                    drive.free_gb,
-                    drive.total_gb,
-                )
-            except (OSError, PermissionError) as e:
-                logger.warning(
-                    "Drive disconnected or inaccessible, skipping %s: %s",
-                    partition.device,
-                    e)
-            except Exception as e:
-                logger.warning(
-                    "Unexpected error reading drive %s, skipping: %s",
-                    partition.device,
-                    e)
-        del partitions
+            elif use_cache:
+                # A cached drive vanished without a device event
+                invalidate_drive_cache()
     except Exception as e:
         logger.error("Failed to enumerate drives: %s", e)
 
@@ -150,6 +150,40 @@ class ConfigManager:
             logger.error("Failed to add directory %s: %s", path, e)
             return False
 
+    def add_directories(
+        self,
+        paths: List[str],
+        mark_first_run_complete: bool = False,
+    ) -> List[str]:
+        """Add several directories to the cleanup list with a single save.
+
+        Used by first-run setup so N defaults (and optionally the
+        first-run flag) persist in one disk write instead of one per
+        directory. Returns the paths actually added.
+        """
+        added: List[str] = []
+        try:
+            if "cleanup_directories" not in self._config:
+                self._config["cleanup_directories"] = []
+
+            current = self._config["cleanup_directories"]
+            for path in paths:
+                if is_protected_path(path):
+                    logger.warning("Blocked adding protected path to config: %s", path)
+                    continue
+                if path not in current:
+                    current.append(path)
+                    added.append(path)
+
+            if mark_first_run_complete:
+                self._config["first_run_complete"] = True
+
+            if added or mark_first_run_complete:
+                self.save()
+        except Exception as e:
+            logger.error("Failed to add directories %s: %s", paths, e)
+        return added
+
     def remove_directory(self, path: str) -> bool:
         """Remove a directory from cleanup list."""
         try:
@@ -200,6 +234,15 @@ class ConfigManager:
         except Exception as e:
             logger.error("Failed to set polling interval: %s", e)
 
+    @property
+    def show_on_startup(self) -> bool:
+        """Check if the main window should be shown on startup."""
+        try:
+            return self._config.get("show_on_startup", True)
+        except Exception as e:
+            logger.error("Failed to check show on startup: %s", e)
+            return True
+
     @property
     def auto_start_enabled(self) -> bool:
         """Check if auto-start is enabled."""
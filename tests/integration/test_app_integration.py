@@ -358,7 +358,6 @@ class TestAppMainWindowIntegration:
         )
         monkeypatch.setattr(app_module, "ConfigManager", lambda: mock_config)
         monkeypatch.setattr(app_module, "QApplication", MagicMock())
-        monkeypatch.setattr(app_module.atexit, "register", Mock())
 
         a = App()
         a._startup_error = "lock failed"
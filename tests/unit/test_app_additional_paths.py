@@ -91,14 +91,31 @@ def test_on_cleanup_progress_updates_ui_and_tray(app_instance):
 
 def test_on_cleanup_finished_success(app_instance):
     result = SimpleNamespace(total_files=1, total_folders=2, total_size_mb=3.5, errors=[])
-    app_instance._cleanup_worker = MagicMock()
+    worker = MagicMock()
+    app_instance._cleanup_worker = worker
 
     app_instance._on_cleanup_finished(result)
 
     app_instance._main_window.show_cleanup_progress.assert_called_with(False)
     app_instance._tray_icon.set_status.assert_called_with(None)
     app_instance._notification_service.notify_cleanup_result.assert_called_once()
-    assert app_instance._cleanup_worker is None
+    # Worker is retained for reuse by the next cleanup
+    assert app_instance._cleanup_worker is worker
+
+
+def test_on_cleanup_finished_cancels_parked_progress(app_instance):
+    result = SimpleNamespace(total_files=0, total_folders=0, total_size_mb=0.0, errors=[])
+    app_instance._cleanup_worker = MagicMock()
+    timer = MagicMock()
+    app_instance._cleanup_progress_timer = timer
+    app_instance._pending_cleanup_progress = (3, 3)
+
+    app_instance._on_cleanup_finished(result)
+
+    # A parked update flushed after completion would re-set the tray to
+    # "Cleaning 3/3..."; completion must cancel the throttle instead
+    timer.stop.assert_called_once()
+    assert app_instance._pending_cleanup_progress is None
 
 
 def test_on_do_show_settings_calls_window_methods(app_instance):
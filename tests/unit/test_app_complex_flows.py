@@ -1,5 +1,5 @@
 import pytest
-from unittest.mock import MagicMock, patch, call, PropertyMock
+from unittest.mock import MagicMock, patch, PropertyMock
 
 
 class TestAppComplexFlows:
@@ -61,10 +61,9 @@ class TestAppComplexFlows:
 
         # Verify
         app.mock_get_defaults.assert_called_once()
-        app._config.add_directory.assert_has_calls(
-            [call("C:/Downloads"), call("C:/Temp")]
+        app._config.add_directories.assert_called_once_with(
+            ["C:/Downloads", "C:/Temp"], mark_first_run_complete=True
         )
-        app._config.mark_first_run_complete.assert_called_once()
 
     def test_start_logic_first_run(self, app):
         """Test start() with first run."""
@@ -80,7 +79,6 @@ class TestAppComplexFlows:
             patch("sys.argv", ["cleanbox.exe"]),
             patch.object(app_module, "QApplication") as MockQApp,
             patch.object(app_module, "registry"),
-            patch.object(app_module.atexit, "register"),
             patch.object(app_module.App, "_acquire_single_instance", return_value=True),
         ):
 
@@ -96,7 +94,11 @@ class TestAppComplexFlows:
 
             app.start()
 
-            app._config.mark_first_run_complete.assert_called()
+            # First-run setup now runs on the startup worker thread
+            assert app._startup_worker.wait(5000)
+            app._config.add_directories.assert_called_with(
+                ["C:/Def"], mark_first_run_complete=True
+            )
 
     def test_on_directory_added(self, app):
         """Test directory added slot."""
@@ -129,9 +131,9 @@ class TestAppComplexFlows:
 
             App._do_cleanup(app)
 
-            # Verify worker was created with directories
+            # Verify worker was created once and the job submitted to it
             MockWorker.assert_called_once()
-            assert mock_worker_instance.start.called
+            mock_worker_instance.submit.assert_called_once_with(["C:/TestDir"])
             # Verify UI shows progress
             app._main_window.show_cleanup_progress.assert_called_with(True)
             app._tray_icon.set_status.assert_called()
@@ -155,7 +157,7 @@ class TestAppComplexFlows:
         app._notification_service.notify_cleanup_result.assert_not_called()
 
     def test_on_exit(self, app):
-        """Test exit cleanup."""
+        """Test exit defers service shutdown to the aboutToQuit hook."""
         # Inject mocks for optional components
         app._storage_monitor = MagicMock()
         app._tray_icon = MagicMock()
@@ -165,9 +167,18 @@ class TestAppComplexFlows:
 
         App._do_exit(app)
 
+        # Services stop once in _cleanup_on_exit when aboutToQuit fires
+        app._qt_app.quit.assert_called_once()
+        app._storage_monitor.stop.assert_not_called()
+        app._tray_icon.stop.assert_not_called()
+
+        App._cleanup_on_exit(app)
         app._storage_monitor.stop.assert_called_once()
         app._tray_icon.stop.assert_called_once()
-        app._qt_app.quit.assert_called_once()
+
+        # Second invocation is a guarded no-op
+        App._cleanup_on_exit(app)
+        app._storage_monitor.stop.assert_called_once()
 
     def test_refresh_storage(self, app):
         """Test manual refresh storage."""
@@ -8,6 +8,8 @@ import sys
 import os
 from unittest.mock import Mock, patch
 
+import pytest
+
 sys.path.insert(
     0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../../src"))
 )
@@ -31,6 +33,33 @@ class TestCleanupProgressWorkerUnit:
         worker = CleanupProgressWorker([])
         assert worker._service is not None
 
+    def test_worker_submit_reuses_instance(self):
+        """Test submit swaps directories and restarts the thread."""
+        from unittest.mock import patch
+
+        from features.cleanup.worker import CleanupProgressWorker
+
+        worker = CleanupProgressWorker()
+        with patch.object(worker, "start") as start_mock:
+            assert worker.submit(["C:/Test"]) is True
+        assert worker._directories == ["C:/Test"]
+        start_mock.assert_called_once()
+
+    def test_worker_submit_rejected_while_running(self):
+        """Test submit refuses a job while one is in flight."""
+        from unittest.mock import patch
+
+        from features.cleanup.worker import CleanupProgressWorker
+
+        worker = CleanupProgressWorker(["C:/First"])
+        with (
+            patch.object(worker, "isRunning", return_value=True),
+            patch.object(worker, "start") as start_mock,
+        ):
+            assert worker.submit(["C:/Second"]) is False
+        assert worker._directories == ["C:/First"]
+        start_mock.assert_not_called()
+
     def test_worker_emits_progress_for_each_directory(self, tmp_path):
         """Test worker emits progress for each directory."""
         from features.cleanup.worker import CleanupProgressWorker
@@ -92,6 +121,37 @@ class TestCleanupProgressWorkerUnit:
         assert len(results) == 1
         # Should complete without crashing
 
+    def test_worker_bin_last_does_not_double_count(self, tmp_path):
+        """Test recycled items are counted once when the bin empties in-run."""
+        from features.cleanup.worker import CleanupProgressWorker
+        from shared.constants import RECYCLE_BIN_MARKER
+
+        target = tmp_path / "junk"
+        target.mkdir()
+        (target / "a.txt").write_bytes(b"x" * 100)
+
+        def fake_recycle(path):
+            os.unlink(path)  # simulate the move into the bin
+            return True
+
+        worker = CleanupProgressWorker([str(target), RECYCLE_BIN_MARKER])
+        results = []
+        worker.cleanup_finished.connect(lambda r: results.append(r))
+
+        with (
+            patch.object(worker._service, "_recycle_item", side_effect=fake_recycle),
+            patch.object(
+                worker._service, "_query_recycle_bin_info", return_value=(100, 1)
+            ),
+            patch("features.cleanup.service.winshell.recycle_bin", return_value=Mock()),
+        ):
+            worker.run()
+
+        # The recycled file is counted once, by the bin query at empty time
+        assert results[0].total_size_bytes == 100
+        assert results[0].total_files == 1
+        assert results[0].errors == []
+
 
 class TestCleanupServiceUnit:
     """Unit tests for CleanupService."""
@@ -211,6 +271,17 @@ class TestCleanupServiceUnit:
 class TestDirectoryDetectorUnit:
     """Unit tests for DirectoryDetector."""
 
+    @pytest.fixture(autouse=True)
+    def _reset_detector_cache(self):
+        """Detection is cached per process; reset around each test."""
+        from features.cleanup import directory_detector
+
+        directory_detector.get_downloads_folder.cache_clear()
+        directory_detector._detect_default_directories.cache_clear()
+        yield
+        directory_detector.get_downloads_folder.cache_clear()
+        directory_detector._detect_default_directories.cache_clear()
+
     def test_get_downloads_folder_returns_string(self):
         """Test get_downloads_folder returns string."""
         from features.cleanup.directory_detector import get_downloads_folder
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import os
+import shutil
 import sys
 from pathlib import Path
 from unittest.mock import MagicMock, patch
@@ -9,6 +11,7 @@ from unittest.mock import MagicMock, patch
 import pytest
 
 from features.cleanup.service import CleanupResult, CleanupService
+from shared.constants import RECYCLE_BIN_MARKER
 from shared.utils import ProtectedPathError
 
 
@@ -30,19 +33,19 @@ def test_cleanup_directory_protected_path_raises():
 
 def test_cleanup_directory_permission_error_branch(tmp_path):
     service = CleanupService()
-    item = MagicMock()
-    item.is_file.return_value = True
-    item.stat.return_value.st_size = 10
-    item.exists.return_value = True
-    item.unlink.side_effect = PermissionError("denied")
-
-    fake_dir = MagicMock()
-    fake_dir.exists.return_value = True
-    fake_dir.is_dir.return_value = True
-    fake_dir.iterdir.return_value = [item]
+    entry = MagicMock()
+    entry.is_file.return_value = True
+    entry.stat.return_value.st_size = 10
+    entry.path = str(tmp_path / "locked.txt")
 
+    scandir_cm = MagicMock()
+    scandir_cm.__enter__.return_value = iter([entry])
     with (
-        patch("features.cleanup.service.Path", return_value=fake_dir),
+        patch("features.cleanup.service.os.scandir", return_value=scandir_cm),
+        patch(
+            "features.cleanup.service.os.unlink",
+            side_effect=PermissionError("denied"),
+        ),
         patch.object(service, "_recycle_item", return_value=False),
     ):
         result = service.cleanup_directory(str(tmp_path))
@@ -52,21 +55,116 @@ def test_cleanup_directory_permission_error_branch(tmp_path):
 
 def test_cleanup_directory_generic_exception_branch(tmp_path):
     service = CleanupService()
-    item = MagicMock()
-    item.is_file.return_value = True
-    item.stat.side_effect = RuntimeError("stat failed")
-
-    fake_dir = MagicMock()
-    fake_dir.exists.return_value = True
-    fake_dir.is_dir.return_value = True
-    fake_dir.iterdir.return_value = [item]
-
-    with patch("features.cleanup.service.Path", return_value=fake_dir):
+    entry = MagicMock()
+    entry.is_file.return_value = True
+    entry.stat.side_effect = RuntimeError("stat failed")
+    entry.path = str(tmp_path / "broken.txt")
+
+    scandir_cm = MagicMock()
+    scandir_cm.__enter__.return_value = iter([entry])
+    with patch("features.cleanup.service.os.scandir", return_value=scandir_cm):
         result = service.cleanup_directory(str(tmp_path))
 
     assert any("Error:" in err for err in result.errors)
 
 
+def test_delete_file_win32_retries_after_clearing_readonly():
+    from features.cleanup import service as cleanup_service
+
+    fake_kernel32 = MagicMock()
+    fake_kernel32.DeleteFileW.side_effect = [0, 1]
+
+    with (
+        patch.object(cleanup_service, "_kernel32", fake_kernel32),
+        patch("features.cleanup.service.os.unlink") as unlink_mock,
+    ):
+        cleanup_service._delete_file("C:/locked/readonly.txt")
+
+    fake_kernel32.SetFileAttributesW.assert_called_once()
+    unlink_mock.assert_not_called()
+
+
+def test_delete_file_win32_falls_back_to_os_unlink():
+    from features.cleanup import service as cleanup_service
+
+    fake_kernel32 = MagicMock()
+    fake_kernel32.DeleteFileW.return_value = 0
+
+    with (
+        patch.object(cleanup_service, "_kernel32", fake_kernel32),
+        patch("features.cleanup.service.os.unlink") as unlink_mock,
+    ):
+        cleanup_service._delete_file("C:/locked/stubborn.txt")
+
+    unlink_mock.assert_called_once_with("C:/locked/stubborn.txt")
+
+
+def test_remove_dir_win32_falls_back_to_os_rmdir():
+    from features.cleanup import service as cleanup_service
+
+    fake_kernel32 = MagicMock()
+    fake_kernel32.RemoveDirectoryW.return_value = 0
+
+    with (
+        patch.object(cleanup_service, "_kernel32", fake_kernel32),
+        patch("features.cleanup.service.os.rmdir") as rmdir_mock,
+    ):
+        cleanup_service._remove_dir("C:/locked/dir")
+
+    rmdir_mock.assert_called_once_with("C:/locked/dir")
+
+
+def test_delete_tree_measuring_single_pass(tmp_path):
+    service = CleanupService()
+    target = tmp_path / "branch"
+    nested = target / "sub" / "deep"
+    nested.mkdir(parents=True)
+    (target / "a.txt").write_bytes(b"12345")
+    (nested / "b.txt").write_bytes(b"123")
+
+    files, folders, size = service._delete_tree_measuring(str(target))
+
+    assert files == 2
+    assert folders == 3  # branch, sub, deep
+    assert size == 8
+    assert not target.exists()
+
+
+def test_empty_recycle_bin_reports_queried_totals():
+    service = CleanupService()
+    fake_bin = MagicMock()
+
+    with (
+        patch("features.cleanup.service.winshell.recycle_bin", return_value=fake_bin),
+        patch.object(service, "_query_recycle_bin_info", return_value=(2048, 3)),
+    ):
+        result = service.empty_recycle_bin()
+
+    assert result.total_size_bytes == 2048
+    assert result.total_files == 3
+    assert result.total_folders == 1
+    assert result.errors == []
+
+
+def test_empty_recycle_bin_query_failure_is_warning_only():
+    service = CleanupService()
+    fake_bin = MagicMock()
+
+    with (
+        patch("features.cleanup.service.winshell.recycle_bin", return_value=fake_bin),
+        patch.object(
+            service,
+            "_query_recycle_bin_info",
+            side_effect=OSError("HRESULT 0x80070005"),
+        ),
+    ):
+        result = service.empty_recycle_bin()
+
+    assert result.total_size_bytes == 0
+    assert result.total_folders == 1
+    assert result.errors == []
+
+
 def test_empty_recycle_bin_ctypes_fallback_success():
     service = CleanupService()
     fake_bin = MagicMock()
@@ -105,6 +203,49 @@ def test_empty_recycle_bin_ctypes_fallback_failure():
     assert result.errors
 
 
+def test_cleanup_directory_measures_recycled_dirs_without_bin(tmp_path):
+    service = CleanupService()
+    sub = tmp_path / "sub"
+    sub.mkdir()
+    (sub / "f.txt").write_bytes(b"12345")
+
+    def fake_recycle(path):
+        shutil.rmtree(path)  # simulate the move into the bin
+        return True
+
+    with patch.object(service, "_recycle_item", side_effect=fake_recycle):
+        result = service.cleanup_directory(str(tmp_path))
+
+    # No bin marker in the run, so the recycled tree must report its
+    # measured size instead of deferring to the bin query
+    assert result.total_folders == 1
+    assert result.total_size_bytes == 5
+
+
+def test_cleanup_all_bin_last_does_not_double_count(tmp_path):
+    service = CleanupService()
+    target = tmp_path / "junk"
+    target.mkdir()
+    (target / "a.txt").write_bytes(b"x" * 100)
+
+    def fake_recycle(path):
+        os.unlink(path)  # simulate the move into the bin
+        return True
+
+    fake_bin = MagicMock()
+    with (
+        patch.object(service, "_recycle_item", side_effect=fake_recycle),
+        patch.object(service, "_query_recycle_bin_info", return_value=(100, 1)),
+        patch("features.cleanup.service.winshell.recycle_bin", return_value=fake_bin),
+    ):
+        result = service.cleanup_all([str(target), RECYCLE_BIN_MARKER])
+
+    # The recycled file is counted once, by the bin query at empty time
+    assert result.total_size_bytes == 100
+    assert result.total_files == 1
+    assert result.errors == []
+
+
 def test_cleanup_all_outer_exception_path():
     service = CleanupService()
     with (
@@ -119,11 +260,17 @@ def test_get_dir_size_walk_and_stat_error_paths(tmp_path):
     service = CleanupService()
     target = Path(tmp_path)
 
-    with patch.object(Path, "rglob", side_effect=PermissionError("walk denied")):
+    with patch(
+        "features.cleanup.service.os.scandir",
+        side_effect=PermissionError("walk denied"),
+    ):
         assert service._get_dir_size(target) == 0
 
     good_file = MagicMock()
+    good_file.is_dir.return_value = False
     good_file.is_file.return_value = True
     good_file.stat.side_effect = OSError("stat denied")
-    with patch.object(Path, "rglob", return_value=[good_file]):
+    scandir_cm = MagicMock()
+    scandir_cm.__enter__.return_value = iter([good_file])
+    with patch("features.cleanup.service.os.scandir", return_value=scandir_cm):
         assert service._get_dir_size(target) == 0
@@ -141,3 +141,45 @@ def test_save_logs_error_when_write_fails(fresh_config):
         fresh_config.save()
 
     assert log_mock.error.called
+
+
+def test_add_directories_batches_into_single_save(fresh_config):
+    with patch.object(fresh_config, "save") as save_mock:
+        added = fresh_config.add_directories(
+            ["C:/One", "C:/Two", "C:/One"], mark_first_run_complete=True
+        )
+
+    assert added == ["C:/One", "C:/Two"]
+    assert fresh_config._config["cleanup_directories"] == ["C:/One", "C:/Two"]
+    assert fresh_config._config["first_run_complete"] is True
+    save_mock.assert_called_once()
+
+
+def test_add_directories_skips_protected_paths(fresh_config, monkeypatch):
+    monkeypatch.setattr(
+        config_module, "is_protected_path", lambda p: p == "C:/Windows"
+    )
+
+    with patch.object(fresh_config, "save") as save_mock:
+        added = fresh_config.add_directories(["C:/Windows", "C:/Safe"])
+
+    assert added == ["C:/Safe"]
+    assert "C:/Windows" not in fresh_config.cleanup_directories
+    save_mock.assert_called_once()
+
+
+def test_add_directories_skips_save_when_nothing_changes(fresh_config):
+    fresh_config._config["cleanup_directories"] = ["C:/One"]
+
+    with patch.object(fresh_config, "save") as save_mock:
+        added = fresh_config.add_directories(["C:/One"])
+
+    assert added == []
+    save_mock.assert_not_called()
+
+
+def test_show_on_startup_defaults_to_true(fresh_config):
+    assert fresh_config.show_on_startup is True
+
+    fresh_config._config["show_on_startup"] = False
+    assert fresh_config.show_on_startup is False
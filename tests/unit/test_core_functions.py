@@ -10,6 +10,8 @@ import json
 from pathlib import Path
 from unittest.mock import Mock, MagicMock
 
+import pytest
+
 
 sys.path.insert(
     0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../../src"))
@@ -140,6 +142,15 @@ class TestDriveInfo:
 class TestGetAllDrives:
     """Unit tests for get_all_drives function."""
 
+    @pytest.fixture(autouse=True)
+    def _reset_drive_cache(self):
+        """Drive topology is cached per process; reset around each test."""
+        from features.storage_monitor.utils import invalidate_drive_cache
+
+        invalidate_drive_cache()
+        yield
+        invalidate_drive_cache()
+
     def test_get_all_drives_returns_list(self, monkeypatch):
         from features.storage_monitor import utils
 
@@ -408,6 +419,17 @@ class TestRegistry:
 class TestDirectoryDetector:
     """Unit tests for directory_detector functions."""
 
+    @pytest.fixture(autouse=True)
+    def _reset_detector_cache(self):
+        """Detection is cached per process; reset around each test."""
+        from features.cleanup import directory_detector
+
+        directory_detector.get_downloads_folder.cache_clear()
+        directory_detector._detect_default_directories.cache_clear()
+        yield
+        directory_detector.get_downloads_folder.cache_clear()
+        directory_detector._detect_default_directories.cache_clear()
+
     def test_get_downloads_folder_exists(self, monkeypatch):
         from features.cleanup import get_downloads_folder
 
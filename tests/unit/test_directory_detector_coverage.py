@@ -2,15 +2,46 @@
 
 from unittest.mock import patch
 
+import pytest
+
 
 class TestDirectoryDetectorCoverage:
     """Tests for DirectoryDetector exception paths."""
 
+    @pytest.fixture(autouse=True)
+    def _reset_detector_cache(self):
+        """Detection is cached per process; reset around each patched test."""
+        from features.cleanup import directory_detector
+
+        directory_detector.get_downloads_folder.cache_clear()
+        directory_detector._detect_default_directories.cache_clear()
+        yield
+        directory_detector.get_downloads_folder.cache_clear()
+        directory_detector._detect_default_directories.cache_clear()
+
+    def test_get_downloads_folder_prefers_known_folder(self, tmp_path):
+        """Test get_downloads_folder uses the Shell known-folder path."""
+        from features.cleanup.directory_detector import get_downloads_folder
+
+        relocated = tmp_path / "Relocated Downloads"
+        with patch(
+            "features.cleanup.directory_detector._downloads_from_known_folder",
+            return_value=str(relocated),
+        ):
+            result = get_downloads_folder()
+            assert result == str(relocated)
+
     def test_get_downloads_folder_exists(self, tmp_path):
-        """Test get_downloads_folder when folder exists."""
+        """Test get_downloads_folder fallback when folder exists."""
         from features.cleanup.directory_detector import get_downloads_folder
 
-        with patch("features.cleanup.directory_detector.Path.home") as mock_home:
+        with (
+            patch(
+                "features.cleanup.directory_detector._downloads_from_known_folder",
+                side_effect=OSError("No shell32"),
+            ),
+            patch("features.cleanup.directory_detector.Path.home") as mock_home,
+        ):
             mock_home.return_value = tmp_path
             downloads = tmp_path / "Downloads"
             downloads.mkdir()
@@ -22,7 +53,13 @@ class TestDirectoryDetectorCoverage:
         """Test get_downloads_folder when folder doesn't exist."""
         from features.cleanup.directory_detector import get_downloads_folder
 
-        with patch("features.cleanup.directory_detector.Path.home") as mock_home:
+        with (
+            patch(
+                "features.cleanup.directory_detector._downloads_from_known_folder",
+                side_effect=OSError("No shell32"),
+            ),
+            patch("features.cleanup.directory_detector.Path.home") as mock_home,
+        ):
             mock_home.return_value = tmp_path
             # Don't create Downloads folder
 
@@ -33,9 +70,15 @@ class TestDirectoryDetectorCoverage:
         """Test get_downloads_folder exception handling."""
         from features.cleanup.directory_detector import get_downloads_folder
 
-        with patch(
-            "features.cleanup.directory_detector.Path.home",
-            side_effect=Exception("Home error"),
+        with (
+            patch(
+                "features.cleanup.directory_detector._downloads_from_known_folder",
+                side_effect=OSError("No shell32"),
+            ),
+            patch(
+                "features.cleanup.directory_detector.Path.home",
+                side_effect=Exception("Home error"),
+            ),
         ):
             result = get_downloads_folder()
             assert result == ""
@@ -105,3 +105,33 @@ class TestStorageMonitorCoverage:
         ):
             monitor._check_drives()
             mock_log.error.assert_called()
+
+    def test_poll_async_skips_while_in_flight(self, monitor):
+        """Cover overlapping-tick guard in _poll_drives_async."""
+        monitor._poll_in_flight = True
+
+        with patch("features.storage_monitor.service.threading.Thread") as thread_cls:
+            monitor._poll_drives_async()
+            thread_cls.assert_not_called()
+
+    def test_poll_async_runs_worker_thread(self, monitor):
+        """Cover worker-thread dispatch from a timer tick."""
+        with patch("features.storage_monitor.service.threading.Thread") as thread_cls:
+            monitor._poll_drives_async()
+
+        assert monitor._poll_in_flight is True
+        thread_cls.assert_called_once_with(target=monitor._poll_worker, daemon=True)
+        thread_cls.return_value.start.assert_called_once()
+
+    def test_on_drives_polled_evaluates_and_resets_flag(self, monitor):
+        """Cover main-thread evaluation of a polled drive list."""
+        monitor._poll_in_flight = True
+        monitor._notified_drives = {"C:": 0.0}
+        normal_drive = DriveInfo(
+            letter="C:", total_gb=100.0, free_gb=20.0, used_gb=80.0, percent_used=80.0
+        )
+
+        monitor._on_drives_polled([normal_drive])
+
+        assert monitor._poll_in_flight is False
+        assert "C:" not in monitor._notified_drives
@@ -3,7 +3,11 @@ from __future__ import annotations
 
 from types import SimpleNamespace
 
-from features.storage_monitor.polling import check_drives, periodic_maintenance
+from features.storage_monitor.polling import (
+    check_drives,
+    compute_adaptive_scale,
+    periodic_maintenance,
+)
 from features.storage_monitor.utils import DriveInfo
 
 
@@ -12,6 +16,7 @@ def test_check_drives_emits_and_clears():
     cleared = []
     monitor = SimpleNamespace(
         _threshold_gb=10,
+        _adaptive=False,
         _notified_drives={"C:": 0.0},
         _poll_cycle_count=0,
         _GC_INTERVAL=100,
@@ -44,6 +49,7 @@ def test_check_drives_runs_periodic_maintenance():
     called = {"count": 0}
     monitor = SimpleNamespace(
         _threshold_gb=10,
+        _adaptive=False,
         _notified_drives={},
         _poll_cycle_count=99,
         _GC_INTERVAL=100,
@@ -98,3 +104,42 @@ def test_periodic_maintenance_starts_thread(monkeypatch):
     monkeypatch.setattr("features.storage_monitor.polling.threading.Thread", _Thread)
     periodic_maintenance(_Logger(), _Psutil)
     assert started["count"] == 1
+
+
+def _adaptive_monitor(scale=1, previous=None):
+    return SimpleNamespace(
+        _threshold_gb=10,
+        _interval_ms=60 * 1000,
+        _interval_scale=scale,
+        _previous_free=previous if previous is not None else {},
+    )
+
+
+def test_adaptive_scale_backs_off_when_free_space_is_static():
+    monitor = _adaptive_monitor(previous={"C:": (50.0, 0.0)})
+    drives = [DriveInfo("C:", 100.0, 50.0, 50.0, 50.0)]
+
+    assert compute_adaptive_scale(monitor, drives, now=60.0) == 2
+    assert monitor._previous_free["C:"] == (50.0, 60.0)
+
+
+def test_adaptive_scale_caps_at_max():
+    monitor = _adaptive_monitor(scale=8, previous={"C:": (50.0, 0.0)})
+    drives = [DriveInfo("C:", 100.0, 50.0, 50.0, 50.0)]
+
+    assert compute_adaptive_scale(monitor, drives, now=60.0) == 10
+
+
+def test_adaptive_scale_tightens_when_crossing_is_near():
+    # 11 GB free, threshold 10, burning 0.1 GB/s -> ETA 10s < 2 intervals
+    monitor = _adaptive_monitor(scale=4, previous={"C:": (17.0, 0.0)})
+    drives = [DriveInfo("C:", 100.0, 11.0, 89.0, 89.0)]
+
+    assert compute_adaptive_scale(monitor, drives, now=60.0) == 2
+
+
+def test_adaptive_scale_resets_once_threshold_is_crossed():
+    monitor = _adaptive_monitor(scale=8, previous={"C:": (12.0, 0.0)})
+    drives = [DriveInfo("C:", 100.0, 9.0, 91.0, 91.0)]
+
+    assert compute_adaptive_scale(monitor, drives, now=60.0) == 1
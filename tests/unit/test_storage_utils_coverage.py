@@ -2,10 +2,21 @@
 
 from unittest.mock import patch, MagicMock
 
+import pytest
+
 
 class TestStorageUtilsCoverage:
     """Tests for storage_monitor/utils.py exception paths."""
 
+    @pytest.fixture(autouse=True)
+    def _reset_drive_cache(self):
+        """Drive topology is cached per process; reset around each test."""
+        from features.storage_monitor.utils import invalidate_drive_cache
+
+        invalidate_drive_cache()
+        yield
+        invalidate_drive_cache()
+
     def test_get_all_drives_success(self):
         """Test get_all_drives normal operation."""
         from features.storage_monitor.utils import get_all_drives
@@ -92,6 +103,59 @@ class TestStorageUtilsCoverage:
             drives = get_all_drives()
             assert len(drives) >= 0  # Just ensure no exception
 
+    def test_enumerate_fixed_drives_win32_filters_drive_type(self):
+        """Test win32 enumeration keeps only DRIVE_FIXED roots."""
+        import ctypes
+
+        from features.storage_monitor import utils
+
+        listing = "C:\\\0D:\\\0E:\\\0"
+
+        def fake_drive_strings(_buflen, buf):
+            ctypes.memmove(buf, ctypes.create_unicode_buffer(listing), ctypes.sizeof(buf))
+            return len(listing)
+
+        fake_kernel32 = MagicMock()
+        fake_kernel32.GetLogicalDriveStringsW.side_effect = fake_drive_strings
+        fake_kernel32.GetDriveTypeW.side_effect = (
+            lambda root: 3 if root in ("C:\\", "E:\\") else 2
+        )
+
+        with patch.object(utils, "_kernel32", fake_kernel32):
+            pairs = utils._enumerate_fixed_drives_win32()
+
+        assert pairs == [("C:", "C:\\"), ("E:", "E:\\")]
+
+    def test_query_drive_win32_computes_usage(self):
+        """Test win32 usage query converts bytes to GB and percent."""
+        from features.storage_monitor import utils
+
+        def fake_free_space(_root, _caller, total_ref, free_ref):
+            total_ref._obj.value = 500 * 1024**3
+            free_ref._obj.value = 100 * 1024**3
+            return 1
+
+        fake_kernel32 = MagicMock()
+        fake_kernel32.GetDiskFreeSpaceExW.side_effect = fake_free_space
+
+        with patch.object(utils, "_kernel32", fake_kernel32):
+            drive = utils._query_drive_win32("C:", "C:\\")
+
+        assert drive.letter == "C:"
+        assert drive.total_gb == 500.0
+        assert drive.free_gb == 100.0
+        assert drive.percent_used == 80.0
+
+    def test_query_drive_win32_failure_returns_none(self):
+        """Test win32 usage query skips inaccessible drives."""
+        from features.storage_monitor import utils
+
+        fake_kernel32 = MagicMock()
+        fake_kernel32.GetDiskFreeSpaceExW.return_value = 0
+
+        with patch.object(utils, "_kernel32", fake_kernel32):
+            assert utils._query_drive_win32("D:", "D:\\") is None
+
     def test_drive_info_is_low_space(self):
         """Test DriveInfo.is_low_space property."""
         from features.storage_monitor.utils import DriveInfo